@@ -0,0 +1,164 @@
+# benchmarks/bench_enrich.py
+"""Row-wise vs vectorized tournament enrichment on a full-series sized schedule.
+
+    python benchmarks/bench_enrich.py [--copies 8]
+
+Tiles the sample schedule in data/ into several thousand flights (shifting
+dates and event numbers per copy), runs the old per-row pipeline from
+tournament/manage.py and tournament.enrich.enrich_tournaments(), checks the
+results match and prints both timings. The one intended difference is
+game_type: No-Limit Hold'em events the old "limit" tag classed as Mixed are
+Hold'em now (with the handedness and dealer_projection that follow).
+"""
+import argparse
+import math
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tournament.enrich import NO_LIMIT_PATTERN, enrich_tournaments  # noqa: E402
+
+SAMPLE = os.path.join(ROOT, "data", "Daily Schedule 2026 Test -2.xlsx")
+DERIVED = ["time", "projection", "game_type", "handedness", "dealer_projection", "event_base", "is_restart"]
+# Columns the game_type fix can't touch
+UNCLASSIFIED = ["time", "projection", "event_base", "is_restart"]
+
+
+def legacy_enrich(raw):
+    # The pipeline as it was written inline in show_tournament_manage()
+    df = raw.copy()
+    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"], unit="D", origin="1899-12-30")
+
+    def safe_parse_time(val):
+        try:
+            return pd.to_datetime(str(val), errors="coerce").time()
+        except Exception:
+            return None
+
+    df["time"] = df["time"].apply(safe_parse_time)
+    df["projection"] = pd.to_numeric(df["projection"], errors="coerce")
+
+    def classify_game(name):
+        name = str(name).lower()
+        mixed_tags = [
+            "mixed", "razz", "stud", "plo", "omaha", "horse", "big o", "draw",
+            "badugi", "limit", "triple", "dealer's choice", "eight game", "seven card"
+        ]
+        if any(tag in name for tag in mixed_tags):
+            return "Mixed"
+        return "Hold'em"
+
+    df["game_type"] = df["event_name"].apply(classify_game)
+
+    def detect_handedness(row):
+        name = str(row["event_name"]).lower()
+        if "6-handed" in name or "6 max" in name:
+            return 6
+        if "8-handed" in name or "8 max" in name:
+            return 8
+        if row["game_type"] == "Mixed":
+            if "triple draw" in name:
+                return 6
+            return 8
+        return 9
+
+    df["handedness"] = df.apply(detect_handedness, axis=1)
+
+    def forecast_dealers(projection, handedness):
+        if pd.isnull(projection) or pd.isnull(handedness):
+            return None
+        est = projection / handedness * 1.175
+        return int(math.ceil(est / 10) * 10)
+
+    df["dealer_projection"] = df.apply(
+        lambda row: forecast_dealers(row["projection"], row["handedness"]),
+        axis=1
+    )
+
+    df["event_number_str"] = df["event_number"].astype(str).str.strip()
+
+    def base_event(ev):
+        match = re.match(r"(\d+)", str(ev).strip())
+        return match.group(1) if match else str(ev).strip()
+
+    df["event_base"] = df["event_number_str"].apply(base_event)
+    base_counts = df["event_base"].value_counts()
+    df["is_restart"] = df["event_base"].apply(lambda x: base_counts.get(x, 0) > 1)
+    return df
+
+
+def tiled_schedule(copies):
+    sample = pd.read_excel(SAMPLE)
+    span = (sample["Date"].max() - sample["Date"].min()).days + 1
+    frames = []
+    for i in range(copies):
+        frame = sample.copy()
+        frame["Date"] = frame["Date"] + pd.Timedelta(days=span * i)
+        # Keep restart groups within a copy: "58-D2" -> "1058-D2"
+        frame["Event Number"] = frame["Event Number"].astype(str).str.replace(
+            r"^(\d+)", lambda m: str(int(m.group(1)) + 1000 * i), regex=True
+        )
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def assert_identical(old, new, columns=DERIVED):
+    for col in columns:
+        a = old[col].astype(object).where(old[col].notna(), None).tolist()
+        b = new[col].astype(object).where(new[col].notna(), None).tolist()
+        if a != b:
+            bad = next(i for i, (x, y) in enumerate(zip(a, b)) if x != y)
+            raise AssertionError(f"{col} differs at row {bad}: {a[bad]!r} != {b[bad]!r}")
+
+
+def no_limit_reclassified(old, new):
+    """Boolean mask of rows whose game_type went Mixed -> Hold'em; raises on any other change."""
+    moved = old["game_type"].to_numpy() != new["game_type"].to_numpy()
+    no_limit = old["event_name"].astype(str).str.contains(NO_LIMIT_PATTERN, case=False, regex=True).to_numpy()
+    expected = (old["game_type"].to_numpy() == "Mixed") & (new["game_type"].to_numpy() == "Hold'em") & no_limit
+    if (moved & ~expected).any():
+        bad = int((moved & ~expected).argmax())
+        raise AssertionError(
+            f"game_type differs at row {bad}: {old['game_type'].iloc[bad]!r} != {new['game_type'].iloc[bad]!r}"
+        )
+    return moved
+
+
+def timed(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=8, help="how many times to tile the sample schedule")
+    args = parser.parse_args()
+
+    raw = tiled_schedule(args.copies)
+    legacy_s, old = timed(legacy_enrich, raw, repeat=1)
+    vector_s, new = timed(enrich_tournaments, raw)
+    moved = no_limit_reclassified(old, new)
+    assert_identical(old[~moved], new[~moved])
+    assert_identical(old[moved], new[moved], UNCLASSIFIED)
+
+    print(f"rows: {len(raw)}  (No-Limit events reclassified Mixed -> Hold'em: {moved.sum()})")
+    print(f"row-wise:   {legacy_s * 1000:9.1f} ms")
+    print(f"vectorized: {vector_s * 1000:9.1f} ms")
+    print(f"speedup:    {legacy_s / vector_s:9.1f}x  (outputs otherwise identical)")
+
+
+if __name__ == "__main__":
+    main()
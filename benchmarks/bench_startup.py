@@ -0,0 +1,75 @@
+# benchmarks/bench_startup.py
+"""Cold-start imports for the login screen: eager page imports vs the page registry.
+
+    python benchmarks/bench_startup.py [--repeat 5]
+
+Each measurement is a fresh interpreter importing what main.py needs before
+the login page can render. "eager" is the import block main.py had before
+page_registry (every page module up front); "lazy" is what it imports now.
+Prints the best wall time of --repeat runs and how many modules got loaded.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# main.py's imports before the registry
+EAGER = [
+    ("auth", "authenticate_user"),
+    ("importer", "show_import_page"),
+    ("dealer.manage", "show_dealer_management"),
+    ("dealer.add", "show_add_dealer"),
+    ("dealer.remove", "show_remove_dealer"),
+    ("dealer.uniform", "show_uniform_return"),
+    ("scheduler.shifts", "show_shift_swap"),
+    ("scheduler.carpool", "show_carpool_management"),
+    ("scheduler.temp_adjustments", "show_temp_adjustments"),
+    ("tournament.manage", "show_tournament_manage"),
+    ("tournament.forecast", "show_forecasting"),
+    ("scheduler.metrics", "show_scheduling_metrics"),
+    ("scheduler.staffing", "show_staffing_gaps"),
+]
+# main.py's imports now, plus the login page the registry loads on the first rerun
+LAZY = [
+    ("diagnostics", "rerun"),
+    ("page_registry", "load"),
+    ("auth", "authenticate_user"),
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+{imports}
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": len(sys.modules),
+                  "pandas": "pandas" in sys.modules}}))
+"""
+
+
+def cold_start(imports, repeat):
+    code = PROBE.format(imports="\n".join(f"from {module} import {name}" for module, name in imports))
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        runs.append(json.loads(out.stdout))
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per variant; the best is kept")
+    args = parser.parse_args()
+
+    eager = cold_start(EAGER, args.repeat)
+    lazy = cold_start(LAZY, args.repeat)
+    for label, run in (("eager", eager), ("lazy", lazy)):
+        print(f"{label}: {run['seconds'] * 1000:8.1f} ms  {run['modules']:5d} modules  "
+              f"pandas {'loaded' if run['pandas'] else 'not loaded'}")
+    print(f"speedup: {eager['seconds'] / lazy['seconds']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
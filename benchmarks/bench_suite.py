@@ -0,0 +1,210 @@
+# benchmarks/bench_suite.py
+"""Hot-path timings on synthetic data, written as JSON for release-to-release comparison.
+
+    python benchmarks/bench_suite.py [--dealers 1000,10000,100000] [--days 50] [--events 15]
+                                     [--out results.json] [--baseline old.json] [--tolerance 0.25]
+
+Generates dealer lists and a tournament series with benchmarks/synthetic.py
+and times, outside Streamlit:
+
+    dealer paths (once per --dealers size)
+        parse_dealer_workbook   read_excel + normalize_dealers on a written .xlsx
+        parse_cache_sidecar     ParseCache hit served from the on-disk sidecar
+        search_index_build      DealerSearchIndex over the list
+        dealer_search           --queries mixed id/name lookups through the index
+        uniform_report          RosterTimeline + missing_uniform_returns
+        roster_forecast         forecast vs active headcount for the series
+
+    schedule paths (once)
+        parse_schedule_workbook, enrich_tournaments, restart_taper,
+        rollup_build, daily_forecast, weekly_forecast
+
+Each timing is the best of --repeat runs. Results go to --out (default
+benchmarks/results/<UTC timestamp>.json) with the Python/pandas/NumPy versions
+and git commit. With --baseline, any case slower than the baseline by more
+than --tolerance (and --floor-ms) is listed and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_enrich import timed  # noqa: E402
+from benchmarks.synthetic import dealer_list, schedule, with_history  # noqa: E402
+from dealer.roster import RosterTimeline, missing_uniform_returns  # noqa: E402
+from dealer.schema import normalize_dealers  # noqa: E402
+from dealer.search import DealerSearchIndex  # noqa: E402
+from parse_cache import ParseCache  # noqa: E402
+from tournament.enrich import enrich_tournaments  # noqa: E402
+from tournament.reports import daily_forecast, restart_adjusted, roster_forecast, weekly_forecast  # noqa: E402
+from tournament.rollup import DealerRollup  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def search_terms(dealers, count, seed=0):
+    """(field, term) pairs: exact ee_numbers and nametags, name prefixes of 1-4 letters."""
+    rng = np.random.default_rng(seed)
+    rows = dealers.iloc[rng.integers(0, len(dealers), count)]
+    fields = rng.choice(["ee_number", "nametag_id", "first_name", "last_name"], count)
+    lengths = rng.integers(1, 5, count)
+    terms = []
+    for (_, row), field, length in zip(rows.iterrows(), fields, lengths):
+        value = str(row[field])
+        terms.append((field, value if field in ("ee_number", "nametag_id") else value[:length]))
+    return terms
+
+
+def run_searches(index, terms):
+    return sum(len(index.search(field, term)) for field, term in terms)
+
+
+def write_workbook(frame, folder, name):
+    path = os.path.join(folder, name)
+    frame.to_excel(path, index=False)
+    return path
+
+
+def dealer_cases(n, rollup, args, folder):
+    raw = dealer_list(n, seed=args.seed)
+    cases = {}
+
+    if n <= args.max_workbook_rows:
+        path = write_workbook(raw, folder, f"dealers-{n}.xlsx")
+        cases["parse_dealer_workbook"] = timed(
+            lambda: normalize_dealers(pd.read_excel(path)), repeat=args.repeat
+        )[0]
+        cache = ParseCache(cache_dir=os.path.join(folder, f"cache-{n}"))
+        with open(path, "rb") as f:
+            key = cache.key(f.read(), "dealer")
+        cache.put(key, pd.read_excel(path))
+
+        def sidecar_hit():
+            cache._frames.clear()  # force the disk path a fresh process takes
+            return cache.get(key)
+        cases["parse_cache_sidecar"] = timed(sidecar_hit, repeat=args.repeat)[0]
+
+    dealers = normalize_dealers(raw)
+    cases["search_index_build"], index = timed(DealerSearchIndex, dealers, repeat=args.repeat)
+    terms = search_terms(dealers, args.queries, seed=args.seed)
+    cases["dealer_search"] = timed(run_searches, index, terms, repeat=args.repeat)[0]
+
+    history = with_history(dealers, seed=args.seed, start=args.start)
+    as_of = pd.Timestamp(args.start) + pd.Timedelta(days=args.days // 2)
+    cases["uniform_report"] = timed(
+        lambda: missing_uniform_returns(RosterTimeline(history), as_of), repeat=args.repeat
+    )[0]
+    cases["roster_forecast"] = timed(
+        lambda: roster_forecast(rollup, RosterTimeline(history)), repeat=args.repeat
+    )[0]
+    return cases
+
+
+def schedule_cases(args, folder):
+    raw = schedule(days=args.days, events_per_day=args.events, start=args.start, seed=args.seed)
+    path = write_workbook(raw, folder, "schedule.xlsx")
+    cases = {}
+    cases["parse_schedule_workbook"] = timed(pd.read_excel, path, repeat=args.repeat)[0]
+    cases["enrich_tournaments"], df = timed(enrich_tournaments, raw, repeat=args.repeat)
+    cases["restart_taper"] = timed(restart_adjusted, df, repeat=args.repeat)[0]
+    cases["rollup_build"], rollup = timed(DealerRollup, df, repeat=args.repeat)
+    cases["daily_forecast"], daily = timed(daily_forecast, rollup, repeat=args.repeat)
+    cases["weekly_forecast"] = timed(weekly_forecast, daily, repeat=args.repeat)[0]
+    return len(raw), rollup, cases
+
+
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance, floor_ms):
+    """(case, size, old_ms, new_ms) for every case slower than the baseline beyond tolerance."""
+    before = {(r["case"], r["size"]): r["ms"] for r in baseline["results"]}
+    slower = []
+    for r in results:
+        old = before.get((r["case"], r["size"]))
+        if old is None:
+            continue
+        if r["ms"] > old * (1 + tolerance) and r["ms"] - old > floor_ms:
+            slower.append((r["case"], r["size"], old, r["ms"]))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dealers", default="1000,10000", help="comma-separated dealer list sizes")
+    parser.add_argument("--days", type=int, default=50, help="series length in days")
+    parser.add_argument("--events", type=int, default=15, help="new events per day")
+    parser.add_argument("--start", default="2026-05-26", help="first day of the series")
+    parser.add_argument("--queries", type=int, default=2000, help="searches per dealer_search run")
+    parser.add_argument("--max-workbook-rows", type=int, default=20000,
+                        help="skip the .xlsx cases above this many dealers (openpyxl is slow to write)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--floor-ms", type=float, default=5.0, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.dealers.split(",") if s.strip()]
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        events, rollup, cases = schedule_cases(args, folder)
+        for case, seconds in cases.items():
+            results.append({"case": case, "size": events, "ms": round(seconds * 1000, 3)})
+        for n in sizes:
+            for case, seconds in dealer_cases(n, rollup, args, folder).items():
+                results.append({"case": case, "size": n, "ms": round(seconds * 1000, 3)})
+
+    for r in results:
+        print(f"{r['case']:<24} {r['size']:>8}  {r['ms']:10.1f} ms")
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.out or os.path.join(RESULTS_DIR, f"{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    payload = {
+        "meta": {
+            "timestamp": stamp,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    with open(out, "w") as f:
+        json.dump(payload, f, indent=2)
+    print(f"results -> {out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            slower = compare(results, json.load(f), args.tolerance, args.floor_ms)
+        for case, size, old, new in slower:
+            print(f"REGRESSION {case} ({size}): {old:.1f} ms -> {new:.1f} ms")
+        if slower:
+            return 1
+        print(f"no regressions beyond {args.tolerance:.0%} vs {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
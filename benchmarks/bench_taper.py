@@ -0,0 +1,79 @@
+# benchmarks/bench_taper.py
+"""Per-group vs vectorized restart taper, with a regression check.
+
+    python benchmarks/bench_taper.py [--copies 8]
+
+Enriches a tiled copy of the sample schedule (see bench_enrich.py), runs the
+groupby/apply taper that show_scheduling_metrics() used and
+scheduler.taper.apply_restart_taper() with the default curve, checks the
+adjusted dealer numbers and per-day totals match row for row and prints both
+timings.
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_enrich import tiled_schedule, timed  # noqa: E402
+from scheduler.taper import apply_restart_taper, restart_key  # noqa: E402
+from tournament.enrich import enrich_tournaments  # noqa: E402
+
+
+def legacy_taper(df):
+    # The restart view as it was written inline in show_scheduling_metrics()
+    restart_df = df[df["is_restart"] == True].copy()
+    # The original used the default (unstable) sort, so which same-day flight got the
+    # full factor was arbitrary; pin ties to upload order, as apply_restart_taper does
+    restart_df = restart_df.sort_values("date", kind="stable")
+    taper_factors = [1.0, 0.5, 0.3, 0.1]
+
+    def apply_taper(group):
+        group = group.copy()
+        for i in range(len(group)):
+            factor = taper_factors[min(i, len(taper_factors) - 1)]
+            group.iloc[i, group.columns.get_loc("dealer_projection")] *= factor
+        return group
+
+    restart_df["event_base"] = restart_df["event_number"].str.extract(r"(\d+)")
+    grouped = restart_df.groupby("event_base", group_keys=False).apply(apply_taper)
+    grouped["adjusted_dealer_projection"] = grouped["dealer_projection"].fillna(0).round().astype(int)
+    return grouped
+
+
+def assert_same_taper(old, new):
+    old = old.sort_index()
+    new = new.sort_index()
+    if not old.index.equals(new.index):
+        raise AssertionError(f"row sets differ: {len(old)} legacy rows vs {len(new)} vectorized rows")
+    pd.testing.assert_series_equal(old["dealer_projection"], new["dealer_projection"], check_names=False)
+    pd.testing.assert_series_equal(
+        old["adjusted_dealer_projection"], new["adjusted_dealer_projection"], check_names=False
+    )
+    daily_old = old.groupby("date")["adjusted_dealer_projection"].sum()
+    daily_new = new.groupby("date")["adjusted_dealer_projection"].sum()
+    pd.testing.assert_series_equal(daily_old, daily_new)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=8, help="how many times to tile the sample schedule")
+    args = parser.parse_args()
+
+    df = enrich_tournaments(tiled_schedule(args.copies))
+    legacy_s, old = timed(legacy_taper, df, repeat=1)
+    vector_s, new = timed(apply_restart_taper, df[df["is_restart"] == True])
+    assert_same_taper(old, new)
+
+    events = restart_key(new["event_number"]).nunique()
+    print(f"restart rows: {len(new)} in {events} events")
+    print(f"per-group:  {legacy_s * 1000:9.1f} ms")
+    print(f"vectorized: {vector_s * 1000:9.1f} ms")
+    print(f"speedup:    {legacy_s / vector_s:9.1f}x  (outputs identical)")
+
+
+if __name__ == "__main__":
+    main()
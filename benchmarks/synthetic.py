@@ -0,0 +1,138 @@
+# benchmarks/synthetic.py
+"""Synthetic dealer lists and tournament schedules in the importer's upload layouts.
+
+    from benchmarks.synthetic import dealer_list, schedule
+    dealers = dealer_list(10_000)           # dealer.schema.DEALER_COLUMNS
+    events = schedule(days=50)              # tournament.enrich.TOURNAMENT_COLUMNS
+
+Everything is seeded, so the same arguments give the same frames on every
+machine. Schedules mix single-day events, multi-flight events ("12A", "12B")
+with Day 2+ restarts ("12-D2", buy-in "Restart"), mixed-game names, TBD
+start times and dinner-break text like the real series workbook.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dealer.schema import AVAIL_COLUMNS, DEALER_COLUMNS, DEALER_GROUPS, FT_PT, SHIFT_TYPES  # noqa: E402
+from tournament.enrich import TOURNAMENT_COLUMNS  # noqa: E402
+
+FIRST_NAMES = [
+    "Todd", "Tanya", "Erica", "David", "Jennifer", "Marcus", "Linh", "Carlos", "Priya", "Sam",
+    "Jacqueline", "Omar", "Grace", "Wei", "Rosa", "Andre", "Keiko", "Luis", "Nora", "Tyrone",
+]
+LAST_NAMES = [
+    "Hamilton", "Perez", "Diaz", "Gonzalez", "Wong", "Espinoza", "Rangel", "Washington", "Nguyen",
+    "Patel", "Smith", "Kim", "De La Cruz", "O'Brien", "Johnson", "Garcia", "Lee", "Brown", "Silva", "Cohen",
+]
+
+HOLDEM_EVENTS = [
+    "Daily Deepstack", "No-Limit Hold'em Freezeout", "Mystery Bounty No-Limit Hold'em (8-Handed)",
+    "MILLIONAIRE MAKER No-Limit Hold'em", "LADIES No-Limit Hold'em Championship", "Mega Satellite",
+    "No-Limit Hold'em 6-Handed", "Monster Stack No-Limit Hold'em", "Seniors No-Limit Hold'em",
+]
+MIXED_EVENTS = [
+    "Omaha Hi-Lo 8 or Better Championship (8-Handed)", "H.O.R.S.E.", "Razz", "Seven Card Stud",
+    "Pot-Limit Omaha", "2-7 Triple Draw Lowball", "Dealer's Choice 6-Handed", "Big O", "Badugi",
+]
+START_TIMES = ["10:00:00", "11:00:00", "12:00:00", "13:00:00", "14:00:00", "15:00:00", "16:00:00",
+               "17:00:00", "19:00:00", "20:00:00", "TBD"]
+BUY_INS = [135, 250, 400, 500, 580, 1000, 1500, 2700, 5000, 10000]
+STARTING_CHIPS = [10000, 20000, 25000, 30000, 40000, 50000]
+
+
+def dealer_list(n, seed=0):
+    """n dealers in the dealer upload layout, with unique ee_number and nametag_id."""
+    rng = np.random.default_rng(seed)
+    first = rng.choice(FIRST_NAMES, n)
+    last = rng.choice(LAST_NAMES, n)
+    ee = 6_000_000_000 + rng.choice(10_000_000, n, replace=False)
+    frame = pd.DataFrame({
+        "first_name": first,
+        "last_name": last,
+        "nametag_id": [f"{f}{i}" for f, i in zip(first, range(n))],
+        "ee_number": ee,
+        "email": [f"{f.lower()}.{l.lower().replace(' ', '')}{i}@example.com" for f, l, i in zip(first, last, range(n))],
+        "phone": [f"{a}-{b}-{c}" for a, b, c in zip(rng.integers(200, 999, n), rng.integers(200, 999, n),
+                                                    rng.integers(1000, 9999, n))],
+        "ft_pt": rng.choice(FT_PT, n, p=[0.4, 0.6]),
+        "shift_type": rng.choice(SHIFT_TYPES, n, p=[0.6, 0.4]),
+        "dealer_group": rng.choice(DEALER_GROUPS, n, p=[0.5, 0.2, 0.3]),
+    })
+    for col in AVAIL_COLUMNS:
+        frame[col] = np.where(rng.random(n) < 0.7, "YES", "NO")
+    return frame[DEALER_COLUMNS]
+
+
+def with_history(dealers, seed=0, start="2026-05-20", removed_share=0.1, returned_share=0.4):
+    """Canonical dealers (normalize_dealers output) with some removals and uniform returns filled in."""
+    rng = np.random.default_rng(seed)
+    n = len(dealers)
+    out = dealers.copy()
+    removed = rng.random(n) < removed_share
+    offsets = pd.to_timedelta(rng.integers(-30, 60, n), unit="D")
+    out["removal_effective_date"] = pd.Series(pd.Timestamp(start) + offsets).where(removed).to_numpy()
+    returned = rng.random(n) < returned_share
+    out["uniform_return_date"] = np.where(returned, "2026-05-01", "")
+    out["uniform_return_items"] = np.where(returned, "Shirt", "")
+    out["uniform_return_confirm_id"] = np.where(returned, "05011200", "")
+    return out
+
+
+def schedule(days=50, events_per_day=15, start="2026-05-26", seed=0):
+    """A tournament series in the schedule upload layout.
+
+    About a quarter of the events run over several flights and days; each
+    flight is its own row ("12A", "12B") followed by Day 2+ rows ("12-D2").
+    """
+    rng = np.random.default_rng(seed)
+    first_day = pd.Timestamp(start)
+    rows = []
+    number = 1
+    for day in range(days):
+        date = first_day + pd.Timedelta(days=day)
+        for _ in range(events_per_day):
+            mixed = rng.random() < 0.3
+            name = rng.choice(MIXED_EVENTS if mixed else HOLDEM_EVENTS)
+            buy_in = int(rng.choice(BUY_INS))
+            chips = int(rng.choice(STARTING_CHIPS))
+            break_text = (
+                f"{rng.choice([60, 75])}-min dinner break level {rng.integers(6, 18)} "
+                f"(≈ {rng.integers(6, 9)}:{rng.choice(['00', '30'])} p.m.)"
+            ) if rng.random() < 0.4 else None
+
+            flights = int(rng.choice([1, 2, 3, 4], p=[0.75, 0.1, 0.1, 0.05]))
+            extra_days = int(rng.integers(1, 4)) if flights > 1 or rng.random() < 0.2 else 0
+            label = f"{name} ({extra_days + 1} day event)" if extra_days else name
+
+            for flight in range(flights):
+                suffix = chr(ord("A") + flight) if flights > 1 else ""
+                rows.append({
+                    "Date": date + pd.Timedelta(days=flight),
+                    "Time": rng.choice(START_TIMES),
+                    "Event Number": f"{number}{suffix}",
+                    "Event Name": f"{label} Flight {suffix}" if suffix else label,
+                    "Buy-in Amount": buy_in,
+                    "Starting Chips": chips,
+                    "Projection": float(rng.integers(40, 2000)) if rng.random() < 0.9 else np.nan,
+                    "Longest Break (Dinner Break)": break_text,
+                })
+            for restart in range(2, extra_days + 2):
+                rows.append({
+                    "Date": date + pd.Timedelta(days=flights - 1 + restart - 1),
+                    "Time": rng.choice(START_TIMES[:6]),
+                    "Event Number": f"{number}-D{restart}",
+                    "Event Name": label,
+                    "Buy-in Amount": "Restart",
+                    "Starting Chips": f"Day {restart}",
+                    "Projection": float(rng.integers(20, 600)) if rng.random() < 0.8 else np.nan,
+                    "Longest Break (Dinner Break)": break_text,
+                })
+            number += 1
+    frame = pd.DataFrame(rows, columns=TOURNAMENT_COLUMNS)
+    return frame.sort_values("Date", kind="stable").reset_index(drop=True)
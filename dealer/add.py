@@ -1,14 +1,17 @@
 import streamlit as st
-import pandas as pd
+
+from dealer.schema import DAYS, FT_PT, SHIFT_TYPES, DEALER_GROUPS, availability_mask, dealer_record, normalize_dealers
+from parse_cache import parse_upload
+from dealer.state import dealers_loaded, get_dealer_store
 
 def show_add_dealer():
     st.title("➕ Add New Dealer")
 
-    if "dealer_df" not in st.session_state or st.session_state.dealer_df is None:
+    if not dealers_loaded():
         st.error("Dealer list not loaded. Please upload it on the import page.")
         return
 
-    df = st.session_state.dealer_df
+    store = get_dealer_store()
 
     with st.form("add_dealer_form"):
         st.markdown("**Core Info**")
@@ -24,16 +27,15 @@ def show_add_dealer():
 
         st.markdown("**Attributes**")
         attr1, attr2, attr3 = st.columns(3)
-        ft_pt = attr1.selectbox("FT/PT", ["Full-Time", "Part-Time"])
-        shift_type = attr2.selectbox("Shift Type", ["DAY", "SWING"])
-        dealer_group = attr3.selectbox("Dealer Group", ["ANY", "LIVE", "HOLDEM"])
+        ft_pt = attr1.selectbox("FT/PT", FT_PT)
+        shift_type = attr2.selectbox("Shift Type", SHIFT_TYPES)
+        dealer_group = attr3.selectbox("Dealer Group", DEALER_GROUPS)
 
         st.markdown("**Weekly Availability**")
-        days = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
         day_cols = st.columns(7)
         availability = {}
-        for i, day in enumerate(days):
-            availability[f"AVAIL-{day}"] = day_cols[i].checkbox(day, value=True)
+        for i, day in enumerate(DAYS):
+            availability[day] = day_cols[i].checkbox(day, value=True)
 
         submitted = st.form_submit_button("➕ Add Dealer")
 
@@ -43,27 +45,55 @@ def show_add_dealer():
                 st.warning("First name, last name, and EE number are required.")
                 return
 
+            new_dealer = dealer_record(
+                first_name=first_name.strip(),
+                last_name=last_name.strip(),
+                ee_number=ee_number.strip(),
+                nametag_id=nametag_id.strip(),
+                email=email.strip(),
+                phone=phone.strip(),
+                ft_pt=ft_pt,
+                shift_type=shift_type,
+                dealer_group=dealer_group,
+                avail_mask=availability_mask(availability)
+            )
+
             # Check for duplicates
-            exists_by_ee = ee_number in df["ee_number"].astype(str).values
-            exists_by_tag = nametag_id in df["nametag_id"].astype(str).values
-            if exists_by_ee or exists_by_tag:
-                st.error("Dealer with this EE Number or Nametag ID already exists.")
+            reason = store.check_new_dealers(new_dealer).iloc[0]
+            if reason:
+                st.error(f"Dealer with this EE Number or Nametag ID already exists ({reason}).")
                 return
 
-            new_dealer = {
-                "first_name": first_name,
-                "last_name": last_name,
-                "ee_number": ee_number,
-                "nametag_id": nametag_id,
-                "email": email,
-                "phone": phone,
-                "ft_pt": ft_pt,
-                "shift_type": shift_type,
-                "dealer_group": dealer_group
-            }
-            new_dealer.update({day: "YES" if val else "NO" for day, val in availability.items()})
-
-            # Append and save
-            st.session_state.dealer_df = pd.concat([df, pd.DataFrame([new_dealer])], ignore_index=True)
+            # Append to the store's buffer; it is merged into the table in batches
+            store.append(new_dealer)
             st.success(f"Dealer {first_name} {last_name} added successfully!")
-            st.rerun()
\ No newline at end of file
+            st.rerun()
+
+    # ---- 📥 Bulk Add ----
+    st.markdown("---")
+    with st.expander("📥 Bulk Add from CSV"):
+        st.caption(
+            "Upload new hires using the same columns as the dealer list. "
+            "first_name, last_name and ee_number are required; duplicates are skipped."
+        )
+        bulk_file = st.file_uploader("Upload new hires (.csv or .xlsx)", type=["csv", "xlsx"], key="bulk_add")
+        if bulk_file:
+            raw, missing = parse_upload(bulk_file, "new_hires", ["first_name", "last_name", "ee_number"])
+            if missing:
+                st.error(f"Missing columns: {', '.join(missing)}")
+                return
+
+            records = normalize_dealers(raw)
+            reasons = store.check_new_dealers(records)
+            ready = int((reasons == "").sum())
+            st.caption(f"{ready} of {len(records)} row(s) ready to add.")
+            if ready < len(records):
+                st.dataframe(
+                    records.loc[reasons != "", ["first_name", "last_name", "ee_number", "nametag_id"]]
+                    .assign(reason=reasons[reasons != ""]),
+                    use_container_width=True
+                )
+
+            if ready and st.button(f"➕ Add {ready} Dealer(s)"):
+                store.add_many(records)
+                st.success(f"Added {ready} dealer(s).")
@@ -1,38 +1,45 @@
 import streamlit as st
 import pandas as pd
 
+from dealer.schema import DAYS, FT_PT, SHIFT_TYPES, DEALER_GROUPS, availability_flags, availability_mask
+from dealer.search import MAX_RESULTS
+from dealer.state import dealers_loaded, get_dealer_store
+
+def _option_index(options, value):
+    # Unmapped categoricals (NaN) fall back to the first option
+    return options.index(value) if value in options else 0
+
+
 def show_dealer_management():
     st.title("🧍 Dealer Management")
 
     # Check if data was uploaded
-    if "dealer_df" not in st.session_state or st.session_state.dealer_df is None:
+    if not dealers_loaded():
         st.error("Dealer list not loaded. Please upload it on the import page.")
         return
 
-    df = st.session_state.dealer_df
+    store = get_dealer_store()
 
     # ---- 🔍 Lookup Section ----
     st.subheader("🔍 Lookup Dealer")
     search_by = st.selectbox("Search by:", ["ee_number", "nametag_id", "first_name", "last_name"])
     search_term = st.text_input(f"Enter {search_by}:")
 
-    match_df = pd.DataFrame()
-    if search_term:
-        mask = df[search_by].astype(str).str.contains(search_term, case=False, na=False)
-        match_df = df[mask]
+    index = store.index
+    matches = index.search(search_by, search_term) if search_term else []
 
-    if not match_df.empty:
-        st.success(f"Found {len(match_df)} match{'es' if len(match_df) > 1 else ''}.")
+    if matches:
+        if len(matches) >= MAX_RESULTS:
+            st.success(f"Showing the first {MAX_RESULTS} matches. Keep typing to narrow the list.")
+        else:
+            st.success(f"Found {len(matches)} match{'es' if len(matches) > 1 else ''}.")
 
-        # Build unique labels
-        match_df = match_df.copy()
-        match_df["label"] = match_df.apply(
-            lambda row: f"{row['last_name']}, {row['first_name']} (EE# {row['ee_number']})", axis=1
-        )
-        selection = st.selectbox("Select a dealer to view/edit:", options=match_df["label"])
+        # Labels are precomputed by the index
+        label_to_ee = dict(zip(index.labels(matches), matches))
+        selection = st.selectbox("Select a dealer to view/edit:", options=list(label_to_ee))
 
         # Get full dealer row based on label
-        selected_dealer = match_df[match_df["label"] == selection].iloc[0]
+        selected_dealer = store.row(label_to_ee[selection])
 
         # ---- 📝 Edit Section ----
         st.markdown("#### ✏️ Edit This Dealer")
@@ -59,46 +66,74 @@ def show_dealer_management():
 
             st.markdown("**Attributes**")
             attr1, attr2, attr3 = st.columns(3)
-            updated_schedule = attr1.selectbox("Shift Type", ["DAY", "SWING"],
-                index=0 if str(selected_dealer.get("schedule", "")).strip().upper() == "DAY" else 1,
+            updated_shift = attr1.selectbox("Shift Type", SHIFT_TYPES,
+                index=_option_index(SHIFT_TYPES, selected_dealer["shift_type"]),
                 disabled=not edit_enabled)
-            updated_ftpt = attr2.selectbox("FT/PT", ["Full-Time", "Part-Time"],
-                index=0 if str(selected_dealer.get("ft_pt", "")).strip().lower().startswith("f") else 1,
+            updated_ftpt = attr2.selectbox("FT/PT", FT_PT,
+                index=_option_index(FT_PT, selected_dealer["ft_pt"]),
                 disabled=not edit_enabled)
-            updated_group = attr3.selectbox("Dealer Group", ["ANY", "LIVE", "HOLDEM"],
-                index=["ANY", "LIVE", "HOLDEM"].index(str(selected_dealer.get("dealer_group", "ANY")).strip().upper()),
+            updated_group = attr3.selectbox("Dealer Group", DEALER_GROUPS,
+                index=_option_index(DEALER_GROUPS, selected_dealer["dealer_group"]),
                 disabled=not edit_enabled)
 
             st.markdown("**Weekly Availability**")
-            days = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
             day_cols = st.columns(7)
+            current_avail = availability_flags(selected_dealer["avail_mask"])
             avail_updates = {}
-            for i, day in enumerate(days):
-                field = f"AVAIL-{day}"
-                current = str(selected_dealer.get(field, "YES")).strip().upper()
-                avail_updates[field] = day_cols[i].checkbox(day, value=(current == "YES"), disabled=not edit_enabled)
+            for i, day in enumerate(DAYS):
+                avail_updates[day] = day_cols[i].checkbox(day, value=current_avail[day], disabled=not edit_enabled)
 
             submitted = st.form_submit_button("💾 Save Changes")
 
             if submitted and edit_enabled:
-                row_index = df[df["ee_number"].astype(str) == str(selected_dealer["ee_number"])].index[0]
-                df.at[row_index, "first_name"] = updated_first
-                df.at[row_index, "last_name"] = updated_last
-                df.at[row_index, "ee_number"] = updated_ee
-                df.at[row_index, "nametag_id"] = updated_nametag
-                df.at[row_index, "email"] = updated_email
-                df.at[row_index, "phone"] = updated_phone
-                df.at[row_index, "schedule"] = updated_schedule
-                df.at[row_index, "ft_pt"] = updated_ftpt
-                df.at[row_index, "dealer_group"] = updated_group
-
-                for field, value in avail_updates.items():
-                    df.at[row_index, field] = "YES" if value else "NO"
-
-                st.session_state.dealer_df = df
+                updates = {
+                    "first_name": updated_first,
+                    "last_name": updated_last,
+                    "ee_number": updated_ee,
+                    "nametag_id": updated_nametag,
+                    "email": updated_email,
+                    "phone": updated_phone,
+                    "shift_type": updated_shift,
+                    "ft_pt": updated_ftpt,
+                    "dealer_group": updated_group,
+                    "avail_mask": availability_mask(avail_updates)
+                }
+                try:
+                    store.update(selected_dealer["ee_number"], updates)
+                except ValueError as e:
+                    st.error(str(e))
+                    return
+
                 st.session_state.edit_enabled = False
                 st.success("Dealer info updated successfully!")
                 st.rerun()
 
     elif search_term:
-        st.warning("No matching dealers found.")
\ No newline at end of file
+        st.warning("No matching dealers found.")
+
+    # ---- 📦 Bulk Update Section ----
+    st.markdown("---")
+    with st.expander("📦 Bulk Update from Spreadsheet"):
+        st.caption(
+            "Upload a .csv or .xlsx with an ee_number column plus the fields to change "
+            "(e.g. dealer_group, shift_type or AVAIL-MON). Blank cells are left untouched."
+        )
+        bulk_file = st.file_uploader("Upload corrections", type=["csv", "xlsx"], key="bulk_update")
+        if bulk_file and st.button("Apply Bulk Update"):
+            read = pd.read_csv if bulk_file.name.endswith(".csv") else pd.read_excel
+            changes = read(bulk_file, dtype={"ee_number": str})
+            if "ee_number" not in changes.columns:
+                st.error("The file needs an ee_number column.")
+                return
+
+            changes["ee_number"] = changes["ee_number"].str.strip()
+            changes = changes.set_index("ee_number").dropna(axis=1, how="all")
+            try:
+                not_found = store.update_many(changes, skip_blank=True)
+            except ValueError as e:
+                st.error(str(e))
+                return
+
+            st.success(f"Updated {len(changes) - len(not_found)} dealer(s).")
+            if not_found:
+                st.warning(f"EE numbers not found: {', '.join(not_found)}")
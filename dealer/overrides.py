@@ -0,0 +1,142 @@
+# dealer/overrides.py
+import numpy as np
+import pandas as pd
+
+from dealer.schema import weekday_bits
+from dealer.supply import SUPPLY_SHIFTS
+
+# ---- TEMPORARY ADJUSTMENTS ----
+# Date-ranged exceptions layered over the base roster (avail_mask, shift_type);
+# the dealer table itself is never rewritten. Ranges are whole days, inclusive.
+#   UNAVAILABLE  off for the range whatever avail_mask says (illness, emergency)
+#   AVAILABLE    can work the range even on days avail_mask leaves out
+#   SHIFT        works shift_type (DAY/SWING) for the range instead of their usual one
+OVERRIDE_KINDS = ["UNAVAILABLE", "AVAILABLE", "SHIFT"]
+
+OVERRIDE_SCHEMA = {
+    "override_id": "int64",
+    "ee_number": "str",
+    "start_date": "datetime64[ns]",
+    "end_date": "datetime64[ns]",
+    "kind": "str",
+    "shift_type": "str",
+    "reason": "str",
+}
+
+
+class OverrideIndex:
+    """Temporary adjustments with a start-sorted interval index over days.
+
+    Like scheduler.schedule.EmployeeSchedule: overrides are parallel arrays
+    sorted by start_date, and since none spans more than `max_span` days the
+    ones covering a date start in (date - max_span, date]. overlay() applies
+    them to days x dealers availability/shift arrays in one pass; when several
+    overrides hit the same dealer and day, the newest (highest override_id) wins.
+    """
+
+    def __init__(self, overrides):
+        frame = overrides.astype(OVERRIDE_SCHEMA).sort_values(["start_date", "override_id"], kind="stable")
+        self.frame = frame.reset_index(drop=True)
+        self.override_id = self.frame["override_id"].to_numpy()
+        self.ee_number = self.frame["ee_number"].to_numpy(dtype=object)
+        self.start = self.frame["start_date"].to_numpy(dtype="datetime64[D]")
+        self.end = self.frame["end_date"].to_numpy(dtype="datetime64[D]")
+        self.kind = self.frame["kind"].to_numpy(dtype=object)
+        self.shift_type = self.frame["shift_type"].to_numpy(dtype=object)
+        self.max_span = (self.end - self.start).max() + 1 if len(self.frame) else np.timedelta64(0, "D")
+
+    def __len__(self):
+        return len(self.frame)
+
+    def between(self, start, end):
+        """Row positions of overrides touching any day in start..end (inclusive)."""
+        start = np.datetime64(pd.Timestamp(start).date(), "D")
+        end = np.datetime64(pd.Timestamp(end).date(), "D")
+        lo = np.searchsorted(self.start, start - self.max_span, side="right")
+        hi = np.searchsorted(self.start, end, side="right")
+        return lo + np.flatnonzero(self.end[lo:hi] >= start)
+
+    def active_on(self, date):
+        """Overrides in effect on one date."""
+        return self.frame.iloc[self.between(date, date)]
+
+    def overlay(self, available, shift, ee_numbers, dates, shift_codes):
+        """Apply overrides in place to days x dealers arrays.
+
+        available (bool) and shift (int codes into shift_codes) are indexed by
+        (position in dates, position in ee_numbers). Returns a same-shape bool
+        array marking the cells an override touched.
+        """
+        touched = np.zeros(available.shape, dtype=bool)
+        if not len(self) or not len(dates):
+            return touched
+        dates = pd.DatetimeIndex(dates)
+        rows = self.between(dates[0], dates[-1])
+        column = pd.Index(ee_numbers).get_indexer(self.ee_number[rows])
+        rows, column = rows[column >= 0], column[column >= 0]
+        if not len(rows):
+            return touched
+
+        # Every (day, dealer) cell each override covers inside the date range
+        first_day = dates[0].to_datetime64().astype("datetime64[D]")
+        lo = np.maximum((self.start[rows] - first_day).astype(int), 0)
+        hi = np.minimum((self.end[rows] - first_day).astype(int), len(dates) - 1)
+        lengths = np.maximum(hi - lo + 1, 0)
+        rep = np.repeat(np.arange(len(rows)), lengths)
+        day = lo[rep] + np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        col = column[rep]
+        order = np.argsort(self.override_id[rows][rep], kind="stable")
+        day, col, rep = day[order], col[order], rep[order]
+
+        kind = self.kind[rows][rep]
+        touched[day, col] = True
+        # Fancy assignment with repeated cells keeps the last write; sorted by override_id that's the newest
+        on = kind != "SHIFT"
+        available[day[on], col[on]] = kind[on] == "AVAILABLE"
+        codes = pd.Index(shift_codes).get_indexer(self.shift_type[rows][rep])
+        moved = (kind == "SHIFT") & (codes >= 0)
+        shift[day[moved], col[moved]] = codes[moved]
+        return touched
+
+
+def effective_roster(dealers, date, overrides=None):
+    """Dealers' availability and shift on one date after removals and temporary adjustments.
+
+    Vectorized over the whole roster: the weekday bit test, the removal check and
+    the override overlay are each one array operation. Returns ee_number, names,
+    dealer_group, ft_pt, the effective shift_type, available, and overridden.
+    """
+    day = pd.Timestamp(date).normalize()
+    mask = dealers["avail_mask"].to_numpy(dtype=np.uint8)
+    removal = dealers["removal_effective_date"].to_numpy(dtype="datetime64[ns]")
+    available = ((mask & weekday_bits([day])[0]) != 0)[None, :]
+    shift = pd.Categorical(dealers["shift_type"].astype(object), categories=SUPPLY_SHIFTS).codes.astype(np.int64)
+    shift = np.where(shift < 0, len(SUPPLY_SHIFTS) - 1, shift)[None, :]
+
+    touched = np.zeros(available.shape, dtype=bool)
+    if overrides is not None:
+        touched = overrides.overlay(available, shift, dealers["ee_number"].astype(str), [day], SUPPLY_SHIFTS)
+    # Removal wins over an AVAILABLE override
+    available &= np.isnat(removal) | (removal > day.to_datetime64())
+
+    return pd.DataFrame({
+        "ee_number": dealers["ee_number"].to_numpy(),
+        "first_name": dealers["first_name"].to_numpy(),
+        "last_name": dealers["last_name"].to_numpy(),
+        "dealer_group": dealers["dealer_group"].to_numpy(),
+        "ft_pt": dealers["ft_pt"].to_numpy(),
+        "shift_type": np.array(SUPPLY_SHIFTS, dtype=object)[shift[0]],
+        "available": available[0],
+        "overridden": touched[0],
+    })
+
+
+def changed_dealers(before, after):
+    """ee_numbers whose overrides differ between two OverrideIndex layers (either may be None)."""
+    frames = [index.frame for index in (before, after) if index is not None]
+    if not frames:
+        return set()
+    rows = pd.concat(frames, ignore_index=True)
+    # Rows present in only one layer were added, deleted or edited
+    changed = rows[~rows.duplicated(keep=False)] if len(frames) == 2 else rows
+    return set(changed["ee_number"].astype(str))
@@ -2,34 +2,31 @@ import streamlit as st
 import pandas as pd
 import datetime
 
+from dealer.state import dealers_loaded, get_dealer_store
+
 def show_remove_dealer():
     st.title("❌ Remove Dealer")
 
-    if "dealer_df" not in st.session_state or st.session_state.dealer_df is None:
+    if not dealers_loaded():
         st.error("Dealer list not loaded. Please upload it on the import page.")
         return
 
-    df = st.session_state.dealer_df
+    store = get_dealer_store()
 
     st.subheader("🔍 Search for Dealer to Remove")
     search_by = st.selectbox("Search by:", ["ee_number", "nametag_id", "first_name", "last_name"])
     search_term = st.text_input(f"Enter {search_by}:")
 
-    match_df = pd.DataFrame()
-    if search_term:
-        mask = df[search_by].astype(str).str.contains(search_term, case=False, na=False)
-        match_df = df[mask]
+    index = store.index
+    matches = index.search(search_by, search_term) if search_term else []
 
-    if search_term and match_df.empty:
+    if search_term and not matches:
         st.warning("No matching dealers found.")
 
-    elif not match_df.empty:
-        match_df = match_df.copy()
-        match_df["label"] = match_df.apply(
-            lambda row: f"{row['last_name']}, {row['first_name']} (EE# {row['ee_number']})", axis=1
-        )
-        selected_label = st.selectbox("Select a dealer to remove:", match_df["label"])
-        selected_dealer = match_df[match_df["label"] == selected_label].iloc[0]
+    elif matches:
+        label_to_ee = dict(zip(index.labels(matches), matches))
+        selected_label = st.selectbox("Select a dealer to remove:", list(label_to_ee))
+        selected_dealer = store.row(label_to_ee[selected_label])
 
         st.markdown("### Selected Dealer Info")
         col1, col2, col3 = st.columns(3)
@@ -41,9 +38,7 @@ def show_remove_dealer():
         confirm = st.checkbox("I understand that this will mark the dealer as removed on the selected date.")
 
         if st.button("❌ Confirm Removal") and confirm:
-            row_index = df[df["ee_number"].astype(str) == str(selected_dealer["ee_number"])].index[0]
-            df.at[row_index, "removal_effective_date"] = effective_date.isoformat()
-            st.session_state.dealer_df = df
+            store.update(selected_dealer["ee_number"], {"removal_effective_date": pd.Timestamp(effective_date)})
             st.success(
                 f"Dealer {selected_dealer['first_name']} {selected_dealer['last_name']} marked for removal "
                 f"(effective {effective_date.isoformat()})."
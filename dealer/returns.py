@@ -0,0 +1,153 @@
+# dealer/returns.py
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dealer.roster import owes_uniform
+
+UNIFORM_ITEMS = ["Shirt", "Vest", "Apron", "Name Tag"]
+
+# The scan queue commits on its own once this many dealers are waiting
+BATCH_SIZE = 25
+
+# Scan outcomes
+QUEUED = "queued"
+UPDATED = "updated"
+RETURNED = "already returned"
+UNKNOWN = "unknown"
+AMBIGUOUS = "ambiguous"
+
+_local_seq = itertools.count(1)
+_local_lock = threading.Lock()
+
+
+def confirmation_ids(count, db=None, now=None):
+    """`count` confirmation ids like "06141530-1042": the minute stamp plus a sequence number.
+
+    The sequence comes from the roster database (RosterDB.reserve_sequence), so
+    ids never repeat, even for returns logged in the same minute by different
+    sessions. Without a database it falls back to a per-process counter.
+    """
+    stamp = pd.Timestamp(now if now is not None else pd.Timestamp.now()).strftime("%m%d%H%M")
+    if db is not None:
+        first = db.reserve_sequence("uniform_confirm", count)
+        numbers = range(first, first + count)
+    else:
+        with _local_lock:
+            numbers = [next(_local_seq) for _ in range(count)]
+    return [f"{stamp}-{n}" for n in numbers]
+
+
+def _merge_items(*groups):
+    wanted = {item for group in groups for item in group}
+    known = [item for item in UNIFORM_ITEMS if item in wanted]
+    return known + sorted(wanted - set(known))
+
+
+class ReturnQueue:
+    """Scanned uniform returns waiting to be logged as one batch.
+
+    A scan is a nametag or EE barcode; it resolves through the store's search
+    index (exact EE number first, then nametag ID), so queueing never touches
+    the dealer table or the database. Nametags are not unique, so a nametag
+    shared by several dealers is reported as ambiguous with its candidates and
+    nothing is queued; the EE barcode settles it. Each dealer is queued once
+    and scanning them again adds any new items. commit() writes the whole queue with one
+    DealerStore.log_uniform_returns call.
+    """
+
+    def __init__(self):
+        self.entries = {}  # ee_number -> items, in scan order
+
+    def __len__(self):
+        return len(self.entries)
+
+    def resolve(self, store, code):
+        """ee_numbers the code matches: one, several (shared nametag) or none."""
+        code = str(code).strip()
+        for field in ("ee_number", "nametag_id"):
+            hits = store.index.exact(field, code)
+            if hits:
+                return hits
+        return []
+
+    def scan(self, store, code, items):
+        """Queue one scanned code.
+
+        Returns (outcome, ee_number), or (AMBIGUOUS, [candidate ee_numbers]) when
+        the code is a nametag several dealers share.
+        """
+        hits = self.resolve(store, code)
+        if not hits:
+            return UNKNOWN, None
+        if len(hits) > 1:
+            return AMBIGUOUS, hits
+        ee = hits[0]
+        if ee in self.entries:
+            self.entries[ee] = _merge_items(self.entries[ee], items)
+            return UPDATED, ee
+        if store.row(ee)["uniform_return_date"]:
+            return RETURNED, ee
+        self.entries[ee] = _merge_items(items)
+        return QUEUED, ee
+
+    def scan_many(self, store, codes, items):
+        """Queue codes in order. Returns [(code, outcome, ee_number or candidates)]."""
+        return [(code, *self.scan(store, code, items)) for code in codes]
+
+    def clear(self):
+        self.entries = {}
+
+    def commit(self, store, return_date=None, now=None):
+        """Log every queued return in one batch and empty the queue.
+
+        Dealers someone else logged since they were scanned are skipped.
+        Returns the logged rows as [(ee_number, return_date, items, confirm_id)].
+        """
+        pending = [ee for ee in self.entries if ee in store and not store.row(ee)["uniform_return_date"]]
+        if not pending:
+            self.clear()
+            return []
+        return_date = return_date or pd.Timestamp.now().date().isoformat()
+        confirm_ids = confirmation_ids(len(pending), db=store.db, now=now)
+        rows = [
+            (ee, return_date, ", ".join(self.entries[ee]), confirm_id)
+            for ee, confirm_id in zip(pending, confirm_ids)
+        ]
+        missing = set(store.log_uniform_returns(rows))
+        self.clear()
+        return [row for row in rows if row[0] not in missing]
+
+
+class MissingReturns:
+    """Who still owes a uniform, as one flag per row of the dealer store's table.
+
+    refresh() recomputes only the rows a store edit touched (store.changed_since),
+    so logging a batch of returns doesn't rescan the roster. Reports combine the
+    flags with a RosterTimeline for the as-of date.
+    """
+
+    def __init__(self, dealers):
+        self.owing = owes_uniform(dealers).copy()  # written in place by refresh()
+
+    def refresh(self, dealers, positions):
+        if len(dealers) != len(self.owing):
+            grown = np.zeros(len(dealers), dtype=bool)
+            keep = min(len(dealers), len(self.owing))
+            grown[:keep] = self.owing[:keep]
+            self.owing = grown
+        if len(positions):
+            self.owing[positions] = owes_uniform(dealers.iloc[positions])
+
+    def mask(self, roster, as_of, include_removed=False):
+        return self.owing if include_removed else self.owing & roster.mask_on(as_of)
+
+    def report(self, roster, as_of, include_removed=False):
+        """Dealers owing a uniform (rows of roster.dealers), like missing_uniform_returns()."""
+        return roster.dealers.take(np.flatnonzero(self.mask(roster, as_of, include_removed)))
+
+    def count_among(self, positions):
+        """How many of the given row positions still owe a uniform."""
+        return int(self.owing[positions].sum())
@@ -0,0 +1,87 @@
+# dealer/roster.py
+import numpy as np
+import pandas as pd
+
+_NEVER = np.iinfo(np.int64).max  # sort key for dealers with no removal date
+
+
+def _day_keys(dates):
+    return pd.DatetimeIndex(pd.to_datetime(dates)).normalize().to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+
+class RosterTimeline:
+    """Who is on the roster on any date, read from removal_effective_date.
+
+    A dealer is active on D when they have no removal date or it is after D
+    (the removal date is their first day off the roster). The roster has no
+    start dates, so everyone on file counts from the beginning and the index
+    is over end dates only: row positions sorted by removal date, never-removed
+    last. The dealers active on D are then a suffix of that order found with
+    one searchsorted, so positions_on() hands back a slice of the sorted array
+    (a view, nothing copied) and counts over a whole series are one vectorized
+    call. Positions refer to rows of the `dealers` frame the timeline was built on.
+    """
+
+    def __init__(self, dealers):
+        self.dealers = dealers
+        removal = dealers["removal_effective_date"].to_numpy(dtype="datetime64[ns]")
+        end = np.where(np.isnat(removal), _NEVER, removal.astype(np.int64))
+        self._order = np.argsort(end, kind="stable")
+        self._end = end[self._order]
+        self._rank = np.empty(len(end), dtype=np.int64)
+        self._rank[self._order] = np.arange(len(end))
+
+    def __len__(self):
+        return len(self._order)
+
+    def _cut(self, dates):
+        return np.searchsorted(self._end, _day_keys(dates), side="right")
+
+    def positions_on(self, date):
+        """Row positions of the dealers active on `date` (ordered by removal date)."""
+        return self._order[self._cut([date])[0]:]
+
+    def removed_between(self, start, end):
+        """Row positions of dealers whose removal date falls in (start, end]."""
+        lo, hi = self._cut([start, end])
+        return self._order[lo:hi]
+
+    def mask_on(self, date):
+        """Boolean mask over `dealers` rows: active on `date`."""
+        return self._rank >= self._cut([date])[0]
+
+    def active_matrix(self, dates):
+        """dates x dealers boolean matrix of who is on the roster each date."""
+        return self._rank[None, :] >= self._cut(dates)[:, None]
+
+    def counts(self, dates):
+        """Active headcount per date (Series)."""
+        return pd.Series(len(self) - self._cut(dates), index=pd.DatetimeIndex(pd.to_datetime(dates)).normalize())
+
+    def unchanged(self, dealers, positions):
+        """True when `dealers` is the frame this was built on and the removal dates at `positions` still match.
+
+        Lets a cache keep the timeline across edits that don't move anyone's
+        removal date (uniform returns, contact details).
+        """
+        if dealers is not self.dealers or len(dealers) != len(self):
+            return False
+        removal = dealers["removal_effective_date"].to_numpy(dtype="datetime64[ns]")[positions]
+        end = np.where(np.isnat(removal), _NEVER, removal.astype(np.int64))
+        return bool(np.array_equal(end, self._end[self._rank[positions]]))
+
+    def on(self, date):
+        """The active roster on `date` as a frame, in the original row order."""
+        return self.dealers.take(np.sort(self.positions_on(date)))
+
+
+def owes_uniform(dealers):
+    """Boolean array over `dealers` rows: no uniform return logged."""
+    return ((dealers["uniform_return_date"] == "") & (dealers["uniform_return_items"] == "")).to_numpy()
+
+
+def missing_uniform_returns(roster, as_of, include_removed=False):
+    """Dealers with no uniform return logged, limited to the roster on as_of unless include_removed."""
+    df = roster.dealers
+    owing = owes_uniform(df)
+    return df[owing if include_removed else owing & roster.mask_on(as_of)]
@@ -0,0 +1,227 @@
+# dealer/schema.py
+import numpy as np
+import pandas as pd
+
+# ---- WEEKDAY BITMASK ----
+# Availability is packed into one uint8 per dealer: bit 0 = SUN ... bit 6 = SAT.
+DAYS = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
+AVAIL_COLUMNS = [f"AVAIL-{day}" for day in DAYS]
+DAY_BITS = {day: np.uint8(1 << i) for i, day in enumerate(DAYS)}
+ALL_DAYS_MASK = np.uint8(0b1111111)
+
+# ---- CATEGORIES ----
+FT_PT = ["FULL TIME", "PART TIME"]
+SHIFT_TYPES = ["DAY", "SWING"]
+DEALER_GROUPS = ["ANY", "LIVE", "HOLDEM"]
+
+TEXT_COLUMNS = ["first_name", "last_name", "nametag_id", "ee_number", "email", "phone"]
+# Dealer list upload layout the importer requires
+DEALER_COLUMNS = TEXT_COLUMNS + ["ft_pt", "shift_type", "dealer_group"] + AVAIL_COLUMNS
+UNIFORM_COLUMNS = ["uniform_return_date", "uniform_return_items", "uniform_return_confirm_id"]
+
+# ---- CANONICAL DEALER TABLE ----
+# Column -> dtype of the dealer table after normalize_dealers() (and as held by DealerStore).
+#   text columns         stripped str, "" when blank (ee_number/nametag_id never numeric)
+#   ft_pt/shift_type/    categoricals over the fixed values above; anything that
+#   dealer_group         can't be mapped becomes NaN
+#   avail_mask           uint8 weekday bitmask replacing the seven AVAIL-* columns
+#   removal_effective_   datetime64, NaT while the dealer is active
+#   date
+#   uniform_return_*     str, "" until a return is logged
+DEALER_SCHEMA = {
+    **{col: "str" for col in TEXT_COLUMNS},
+    "ft_pt": pd.CategoricalDtype(FT_PT),
+    "shift_type": pd.CategoricalDtype(SHIFT_TYPES),
+    "dealer_group": pd.CategoricalDtype(DEALER_GROUPS),
+    "avail_mask": "uint8",
+    "removal_effective_date": "datetime64[ns]",
+    **{col: "str" for col in UNIFORM_COLUMNS},
+}
+
+_TRUTHY = {"YES", "Y", "TRUE", "T", "1", "1.0", "X"}
+_GROUP_ALIASES = {"HOLD'EM": "HOLDEM", "HOLD EM": "HOLDEM", "NLH": "HOLDEM", "MIXED": "LIVE"}
+
+
+def _text(series):
+    # Numeric ids come out of Excel as int/float; keep them as plain digit strings
+    if pd.api.types.is_float_dtype(series):
+        series = series.astype("Int64")
+    return series.astype(object).where(series.notna(), "").astype(str).str.strip()
+
+
+def _category(series, categories, aliases=None):
+    values = series.astype(str).str.strip().str.upper()
+    if aliases:
+        values = values.replace(aliases)
+    return pd.Categorical(values.where(values.isin(categories)), categories=categories)
+
+
+def _ft_pt(series):
+    first = series.astype(str).str.strip().str.upper().str[:1]
+    return pd.Categorical(first.map({"F": "FULL TIME", "P": "PART TIME"}), categories=FT_PT)
+
+
+def pack_availability(frame):
+    """Vectorized AVAIL-* (YES/NO, True/False, 1/0) -> uint8 weekday bitmask.
+
+    A day whose AVAIL-* column the frame doesn't have counts as available,
+    the same default dealer_record() uses.
+    """
+    set_bits, clear_bits = availability_bits(frame)
+    return (ALL_DAYS_MASK & ~clear_bits) | set_bits
+
+
+def normalize_dealers(raw):
+    """Canonical load step: raw upload (importer.DEALER_COLUMNS) -> typed dealer table."""
+    df = pd.DataFrame(index=pd.RangeIndex(len(raw)))
+
+    for col in TEXT_COLUMNS:
+        df[col] = _text(raw[col]).to_numpy() if col in raw.columns else ""
+
+    df["ft_pt"] = _ft_pt(raw["ft_pt"]) if "ft_pt" in raw.columns else pd.Categorical([None] * len(raw), FT_PT)
+    df["shift_type"] = _category(raw.get("shift_type", pd.Series([None] * len(raw))), SHIFT_TYPES)
+    df["dealer_group"] = _category(raw.get("dealer_group", pd.Series(["ANY"] * len(raw))), DEALER_GROUPS, _GROUP_ALIASES)
+    df["avail_mask"] = pack_availability(raw)
+
+    if "removal_effective_date" in raw.columns:
+        df["removal_effective_date"] = pd.to_datetime(raw["removal_effective_date"], errors="coerce").to_numpy()
+    else:
+        df["removal_effective_date"] = pd.NaT
+    df["removal_effective_date"] = df["removal_effective_date"].astype("datetime64[ns]")
+
+    for col in UNIFORM_COLUMNS:
+        df[col] = _text(raw[col]).to_numpy() if col in raw.columns else ""
+
+    # Carry through any extra columns the upload had (e.g. User_Added)
+    known = set(DEALER_SCHEMA) | set(AVAIL_COLUMNS)
+    for col in raw.columns:
+        if col not in known:
+            df[col] = raw[col].to_numpy()
+
+    return df
+
+
+def coerce_columns(frame):
+    """Partial edits (upload or canonical layout) -> canonical column values.
+
+    AVAIL-* columns are left out here; see availability_bits().
+    """
+    out = pd.DataFrame(index=frame.index)
+    for col in frame.columns:
+        if col in TEXT_COLUMNS or col in UNIFORM_COLUMNS:
+            out[col] = _text(frame[col])
+        elif col == "ft_pt":
+            out[col] = _ft_pt(frame[col])
+        elif col == "shift_type":
+            out[col] = _category(frame[col], SHIFT_TYPES)
+        elif col == "dealer_group":
+            out[col] = _category(frame[col], DEALER_GROUPS, _GROUP_ALIASES)
+        elif col == "avail_mask":
+            out[col] = frame[col].astype("uint8")
+        elif col == "removal_effective_date":
+            out[col] = pd.to_datetime(frame[col], errors="coerce").astype("datetime64[ns]")
+        elif col not in AVAIL_COLUMNS:
+            out[col] = frame[col]
+    return out
+
+
+def filled_cells(frame):
+    """Boolean frame: True where a cell holds a value (not NaN/None and not blank text)."""
+    return frame.notna() & frame.astype(str).apply(lambda col: col.str.strip().ne(""))
+
+
+def availability_bits(frame, skip_blank=False):
+    """(set_bits, clear_bits) uint8 arrays for whichever AVAIL-* columns frame has.
+
+    Apply with `(mask & ~clear_bits) | set_bits` so days not in the edit keep their value.
+    With skip_blank, a blank cell also keeps that dealer's day as it was.
+    """
+    set_bits = np.zeros(len(frame), dtype=np.uint8)
+    clear_bits = np.zeros(len(frame), dtype=np.uint8)
+    for day, col in zip(DAYS, AVAIL_COLUMNS):
+        if col in frame.columns:
+            on = frame[col].astype(str).str.strip().str.upper().isin(_TRUTHY).to_numpy()
+            written = filled_cells(frame[[col]])[col].to_numpy() if skip_blank else True
+            set_bits |= np.where(on & written, DAY_BITS[day], 0).astype(np.uint8)
+            clear_bits |= np.where(written, DAY_BITS[day], 0).astype(np.uint8)
+    return set_bits, clear_bits
+
+
+def key_problems(df):
+    """Rows the dealer table can't store, as a Series aligned to df: the reason, "" when OK.
+
+    ee_number is the table's key, so a blank one is rejected and only the first
+    row for a repeated one is kept.
+    """
+    ee = df["ee_number"]
+    reasons = np.select(
+        [ee == "", ee.duplicated(keep="first")],
+        ["Missing EE number", "EE number repeated in file"],
+        default="",
+    )
+    return pd.Series(reasons, index=df.index)
+
+
+def extra_columns(df):
+    """Columns of a normalized upload that the dealer table doesn't store."""
+    return [col for col in df.columns if col not in DEALER_SCHEMA]
+
+
+def unmapped_counts(df):
+    """Number of rows whose categorical value could not be mapped, per column."""
+    counts = {col: int(df[col].isna().sum()) for col in ["ft_pt", "shift_type", "dealer_group"]}
+    return {col: n for col, n in counts.items() if n}
+
+
+def dealer_record(**fields):
+    """One new dealer as a single-row canonical frame. Availability is given as avail_mask."""
+    defaults = {col: "" for col in TEXT_COLUMNS + UNIFORM_COLUMNS}
+    defaults.update({"ft_pt": None, "shift_type": None, "dealer_group": "ANY",
+                     "avail_mask": ALL_DAYS_MASK, "removal_effective_date": pd.NaT})
+    row = {col: fields.get(col, defaults[col]) for col in DEALER_SCHEMA}
+    return pd.DataFrame([row]).astype(DEALER_SCHEMA)
+
+
+def availability_mask(flags):
+    """{"SUN": True, ...} or {"AVAIL-SUN": True, ...} -> uint8 bitmask."""
+    mask = 0
+    for key, on in flags.items():
+        day = key.replace("AVAIL-", "")
+        if on:
+            mask |= int(DAY_BITS[day])
+    return np.uint8(mask)
+
+
+def availability_flags(mask):
+    """uint8 bitmask -> {"SUN": bool, ...}."""
+    mask = int(mask)
+    return {day: bool(mask & int(bit)) for day, bit in DAY_BITS.items()}
+
+
+def weekday_bits(dates):
+    """Bit for each date's weekday, for vectorized `avail_mask & bit` filters."""
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    # pandas dayofweek: MON=0 ... SUN=6; our bit order starts at SUN
+    return (np.uint8(1) << ((dates.dayofweek.to_numpy() + 1) % 7).astype(np.uint8)).astype(np.uint8)
+
+
+def available_on(df, day):
+    """Boolean mask of dealers available on a weekday name ("MON") or a date."""
+    if isinstance(day, str):
+        bit = DAY_BITS[day.upper()]
+    else:
+        bit = weekday_bits([day])[0]
+    return (df["avail_mask"].to_numpy() & bit) != 0
+
+
+def to_wide(df):
+    """Canonical table -> upload layout (importer.DEALER_COLUMNS with YES/NO AVAIL-* columns)."""
+    out = df.drop(columns=["avail_mask"]).copy()
+    for col in ["ft_pt", "shift_type", "dealer_group"]:
+        out[col] = out[col].astype(object)
+    mask = df["avail_mask"].to_numpy()
+    for day, col in zip(DAYS, AVAIL_COLUMNS):
+        out[col] = np.where((mask & DAY_BITS[day]) != 0, "YES", "NO")
+    out["removal_effective_date"] = out["removal_effective_date"].dt.strftime("%Y-%m-%d")
+    lead = TEXT_COLUMNS + ["ft_pt", "shift_type", "dealer_group"] + AVAIL_COLUMNS
+    return out[lead + [col for col in out.columns if col not in lead]]
@@ -0,0 +1,142 @@
+# dealer/search.py
+from bisect import bisect_left, insort
+
+SEARCH_FIELDS = ["ee_number", "nametag_id", "first_name", "last_name"]
+EXACT_FIELDS = ["ee_number", "nametag_id"]
+MAX_RESULTS = 200
+
+
+def dealer_label(first_name, last_name, ee_number):
+    return f"{last_name}, {first_name} (EE# {ee_number})"
+
+
+def _keys(field, value):
+    value = str(value).strip().lower()
+    if not value:
+        return []
+    if field in EXACT_FIELDS:
+        return [value]
+    # Names are searchable by the full value and by each word ("cruz" finds "De La Cruz")
+    return list(dict.fromkeys([value] + value.split()))
+
+
+class DealerSearchIndex:
+    """Lookup structure for the dealer search boxes, keyed by ee_number.
+
+    ee_number and nametag_id get an exact hash lookup; every field also keeps a
+    sorted key list so a partial entry resolves to a prefix range with bisect.
+    Matching is still substring, as it was with str.contains: entries that
+    contain the term elsewhere ("ez" in "Perez") follow the prefix hits.
+    Display labels are built once per dealer, not per search. add/update/remove
+    keep the index in step with edits so it never needs a full rebuild.
+    """
+
+    def __init__(self, df=None):
+        self._labels = {}                                   # ee_number -> label
+        self._values = {}                                   # ee_number -> {field: value}
+        self._exact = {field: {} for field in EXACT_FIELDS}  # key -> set of ee_numbers
+        self._sorted = {field: [] for field in SEARCH_FIELDS}  # sorted [(key, ee_number)]
+        if df is not None:
+            self.rebuild(df)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def rebuild(self, df):
+        frame = df[SEARCH_FIELDS].astype(str)
+        ees = frame["ee_number"].tolist()
+        labels = (frame["last_name"] + ", " + frame["first_name"] + " (EE# " + frame["ee_number"] + ")").tolist()
+
+        self._labels = dict(zip(ees, labels))
+        self._values = {}
+        self._exact = {field: {} for field in EXACT_FIELDS}
+        for field in SEARCH_FIELDS:
+            entries = []
+            for ee, value in zip(ees, frame[field].tolist()):
+                self._values.setdefault(ee, {})[field] = value
+                for key in _keys(field, value):
+                    entries.append((key, ee))
+                    if field in self._exact:
+                        self._exact[field].setdefault(key, set()).add(ee)
+            entries.sort()
+            self._sorted[field] = entries
+
+    def add(self, row):
+        ee = str(row["ee_number"])
+        self._labels[ee] = dealer_label(row["first_name"], row["last_name"], ee)
+        self._values[ee] = {field: str(row[field]) for field in SEARCH_FIELDS}
+        for field in SEARCH_FIELDS:
+            for key in _keys(field, row[field]):
+                insort(self._sorted[field], (key, ee))
+                if field in self._exact:
+                    self._exact[field].setdefault(key, set()).add(ee)
+
+    def remove(self, ee_number):
+        ee = str(ee_number)
+        values = self._values.pop(ee, None)
+        if values is None:
+            return
+        del self._labels[ee]
+        for field in SEARCH_FIELDS:
+            entries = self._sorted[field]
+            for key in _keys(field, values[field]):
+                pos = bisect_left(entries, (key, ee))
+                if pos < len(entries) and entries[pos] == (key, ee):
+                    del entries[pos]
+                if field in self._exact:
+                    bucket = self._exact[field].get(key)
+                    if bucket is not None:
+                        bucket.discard(ee)
+                        if not bucket:
+                            del self._exact[field][key]
+
+    def update(self, old_ee_number, row):
+        self.remove(old_ee_number)
+        self.add(row)
+
+    def search(self, field, term, limit=MAX_RESULTS):
+        """ee_numbers whose field contains term: exact id hits, then prefix, then other substring matches."""
+        term = str(term).strip().lower()
+        if not term:
+            return []
+
+        results = []
+        seen = set()
+        if field in self._exact:
+            for ee in sorted(self._exact[field].get(term, ()))[:limit]:
+                results.append(ee)
+                seen.add(ee)
+
+        entries = self._sorted[field]
+        pos = bisect_left(entries, (term, ""))
+        while pos < len(entries) and len(results) < limit:
+            key, ee = entries[pos]
+            if not key.startswith(term):
+                break
+            if ee not in seen:
+                results.append(ee)
+                seen.add(ee)
+            pos += 1
+
+        # Only the entries outside the prefix range need a substring scan
+        for key, ee in entries:
+            if len(results) >= limit:
+                break
+            if ee not in seen and term in key and not key.startswith(term):
+                results.append(ee)
+                seen.add(ee)
+        return results
+
+    def exact(self, field, term):
+        """ee_numbers whose ee_number/nametag_id equals term (case-insensitive), no prefix matches."""
+        return sorted(self._exact[field].get(str(term).strip().lower(), ()))
+
+    def exact_keys(self, field):
+        """Lowercased values present for an exact-lookup field."""
+        return self._exact[field].keys()
+
+    def label(self, ee_number):
+        return self._labels[str(ee_number)]
+
+    def labels(self, ee_numbers):
+        return [self._labels[ee] for ee in ee_numbers]
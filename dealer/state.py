@@ -0,0 +1,120 @@
+# dealer/state.py
+import threading
+
+from dealer.overrides import OverrideIndex, changed_dealers
+from dealer.returns import MissingReturns
+from dealer.roster import RosterTimeline
+from dealer.store import DealerStore
+from dealer.supply import RosterSupply
+from diagnostics import register_cache, section
+from roster_db import get_roster_db
+
+_SHARED = register_cache("dealer.state._SHARED", {})
+_SUPPLY = register_cache("dealer.state._SUPPLY", {})
+_OVERRIDES = register_cache("dealer.state._OVERRIDES", {})
+_TIMELINE = register_cache("dealer.state._TIMELINE", {})
+_RETURNS = register_cache("dealer.state._RETURNS", {})
+_LOCK = threading.Lock()
+
+
+def get_dealer_store():
+    """Process-wide DealerStore backed by the roster database.
+
+    Every browser session shares this one copy; it is reloaded only when the
+    database has changed underneath it (a new upload, another server process).
+    """
+    db = get_roster_db()
+    with _LOCK:
+        store = _SHARED.get(db.path)
+        if store is None or store.db_version != db.version("dealers"):
+            with section("load"):
+                store = DealerStore(db.load_dealers(), db=db)
+            _SHARED[db.path] = store
+    return store
+
+
+def dealers_loaded():
+    return get_roster_db().count("dealers") > 0
+
+
+def get_roster_timeline():
+    """RosterTimeline over the shared store's table.
+
+    Kept across store edits that leave every removal date alone (uniform
+    returns, contact changes); rebuilt when one moves or dealers are added.
+    """
+    db = get_roster_db()
+    store = get_dealer_store()
+    with _LOCK:
+        cached = _TIMELINE.get(db.path)
+        if cached is not None and cached[0] is store and cached[1] != store.version:
+            changed = store.changed_since(cached[1])
+            if changed is not None and cached[2].unchanged(store.df, changed):
+                cached = (store, store.version, cached[2])
+                _TIMELINE[db.path] = cached
+        if cached is None or cached[0] is not store or cached[1] != store.version:
+            with section("aggregate"):
+                cached = (store, store.version, RosterTimeline(store.df))
+            _TIMELINE[db.path] = cached
+    return cached[2]
+
+
+def get_missing_returns():
+    """MissingReturns for the shared store, refreshed for just the rows edited since last time."""
+    db = get_roster_db()
+    store = get_dealer_store()
+    with _LOCK, section("aggregate"):
+        cached = _RETURNS.get(db.path)
+        if cached is not None and cached[0] is store:
+            _, version, missing = cached
+            if version != store.version:
+                changed = store.changed_since(version)
+                if changed is None:
+                    missing = MissingReturns(store.df)
+                else:
+                    missing.refresh(store.df, changed)
+        else:
+            missing = MissingReturns(store.df)
+        _RETURNS[db.path] = (store, store.version, missing)
+    return missing
+
+
+def get_override_index():
+    """Process-wide OverrideIndex of the temporary adjustments, reloaded when they change."""
+    db = get_roster_db()
+    with _LOCK:
+        cached = _OVERRIDES.get(db.path)
+        if cached is None or cached[0] != db.version("overrides"):
+            with section("load"):
+                cached = (db.version("overrides"), OverrideIndex(db.load_overrides()))
+            _OVERRIDES[db.path] = cached
+    return cached[1]
+
+
+def get_roster_supply(start, end):
+    """RosterSupply for start..end, kept in step with the shared store and overrides.
+
+    Edits made through the store only recount the dealers they touched, and
+    a change to the temporary adjustments only recounts the dealers whose
+    overrides changed; a new store (reload from the database) or a different
+    date range rebuilds it.
+    """
+    db = get_roster_db()
+    store = get_dealer_store()
+    overrides = get_override_index()
+    with _LOCK, section("aggregate"):
+        cached = _SUPPLY.get(db.path)
+        if cached is not None and cached[0] is store and cached[2].covers(start, end):
+            _, version, supply = cached
+            if version != store.version:
+                changed = store.changed_since(version)
+                if changed is None:
+                    supply = RosterSupply(store.df, start, end, overrides)
+                else:
+                    supply.refresh(store.df, changed)
+            if supply.overrides is not overrides:
+                supply.set_overrides(overrides, changed_dealers(supply.overrides, overrides))
+        else:
+            supply = RosterSupply(store.df, start, end, overrides)
+        _SUPPLY[db.path] = (store, store.version, supply)
+    return supply
@@ -0,0 +1,243 @@
+# dealer/store.py
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from dealer.schema import AVAIL_COLUMNS, availability_bits, coerce_columns, filled_cells
+from dealer.search import SEARCH_FIELDS, DealerSearchIndex
+
+
+# New hires sit in an append buffer until this many rows have accumulated
+# (or something reads the full table), then get folded in with one concat.
+COMPACT_THRESHOLD = 256
+
+# How many recent mutations changed_since() can report on
+HISTORY_LENGTH = 64
+
+
+class DealerStore:
+    """The canonical dealer table keyed by ee_number.
+
+    Keeps an ee_number -> row position map alongside the frame so saves resolve
+    their row in O(1), and owns the search index so both stay in step with edits.
+    Added dealers go to an append buffer that `df` merges in transparently.
+    `version` bumps on every mutation for caches built on top of the roster, and
+    changed_since() tells them which rows to recompute instead of rebuilding.
+
+    With a RosterDB attached every mutation is written through to SQLite, and
+    `db_version` records which database version the in-memory copy reflects.
+    """
+
+    def __init__(self, df, db=None):
+        self.db = db
+        self.db_version = db.version("dealers") if db is not None else 0
+        self._lock = threading.RLock()
+        self._main = df.reset_index(drop=True)
+        self._pending = []
+        self._pending_rows = 0
+        self.index = DealerSearchIndex(self._main)
+        self._positions = dict(zip(self._main["ee_number"].tolist(), range(len(self._main))))
+        self.version = 0
+        self._history = deque(maxlen=HISTORY_LENGTH)  # (version, row positions touched)
+
+    @property
+    def df(self):
+        self.compact()
+        return self._main
+
+    def __len__(self):
+        return len(self._main) + self._pending_rows
+
+    def __contains__(self, ee_number):
+        return str(ee_number) in self._positions
+
+    def position(self, ee_number):
+        return self._positions[str(ee_number)]
+
+    def row(self, ee_number):
+        pos = self.position(ee_number)
+        if pos < len(self._main):
+            return self._main.iloc[pos]
+        pos -= len(self._main)
+        for frame in self._pending:
+            if pos < len(frame):
+                return frame.iloc[pos]
+            pos -= len(frame)
+        raise KeyError(ee_number)
+
+    def compact(self):
+        """Fold buffered additions into the main table with a single concat."""
+        with self._lock:
+            if self._pending:
+                self._main = pd.concat([self._main, *self._pending], ignore_index=True)
+                self._pending = []
+                self._pending_rows = 0
+
+    def changed_since(self, version):
+        """Row positions touched after `version`, or None if that is further back than the history."""
+        if version == self.version:
+            return np.array([], dtype=np.int64)
+        touched = [positions for v, positions in self._history if v > version]
+        if len(touched) != self.version - version:
+            return None
+        return np.unique(np.concatenate(touched))
+
+    def _saved(self, positions):
+        self.version += 1
+        self._history.append((self.version, np.asarray(positions, dtype=np.int64)))
+        if self.db is not None:
+            self.db_version = self.db.version("dealers")
+
+    def check_new_dealers(self, records):
+        """Vectorized duplicate/required-field check for new hires.
+
+        Returns a Series aligned to records with the rejection reason, "" when the row is OK.
+        """
+        ee = records["ee_number"]
+        tag = records["nametag_id"].str.lower()
+        has_tag = tag != ""
+        reasons = np.select(
+            [
+                (records["first_name"] == "") | (records["last_name"] == "") | (ee == ""),
+                ee.isin(pd.Index(list(self._positions))),
+                ee.duplicated(keep=False),
+                has_tag & tag.isin(pd.Index(self.index.exact_keys("nametag_id"))),
+                has_tag & tag.duplicated(keep=False),
+            ],
+            [
+                "Missing first name, last name or EE number",
+                "EE number already exists",
+                "EE number repeated in file",
+                "Nametag ID already exists",
+                "Nametag ID repeated in file",
+            ],
+            default="",
+        )
+        return pd.Series(reasons, index=records.index)
+
+    def append(self, records):
+        """Add new dealers (canonical rows, e.g. from schema.dealer_record) via the buffer."""
+        records = records.reset_index(drop=True)
+        with self._lock:
+            if self.db is not None:
+                self.db.insert_dealers(records)
+
+            start = len(self)
+            for offset, ee in enumerate(records["ee_number"].tolist()):
+                self._positions[ee] = start + offset
+            for _, row in records.iterrows():
+                self.index.add(row)
+
+            self._pending.append(records)
+            self._pending_rows += len(records)
+            if self._pending_rows >= COMPACT_THRESHOLD:
+                self.compact()
+            self._saved(np.arange(start, start + len(records)))
+
+    def add_many(self, records):
+        """Check and append a batch of new hires. Returns the rejected rows with a reason column."""
+        reasons = self.check_new_dealers(records)
+        accepted = records[reasons == ""]
+        if not accepted.empty:
+            self.append(accepted)
+        return records[reasons != ""].assign(reason=reasons[reasons != ""])
+
+    def update(self, ee_number, fields):
+        """Apply a whole field dict (core info, attributes, AVAIL-* or avail_mask) to one dealer."""
+        self.update_many(pd.DataFrame([fields], index=[str(ee_number)]))
+
+    def update_many(self, changes, skip_blank=False):
+        """Apply edits for many dealers at once.
+
+        `changes` is indexed by the dealers' current ee_number; its columns are the
+        fields to write. An ee_number column renames dealers. With skip_blank, NaN
+        and blank cells are left untouched, so a spreadsheet only changes the
+        cells it fills in. Returns the list of ee_numbers that were not found
+        (those rows are skipped).
+        """
+        with self._lock:
+            missing, old_keys, positions = self._apply(changes, skip_blank)
+            if len(positions) and self.db is not None:
+                self.db.save_dealers(old_keys, self._main.iloc[positions])
+            if len(positions):
+                self._saved(positions)
+        return missing
+
+    def log_uniform_returns(self, returns):
+        """Record uniform returns: iterable of (ee_number, return_date, items, confirm_id)."""
+        returns = list(returns)
+        changes = pd.DataFrame(
+            [(date, items, confirm) for _, date, items, confirm in returns],
+            index=[str(ee) for ee, _, _, _ in returns],
+            columns=["uniform_return_date", "uniform_return_items", "uniform_return_confirm_id"]
+        )
+        with self._lock:
+            missing, _, positions = self._apply(changes)
+            if self.db is not None:
+                self.db.log_uniform_returns(r for r in returns if str(r[0]) not in missing)
+            if len(positions):
+                self._saved(positions)
+        return missing
+
+    def _apply(self, changes, skip_blank=False):
+        changes = changes.copy()
+        changes.index = changes.index.astype(str)
+        found = changes.index.isin(list(self._positions))
+        missing = changes.index[~found].tolist()
+        changes = changes[found]
+        if changes.empty:
+            return missing, [], np.array([], dtype=np.int64)
+
+        # Edits write into the main table, so fold in any buffered additions first
+        self.compact()
+
+        if changes.index.duplicated().any():
+            raise ValueError("Each dealer can only appear once in a batch update.")
+
+        positions = np.fromiter((self._positions[ee] for ee in changes.index), dtype=np.int64, count=len(changes))
+        values = coerce_columns(changes)
+        written = filled_cells(changes[values.columns]) if skip_blank else None
+
+        renames = {}
+        if "ee_number" in values.columns:
+            keep = written["ee_number"] if skip_blank else [True] * len(values)
+            renames = {old: new for old, new, ok in zip(changes.index, values["ee_number"], keep) if ok and old != new}
+            self._check_renames(renames)
+
+        # One column-wise write per field instead of a df.at call per cell
+        # (df keeps a RangeIndex, so row labels are positions)
+        for col in values.columns:
+            if col not in self._main.columns:
+                self._main[col] = None
+            if skip_blank:
+                rows = written[col].to_numpy()
+                self._main.loc[positions[rows], col] = values[col].to_numpy()[rows]
+            else:
+                self._main.loc[positions, col] = values[col].to_numpy()
+
+        if any(col in changes.columns for col in AVAIL_COLUMNS):
+            set_bits, clear_bits = availability_bits(changes, skip_blank)
+            current = self._main["avail_mask"].to_numpy()[positions]
+            self._main.loc[positions, "avail_mask"] = (current & ~clear_bits) | set_bits
+
+        # Pop every old key before adding new ones so swaps and chains (A->B, B->C) resolve
+        moved = {new: self._positions.pop(old) for old, new in renames.items()}
+        self._positions.update(moved)
+
+        if any(col in SEARCH_FIELDS for col in values.columns):
+            for old in changes.index:
+                self.index.remove(old)
+            for pos in positions:
+                self.index.add(self._main.iloc[pos])
+
+        return missing, changes.index.tolist(), positions
+
+    def _check_renames(self, renames):
+        targets = list(renames.values())
+        if len(set(targets)) != len(targets):
+            raise ValueError("Two dealers cannot be given the same EE number.")
+        taken = [new for new in targets if new in self._positions and new not in renames]
+        if taken:
+            raise ValueError(f"EE number already in use: {', '.join(taken)}")
@@ -0,0 +1,111 @@
+# dealer/supply.py
+import numpy as np
+import pandas as pd
+
+from dealer.schema import DEALER_GROUPS, SHIFT_TYPES, weekday_bits
+
+# Supply axes; dealers with no shift/group value are counted under UNSET
+UNSET = "UNSET"
+SUPPLY_SHIFTS = SHIFT_TYPES + [UNSET]
+SUPPLY_GROUPS = DEALER_GROUPS + [UNSET]
+
+
+def _codes(series, categories):
+    codes = pd.Categorical(series.astype(object), categories=categories[:-1]).codes.astype(np.int64)
+    return np.where(codes < 0, len(categories) - 1, codes)
+
+
+class RosterSupply:
+    """Available dealers per date x shift_type x dealer_group over a date range.
+
+    A dealer counts on a date when its weekday bit is set in avail_mask and
+    the date is before removal_effective_date, after any temporary adjustments
+    (dealer.overrides.OverrideIndex) have been laid over that. A batch of
+    dealers is counted as a days x dealers availability grid plus a matching
+    grid of shift codes, binned into the (shift, group) cells with one
+    bincount. The per-dealer inputs are kept by row position, which lets
+    refresh() take back the old contribution of edited rows and add the new
+    one, and set_overrides() do the same for just the dealers whose overrides
+    changed.
+    """
+
+    def __init__(self, dealers, start, end, overrides=None):
+        self.dates = pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), freq="D")
+        self._bits = weekday_bits(self.dates)
+        self._days = self.dates.to_numpy()
+        self.counts = np.zeros((len(self.dates), len(SUPPLY_SHIFTS), len(SUPPLY_GROUPS)), dtype=np.int64)
+        self.overrides = overrides
+
+        self._ee = np.zeros(0, dtype=object)
+        self._shift = np.zeros(0, dtype=np.int64)
+        self._group = np.zeros(0, dtype=np.int64)
+        self._mask = np.zeros(0, dtype=np.uint8)
+        self._removal = np.zeros(0, dtype="datetime64[ns]")
+        self.refresh(dealers, np.arange(len(dealers)))
+
+    def covers(self, start, end):
+        return (
+            len(self.dates) > 0
+            and self.dates[0] == pd.Timestamp(start).normalize()
+            and self.dates[-1] == pd.Timestamp(end).normalize()
+        )
+
+    def _add(self, positions, sign):
+        if not len(positions):
+            return
+        available = (self._mask[positions][None, :] & self._bits[:, None]) != 0
+        shift = np.broadcast_to(self._shift[positions], available.shape).copy()
+        if self.overrides is not None:
+            self.overrides.overlay(available, shift, self._ee[positions], self.dates, SUPPLY_SHIFTS)
+        removal = self._removal[positions]
+        available &= np.isnat(removal)[None, :] | (removal[None, :] > self._days[:, None])
+
+        cells = len(SUPPLY_SHIFTS) * len(SUPPLY_GROUPS)
+        cell = shift * len(SUPPLY_GROUPS) + self._group[positions][None, :]
+        flat = np.arange(len(self.dates))[:, None] * cells + cell
+        binned = np.bincount(flat[available], minlength=len(self.dates) * cells)
+        self.counts += sign * binned.reshape(self.counts.shape)
+
+    def refresh(self, dealers, positions):
+        """Recount the dealers at these row positions of `dealers` (edited or newly added)."""
+        positions = np.asarray(positions, dtype=np.int64)
+        if not len(positions):
+            return
+        self._add(positions[positions < len(self._ee)], sign=-1)
+
+        grow = len(dealers) - len(self._ee)
+        if grow > 0:
+            self._ee = np.concatenate([self._ee, np.full(grow, "", dtype=object)])
+            self._shift = np.concatenate([self._shift, np.zeros(grow, dtype=np.int64)])
+            self._group = np.concatenate([self._group, np.zeros(grow, dtype=np.int64)])
+            self._mask = np.concatenate([self._mask, np.zeros(grow, dtype=np.uint8)])
+            self._removal = np.concatenate([self._removal, np.full(grow, np.datetime64("NaT"), dtype="datetime64[ns]")])
+
+        rows = dealers.iloc[positions]
+        self._ee[positions] = rows["ee_number"].astype(str).to_numpy(dtype=object)
+        self._shift[positions] = _codes(rows["shift_type"], SUPPLY_SHIFTS)
+        self._group[positions] = _codes(rows["dealer_group"], SUPPLY_GROUPS)
+        self._mask[positions] = rows["avail_mask"].to_numpy(dtype=np.uint8)
+        self._removal[positions] = rows["removal_effective_date"].to_numpy(dtype="datetime64[ns]")
+        self._add(positions, sign=1)
+
+    def set_overrides(self, overrides, ee_numbers):
+        """Swap in a new override layer, recounting only the dealers in ee_numbers.
+
+        ee_numbers must cover every dealer with an override added, removed or
+        changed between the old layer and the new one.
+        """
+        positions = np.flatnonzero(pd.Index(self._ee).isin(list(ee_numbers)))
+        self._add(positions, sign=-1)
+        self.overrides = overrides
+        self._add(positions, sign=1)
+
+    def available(self, shift=None, group=None):
+        """Dealers available per date (Series), summed over the given shift(s)/group(s) or all."""
+        def axis(keys, wanted):
+            if wanted is None:
+                return slice(None)
+            wanted = wanted if isinstance(wanted, (list, tuple)) else [wanted]
+            return [keys.index(w) for w in wanted]
+        cube = self.counts[:, axis(SUPPLY_SHIFTS, shift)][:, :, axis(SUPPLY_GROUPS, group)]
+        return pd.Series(cube.sum(axis=(1, 2)), index=self.dates)
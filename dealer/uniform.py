@@ -1,16 +1,108 @@
 import streamlit as st
 import pandas as pd
 import datetime
+import re
+
+from dealer.returns import (
+    AMBIGUOUS, BATCH_SIZE, QUEUED, RETURNED, UNIFORM_ITEMS, UNKNOWN, ReturnQueue, confirmation_ids,
+)
+from dealer.state import dealers_loaded, get_dealer_store, get_missing_returns, get_roster_timeline
+from exports import export_csv, shared_source
 
 def show_uniform_return():
     st.title("👕 Uniform Return")
 
-    if "dealer_df" not in st.session_state or st.session_state.dealer_df is None:
+    if not dealers_loaded():
         st.error("Dealer list not loaded. Please upload it on the import page.")
         return
 
-    df = st.session_state.dealer_df.copy()
+    store = get_dealer_store()
+
+    items = st.multiselect("Items returned:", UNIFORM_ITEMS, default=["Shirt"], key="uniform_items")
+    mode = st.radio("Mode:", ["Scan Queue", "Lookup"], horizontal=True, key="uniform_mode")
+    if not items:
+        st.warning("Pick at least one item to log returns.")
+    elif mode == "Scan Queue":
+        show_scan_queue(store, items)
+    else:
+        show_lookup(store, items)
+
+    show_missing_report()
 
+
+def show_scan_queue(store, items):
+    # -----------------------------------
+    # 📠 Scan Queue
+    # -----------------------------------
+    st.subheader("Scan Returns")
+    st.caption(
+        "Scan nametag or EE barcodes one after another (one per line), then queue them. "
+        f"The queue is logged in one batch, automatically once {BATCH_SIZE} dealers are waiting."
+    )
+    queue = st.session_state.setdefault("uniform_queue", ReturnQueue())
+
+    with st.form("uniform_scan", clear_on_submit=True):
+        codes = st.text_area("Scanned codes:", height=120)
+        queued = st.form_submit_button("➕ Queue Scans")
+
+    if queued and codes.strip():
+        results = queue.scan_many(store, [c for c in re.split(r"[\s,;]+", codes) if c], items)
+        unknown = [code for code, outcome, _ in results if outcome == UNKNOWN]
+        ambiguous = [(code, hits) for code, outcome, hits in results if outcome == AMBIGUOUS]
+        returned = [ee for _, outcome, ee in results if outcome == RETURNED]
+        added = sum(outcome == QUEUED for _, outcome, _ in results)
+        if added:
+            st.success(f"➕ {added} dealer(s) queued.")
+        if unknown:
+            st.warning(f"No dealer found for: {', '.join(unknown)}")
+        for code, hits in ambiguous:
+            st.warning(
+                f"Nametag {code} belongs to {len(hits)} dealers, nothing queued. "
+                f"Scan the EE barcode instead: {', '.join(store.index.labels(hits))}"
+            )
+        if returned:
+            st.info(f"Already returned: {', '.join(store.index.labels(returned))}")
+
+    if len(queue) >= BATCH_SIZE:
+        _commit(store, queue)
+
+    if len(queue):
+        st.dataframe(
+            pd.DataFrame({
+                "Dealer": [store.index.label(ee) if ee in store else ee for ee in queue.entries],
+                "Items": [", ".join(i) for i in queue.entries.values()],
+            }),
+            hide_index=True, use_container_width=True
+        )
+        col1, col2 = st.columns(2)
+        if col1.button(f"✅ Log {len(queue)} Return(s)"):
+            _commit(store, queue)
+            st.rerun()
+        if col2.button("🗑 Clear Queue"):
+            queue.clear()
+            st.rerun()
+
+    last = st.session_state.get("uniform_last_batch")
+    if last:
+        with st.expander(f"🧾 Last batch: {len(last)} return(s) logged"):
+            st.dataframe(
+                pd.DataFrame({
+                    "Dealer": [store.index.label(ee) for ee, _, _, _ in last],
+                    "Items": [items for _, _, items, _ in last],
+                    "Confirmation #": [confirm for _, _, _, confirm in last],
+                }),
+                hide_index=True, use_container_width=True
+            )
+
+
+def _commit(store, queue):
+    logged = queue.commit(store)
+    st.session_state.uniform_last_batch = logged
+    if logged:
+        st.success(f"🧾 {len(logged)} return(s) logged — Confirmation #{logged[0][3]} to #{logged[-1][3]}")
+
+
+def show_lookup(store, items):
     # -----------------------------------
     # 🔍 Dealer Lookup
     # -----------------------------------
@@ -18,87 +110,82 @@ def show_uniform_return():
     search_by = st.selectbox("Search by:", ["ee_number", "first_name", "last_name"])
     search_term = st.text_input(f"Enter {search_by}:")
 
-    match_df = pd.DataFrame()
-    if search_term:
-        mask = df[search_by].astype(str).str.contains(search_term, case=False, na=False)
-        match_df = df[mask]
+    index = store.index
+    matches = index.search(search_by, search_term) if search_term else []
 
-    if search_term and match_df.empty:
+    if search_term and not matches:
         st.warning("No matching dealers found.")
 
-    elif not match_df.empty:
-        match_df["label"] = match_df.apply(
-            lambda row: f"{row['last_name']}, {row['first_name']} (EE# {row['ee_number']})", axis=1
-        )
-        selected_label = st.selectbox("Select dealer:", match_df["label"])
-        selected_dealer = match_df[match_df["label"] == selected_label].iloc[0]
+    elif matches:
+        label_to_ee = dict(zip(index.labels(matches), matches))
+        selected_label = st.selectbox("Select dealer:", list(label_to_ee))
+        selected_dealer = store.row(label_to_ee[selected_label])
 
-        row_index = df[df["ee_number"].astype(str) == str(selected_dealer["ee_number"])].index[0]
-        already_returned = pd.notnull(selected_dealer.get("uniform_return_date")) and str(selected_dealer.get("uniform_return_date")).strip()
+        already_returned = bool(selected_dealer["uniform_return_date"])
 
         if already_returned:
-            confirm_id = selected_dealer.get("uniform_return_confirm_id", "N/A")
-            return_date = selected_dealer.get("uniform_return_date", "N/A")
-            st.success(f"✅ Shirt was already returned on {return_date} — Confirmation #{confirm_id}")
+            confirm_id = selected_dealer["uniform_return_confirm_id"] or "N/A"
+            return_date = selected_dealer["uniform_return_date"]
+            returned_items = selected_dealer["uniform_return_items"] or "Uniform"
+            st.success(f"✅ {returned_items} already returned on {return_date} — Confirmation #{confirm_id}")
         else:
             st.markdown("### Selected Dealer Info")
             col1, col2, col3 = st.columns(3)
             col1.markdown(f"**Name:** {selected_dealer['first_name']} {selected_dealer['last_name']}")
             col2.markdown(f"**EE Number:** {selected_dealer['ee_number']}")
-            col3.markdown(f"**Shift Type:** {selected_dealer.get('shift_type', 'N/A')}")
+            col3.markdown(f"**Shift Type:** {selected_dealer['shift_type'] if pd.notna(selected_dealer['shift_type']) else 'N/A'}")
 
-            removal_date = selected_dealer.get("removal_effective_date", "")
-            if removal_date and str(removal_date).strip():
-                st.info(f"⚠️ This dealer is marked for removal on {removal_date}.")
+            removal_date = selected_dealer["removal_effective_date"]
+            if pd.notna(removal_date) and removal_date.date() <= datetime.date.today():
+                st.info(f"⚠️ This dealer was removed from the roster on {removal_date.date().isoformat()}.")
+            elif pd.notna(removal_date):
+                st.info(f"⚠️ This dealer is marked for removal on {removal_date.date().isoformat()}.")
 
             # ✅ Return Form with unique key
             form_key = f"uniform_return_form_{selected_dealer['ee_number']}"
             with st.form(key=form_key):
-                submitted = st.form_submit_button("✅ Confirm Shirt Return")
+                submitted = st.form_submit_button(f"✅ Confirm Return ({', '.join(items)})")
                 if submitted:
-                    for col in ["uniform_return_date", "uniform_return_items", "uniform_return_confirm_id"]:
-                        if col not in df.columns:
-                            df[col] = ""
-
-                    confirm_id = pd.to_datetime("now").strftime("%m%d%H%M")
+                    confirm_id = confirmation_ids(1, db=store.db)[0]
                     return_date = datetime.date.today().isoformat()
 
-                    df.at[row_index, "uniform_return_date"] = return_date
-                    df.at[row_index, "uniform_return_items"] = "Shirt"
-                    df.at[row_index, "uniform_return_confirm_id"] = confirm_id
-
-                    st.session_state.dealer_df = df
-                    st.success(f"🧾 Shirt return logged — Confirmation #{confirm_id}")
+                    store.log_uniform_returns([(selected_dealer["ee_number"], return_date, ", ".join(items), confirm_id)])
+                    st.success(f"🧾 Return logged — Confirmation #{confirm_id}")
                     st.rerun()
 
+
+def show_missing_report():
     # -----------------------------------
     # 📋 Missing Shirt Return Report
     # -----------------------------------
     st.markdown("---")
     st.subheader("📝 Missing Uniform Returns")
 
-    show_removed = st.checkbox("Include removed dealers", value=False)
-    report_df = st.session_state.dealer_df.copy()
-
-    if not show_removed and "removal_effective_date" in report_df.columns:
-        report_df = report_df[report_df["removal_effective_date"].isna()]
+    col1, col2 = st.columns(2)
+    as_of = col1.date_input("Roster as of:", value=datetime.date.today(), key="uniform_as_of")
+    show_removed = col2.checkbox("Include removed dealers", value=False)
 
-    for col in ["uniform_return_date", "uniform_return_items"]:
-        if col not in report_df.columns:
-            report_df[col] = ""
+    # Dealers whose removal date is after as_of are still on the roster that day
+    # The owing flags are kept up to date per logged return, not recomputed per rerun
+    roster = get_roster_timeline()
+    missing = get_missing_returns()
+    missing_df = missing.report(roster, as_of, include_removed=show_removed)
 
-    missing_df = report_df[
-        (report_df["uniform_return_date"] == "") &
-        (report_df["uniform_return_items"] == "")
-    ]
+    leaving = roster.removed_between(as_of, pd.Timestamp(as_of) + pd.Timedelta(days=14))
+    leaving_owing = missing.count_among(leaving)
+    if leaving_owing:
+        st.info(f"⚠️ {leaving_owing} dealer(s) leaving in the 14 days after {as_of} still owe a shirt.")
 
     if missing_df.empty:
         st.success("✅ All dealers have logged their shirt return.")
     else:
         st.caption(f"{len(missing_df)} dealer(s) have not returned their shirt.")
         st.dataframe(
-            missing_df[["first_name", "last_name", "ee_number", "shift_type", "dealer_group"]],
+            missing_df[["first_name", "last_name", "ee_number", "shift_type", "dealer_group", "removal_effective_date"]],
             use_container_width=True
         )
-        csv = missing_df.to_csv(index=False).encode("utf-8")
-        st.download_button("📥 Download Report", data=csv, file_name="missing_shirt_returns.csv", mime="text/csv")
\ No newline at end of file
+        # Written once per roster version and as-of date, then served from the export cache
+        path = export_csv(shared_source(), "missing_uniform_returns", as_of=as_of, include_removed=show_removed)
+        with open(path, "rb") as f:
+            st.download_button("📥 Download Report", data=f, file_name="missing_shirt_returns.csv",
+                               mime="text/csv")
\ No newline at end of file
@@ -0,0 +1,258 @@
+# diagnostics.py
+"""Opt-in timing and memory diagnostics for the app.
+
+Set DMS_DIAGNOSTICS=1 before `streamlit run main.py` to turn it on. main.py
+wraps each rerun's page in rerun(); engine and state code marks its expensive
+steps with section("parse" | "enrich" | "aggregate" | ...). Page time outside
+any marked section is reported as "render". The sidebar panel shows rerun
+counts, per-section timings and the size of every frame held in memory, exports
+the collected spans as a Chrome trace (chrome://tracing, Perfetto) and can
+capture one rerun under cProfile.
+
+Most frames live in the process-wide caches of the state modules, which
+register them with register_cache(); cache_frames() finds the frames inside
+those entries (stores, timelines, rollups, ...) so the panel can size them
+next to whatever the current session keeps in st.session_state.
+
+Without the variable section() hands back a shared no-op context manager, so
+the marks cost one attribute lookup. Streamlit is only imported by the panel;
+the rest is safe to use from headless code.
+"""
+import cProfile
+import io
+import json
+import marshal
+import os
+import pstats
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+
+ENABLED = os.environ.get("DMS_DIAGNOSTICS", "").strip().lower() in ("1", "true", "yes", "on")
+MAX_SPANS = 5000
+PROFILE_LINES = 40
+RENDER = "render"
+# How far cache_frames() looks into cached objects, and the largest dict it walks
+WALK_DEPTH = 4
+WALK_ENTRIES = 64
+
+_NOOP = nullcontext()
+_active = threading.local()  # Streamlit runs each session's script on its own thread
+_CACHES = {}
+
+
+class Trace:
+    """Timed spans of one browser session: (rerun, page, section, start, duration, depth).
+
+    Spans are kept in a bounded deque so a long shift on the floor doesn't grow
+    the session without limit; rerun counts are kept separately and never drop.
+    """
+
+    def __init__(self, max_spans=MAX_SPANS):
+        self.reruns = 0
+        self.page_reruns = Counter()
+        self.spans = deque(maxlen=max_spans)
+        self.profile_next = False
+        self.profile_text = None
+        self.profile_stats = None
+        self._page = None
+        self._depth = 0
+
+    @contextmanager
+    def section(self, name):
+        depth = self._depth
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.spans.append((self.reruns, self._page, name, start, time.perf_counter() - start, depth))
+
+    def last_rerun(self):
+        """Spans of the most recent rerun, with the page's unmarked time as "render"."""
+        spans = [span for span in self.spans if span[0] == self.reruns]
+        rows = [{"section": name, "ms": round(dur * 1000, 1)} for _, _, name, _, dur, depth in spans if depth > 0]
+        page = next((span for span in spans if span[5] == 0), None)
+        if page is not None:
+            marked = sum(dur for *_, dur, depth in spans if depth == 1)
+            rows.append({"section": RENDER, "ms": round((page[4] - marked) * 1000, 1)})
+            rows.append({"section": f"total ({page[1]})", "ms": round(page[4] * 1000, 1)})
+        return rows
+
+    def summary(self):
+        """Calls, mean and max ms per (page, section) over every span still held."""
+        totals = {}
+        for _, page, name, _, dur, depth in self.spans:
+            key = (page, name if depth else "page total")
+            calls, total, worst = totals.get(key, (0, 0.0, 0.0))
+            totals[key] = (calls + 1, total + dur, max(worst, dur))
+        return [
+            {"page": page, "section": name, "calls": calls,
+             "mean_ms": round(total / calls * 1000, 1), "max_ms": round(worst * 1000, 1)}
+            for (page, name), (calls, total, worst) in sorted(totals.items(), key=lambda item: -item[1][1])
+        ]
+
+    def chrome_trace(self):
+        """The spans as Chrome trace-event JSON (one thread per rerun)."""
+        origin = self.spans[0][3] if self.spans else 0.0
+        events = [
+            {"name": name, "cat": page or "", "ph": "X", "pid": 1, "tid": rerun,
+             "ts": round((start - origin) * 1e6), "dur": round(dur * 1e6)}
+            for rerun, page, name, start, dur, _ in self.spans
+        ]
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+def section(name):
+    """Time a block under the current rerun's page; a no-op when diagnostics are off."""
+    trace = getattr(_active, "trace", None)
+    return _NOOP if trace is None else trace.section(name)
+
+
+def register_cache(name, cache):
+    """Make a process-wide cache dict visible to cache_frames(). Returns the dict."""
+    _CACHES[name] = cache
+    return cache
+
+
+def _is_frame(value):
+    # DataFrames, Series, indexes and arrays; not numpy scalars (shape ())
+    return bool(getattr(value, "shape", ())) and (hasattr(value, "memory_usage") or hasattr(value, "nbytes"))
+
+
+def _walk(value, label, depth, seen, out):
+    if id(value) in seen:
+        return
+    seen.add(id(value))
+    if _is_frame(value):
+        out[label] = value
+    elif depth >= WALK_DEPTH:
+        return
+    elif isinstance(value, dict):
+        if len(value) <= WALK_ENTRIES:
+            for key, item in list(value.items()):
+                _walk(item, f"{label}[{key}]", depth + 1, seen, out)
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value[:WALK_ENTRIES]):
+            _walk(item, f"{label}[{i}]", depth + 1, seen, out)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        for attr, item in list(vars(value).items()):
+            _walk(item, f"{label}.{attr}", depth + 1, seen, out)
+
+
+def cache_frames():
+    """{label: frame or array} found in the registered caches, each object once.
+
+    Labels read like "dealer.state._TIMELINE[2].dealers"; the database path key is
+    left out unless a cache holds entries for more than one database.
+    """
+    out, seen = {}, set()
+    for name, cache in list(_CACHES.items()):
+        entries = list(cache.items())
+        for key, value in entries:
+            label = f"{name}[{os.path.basename(str(key))}]" if len(entries) > 1 else name
+            _walk(value, label, 0, seen, out)
+    return out
+
+
+def frame_footprint(state):
+    """[{key, type, rows, mb}] for every DataFrame, Series or array in a mapping, largest first."""
+    rows = []
+    for key, value in state.items():
+        if hasattr(value, "memory_usage") and hasattr(value, "shape"):
+            used = value.memory_usage(deep=True)
+            size = int(used.sum()) if hasattr(used, "sum") else int(used)
+        elif hasattr(value, "nbytes") and hasattr(value, "shape"):
+            size = int(value.nbytes)
+        else:
+            continue
+        rows.append({"key": str(key), "type": type(value).__name__, "rows": len(value), "mb": size / 2**20})
+    rows.sort(key=lambda row: -row["mb"])
+    for row in rows:
+        row["mb"] = round(row["mb"], 2)
+    return rows
+
+
+def _session_trace():
+    import streamlit as st
+
+    trace = st.session_state.get("_diagnostics")
+    if trace is None:
+        trace = st.session_state["_diagnostics"] = Trace()
+    return trace
+
+
+@contextmanager
+def rerun(page):
+    """Wrap one rerun's page: counts it, times it and runs cProfile when armed."""
+    if not ENABLED:
+        yield
+        return
+    trace = _session_trace()
+    trace.reruns += 1
+    trace.page_reruns[page] += 1
+    trace._page = page
+    trace._depth = 0  # the page span; marked sections nest below it
+    profiler = None
+    if trace.profile_next:
+        trace.profile_next = False
+        profiler = cProfile.Profile()
+        profiler.enable()
+    _active.trace = trace
+    try:
+        with trace.section(page):
+            yield
+    finally:
+        _active.trace = None
+        if profiler is not None:
+            profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+            profiler.create_stats()
+            trace.profile_text = f"{page} (rerun {trace.reruns})\n{out.getvalue()}"
+            trace.profile_stats = marshal.dumps(profiler.stats)  # pstats .prof file contents
+
+
+def show_diagnostics_panel():
+    """Sidebar expander with the session's timings, cache and session frame sizes, trace export and profiler."""
+    if not ENABLED:
+        return
+    import streamlit as st
+
+    trace = _session_trace()
+    with st.sidebar.expander("🩺 Diagnostics"):
+        st.caption(f"{trace.reruns} rerun(s) this session")
+        if trace.page_reruns:
+            st.dataframe([{"page": page, "reruns": n} for page, n in trace.page_reruns.most_common()],
+                         hide_index=True, use_container_width=True)
+
+        st.markdown("**Last rerun**")
+        st.dataframe(trace.last_rerun(), hide_index=True, use_container_width=True)
+        st.markdown("**All reruns**")
+        st.dataframe(trace.summary(), hide_index=True, use_container_width=True)
+
+        cached = frame_footprint(cache_frames())
+        st.markdown(f"**Shared cache frames** ({sum(row['mb'] for row in cached):.1f} MB, all sessions)")
+        if cached:
+            st.dataframe(cached, hide_index=True, use_container_width=True)
+        else:
+            st.caption("Nothing cached yet.")
+
+        frames = frame_footprint(st.session_state)
+        st.markdown(f"**Session frames** ({sum(row['mb'] for row in frames):.1f} MB)")
+        if frames:
+            st.dataframe(frames, hide_index=True, use_container_width=True)
+        else:
+            st.caption("No frames held in this session.")
+
+        st.download_button("⬇️ Export trace", trace.chrome_trace(), file_name="dms_trace.json",
+                           mime="application/json", key="_diagnostics_trace")
+        if st.button("⏱ Profile a rerun", key="_diagnostics_profile"):
+            trace.profile_next = True
+            st.rerun()
+        if trace.profile_text:
+            st.code(trace.profile_text, language=None)
+            st.download_button("⬇️ Profile (.prof)", trace.profile_stats, file_name="dms_rerun.prof",
+                               key="_diagnostics_prof")
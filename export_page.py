@@ -0,0 +1,67 @@
+# export_page.py
+import datetime
+
+import streamlit as st
+
+from dealer.state import dealers_loaded
+from exports import REPORTS, export_csv, export_xlsx, shared_source
+from tournament.state import tournaments_loaded
+
+FORMATS = ["XLSX (one sheet per report)", "CSV (one file per report)"]
+
+
+def show_export_page():
+    st.title("📤 Report Exports")
+
+    loaded = {"dealers": dealers_loaded(), "tournaments": tournaments_loaded()}
+    available = [name for name, (_, table, _) in REPORTS.items() if loaded[table]]
+    if not available:
+        st.error("Nothing to export yet. Please import the dealer list or tournament schedule first.")
+        return
+
+    selected = st.multiselect(
+        "Reports:", available, default=available, format_func=lambda name: REPORTS[name][0], key="export_reports"
+    )
+    col1, col2, col3 = st.columns(3)
+    as_of = col1.date_input("Roster as of:", value=datetime.date.today(), key="export_as_of")
+    include_removed = col2.checkbox("Include removed dealers in missing returns", key="export_removed")
+    fmt = col3.radio("Format:", FORMATS, key="export_format")
+    st.caption("Restart-adjusted projections use the default taper. Exports are reused until the data changes.")
+
+    if not selected:
+        st.info("Pick at least one report.")
+        return
+
+    # Build on request; once prepared, reruns with the same choices are served from the export cache
+    request = (tuple(selected), as_of, include_removed, fmt)
+    if st.button("🛠 Prepare Export"):
+        st.session_state.export_request = request
+    if st.session_state.get("export_request") != request:
+        return
+
+    source = shared_source()
+    options = {"as_of": as_of, "include_removed": include_removed}
+
+    def prepare():
+        if fmt == FORMATS[0]:
+            return [(export_xlsx(source, selected, **options), f"dms_reports_{as_of}.xlsx",
+                     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")]
+        return [(export_csv(source, name, **options), f"{name}_{as_of}.csv", "text/csv") for name in selected]
+
+    with st.spinner("Writing export..."):
+        try:
+            files = _read(prepare())
+        except FileNotFoundError:
+            # Another session's export pruned it before it was read; asking again writes it anew
+            files = _read(prepare())
+
+    for data, file_name, mime in files:
+        st.download_button(f"📥 {file_name}", data=data, file_name=file_name, mime=mime, key=f"export_{file_name}")
+
+
+def _read(paths):
+    files = []
+    for path, file_name, mime in paths:
+        with open(path, "rb") as f:
+            files.append((f.read(), file_name, mime))
+    return files
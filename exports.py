@@ -0,0 +1,298 @@
+# exports.py
+"""Report exports: CSV and multi-sheet XLSX written in chunks, cached by data version.
+
+    path = export_xlsx(ReportSource(db), ["roster", "daily_forecast"], as_of="2026-06-01")
+    path = export_csv(shared_source(), "missing_uniform_returns", as_of=today)
+
+Report builders yield the report in CHUNK_ROWS slices: the dealer reports pick
+their row positions from the roster and take one slice of rows at a time, so
+no second full-size frame is built next to the roster the source already
+holds. The forecast reports are aggregates (a row per day, week or restart
+flight) and are built whole, then sliced. CSV slices go straight to the file
+and XLSX uses openpyxl's write-only workbook, so neither the CSV text nor the
+workbook is held in memory. Files land in CACHE_DIR under a key made of the
+database, the reports, the options and the version of each table they read
+(RosterDB meta), so downloading the same export again before the data changes
+serves the file already written.
+
+Serving a download is not constant-memory: st.download_button hands the whole
+file to Streamlit's media manager, so pages offer the cached file for
+download only after it is prepared.
+
+Engine only: pages use shared_source() (the process-wide state caches) and
+manage.py uses ReportSource on a RosterDB.
+"""
+import hashlib
+import json
+import os
+import threading
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from dealer.roster import RosterTimeline, missing_uniform_returns, owes_uniform
+from dealer.schema import TEXT_COLUMNS, UNIFORM_COLUMNS
+from tournament.enrich import enrich_tournaments
+from tournament.reports import daily_forecast, restart_adjusted, weekly_forecast
+from tournament.rollup import DealerRollup
+
+# ---- EXPORT SETTINGS ----
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "exports")
+MAX_ENTRIES = 32
+CHUNK_ROWS = 5000
+
+DEALER_EXPORT_COLUMNS = TEXT_COLUMNS + ["ft_pt", "shift_type", "dealer_group", "removal_effective_date"]
+
+
+class ReportSource:
+    """The inputs reports are built from, each loaded on first use.
+
+    By default everything is read from the RosterDB; pass zero-argument
+    callables to reuse frames that are already built (see shared_source()).
+    """
+
+    def __init__(self, db, roster=None, tournaments=None, rollup=None):
+        self.db = db
+        self._roster = roster or (lambda: RosterTimeline(db.load_dealers()))
+        self._tournaments = tournaments or (lambda: enrich_tournaments(db.load_tournaments()))
+        self._rollup = rollup or (lambda: DealerRollup(self.tournaments))
+
+    @cached_property
+    def roster(self):
+        return self._roster()
+
+    @cached_property
+    def tournaments(self):
+        return self._tournaments()
+
+    @cached_property
+    def rollup(self):
+        return self._rollup()
+
+    def version(self, table):
+        return self.db.version(table)
+
+
+def shared_source():
+    """ReportSource over the process-wide dealer store and tournament caches (app pages)."""
+    from dealer.state import get_roster_timeline
+    from roster_db import get_roster_db
+    from tournament.state import get_enriched_tournaments, get_rollup
+
+    return ReportSource(
+        get_roster_db(), roster=get_roster_timeline, tournaments=get_enriched_tournaments, rollup=get_rollup
+    )
+
+
+# ---- reports ----
+# Builders yield frames of at most CHUNK_ROWS rows, always at least one (maybe empty)
+def _take(frame, positions, columns):
+    """`columns` of frame's rows at `positions`, CHUNK_ROWS positions at a time."""
+    cols = frame.columns.get_indexer(columns)
+    for start in range(0, max(len(positions), 1), CHUNK_ROWS):
+        yield frame.iloc[positions[start:start + CHUNK_ROWS], cols]
+
+
+def _chunks(frame):
+    for start in range(0, max(len(frame), 1), CHUNK_ROWS):
+        yield frame.iloc[start:start + CHUNK_ROWS]
+
+
+def roster_report(source, as_of, **_):
+    roster = source.roster
+    yield from _take(roster.dealers, np.sort(roster.positions_on(as_of)), DEALER_EXPORT_COLUMNS)
+
+
+def removals_report(source, as_of, **_):
+    dealers = source.roster.dealers
+    removal = dealers["removal_effective_date"].to_numpy(dtype="datetime64[ns]")
+    positions = np.flatnonzero(~np.isnat(removal))
+    positions = positions[np.argsort(removal[positions], kind="stable")]
+    cutoff = pd.Timestamp(as_of).to_datetime64()
+    for start in range(0, max(len(positions), 1), CHUNK_ROWS):
+        chunk = positions[start:start + CHUNK_ROWS]
+        rows = dealers.iloc[chunk]
+        out = rows[DEALER_EXPORT_COLUMNS].copy()
+        out["status"] = np.where(removal[chunk] <= cutoff, "Removed", "Scheduled")
+        out["owes_uniform"] = owes_uniform(rows)
+        yield out
+
+
+def uniform_status_report(source, as_of, **_):
+    roster = source.roster
+    dealers = roster.dealers
+    on_roster = roster.mask_on(as_of)
+    for start in range(0, max(len(dealers), 1), CHUNK_ROWS):
+        rows = dealers.iloc[start:start + CHUNK_ROWS]
+        out = rows[DEALER_EXPORT_COLUMNS + UNIFORM_COLUMNS].copy()
+        out["on_roster"] = on_roster[start:start + CHUNK_ROWS]
+        out["returned"] = ~owes_uniform(rows)
+        yield out
+
+
+def missing_returns_report(source, as_of, include_removed=False, **_):
+    roster = source.roster
+    owing = owes_uniform(roster.dealers)
+    positions = np.flatnonzero(owing if include_removed else owing & roster.mask_on(as_of))
+    yield from _take(roster.dealers, positions, DEALER_EXPORT_COLUMNS)
+
+
+def daily_forecast_report(source, **_):
+    yield from _chunks(daily_forecast(source.rollup))
+
+
+def weekly_forecast_report(source, **_):
+    yield from _chunks(weekly_forecast(daily_forecast(source.rollup)))
+
+
+def restart_adjusted_report(source, curves=None, **_):
+    yield from _chunks(restart_adjusted(source.tournaments, curves))
+
+
+# name -> (sheet title, table whose version the report depends on, builder)
+REPORTS = {
+    "roster": ("Roster", "dealers", roster_report),
+    "removals": ("Removals", "dealers", removals_report),
+    "uniform_status": ("Uniform Status", "dealers", uniform_status_report),
+    "missing_uniform_returns": ("Missing Uniform Returns", "dealers", missing_returns_report),
+    "daily_forecast": ("Daily Forecast", "tournaments", daily_forecast_report),
+    "weekly_forecast": ("Weekly Forecast", "tournaments", weekly_forecast_report),
+    "restart_adjusted": ("Restart Adjusted", "tournaments", restart_adjusted_report),
+}
+
+
+def build_report(source, name, **options):
+    """One report as a single frame (not cached; export_* write and cache files)."""
+    return pd.concat(list(REPORTS[name][2](source, **_options(**options))), ignore_index=True)
+
+
+# ---- writers ----
+def write_csv(chunks, path):
+    """Write a report's chunks (an iterable of frames) as one CSV file."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, index=False, header=i == 0)
+
+
+def _cells(chunk):
+    values = chunk.astype(object)
+    return values.where(chunk.notna(), None).itertuples(index=False, name=None)
+
+
+def write_xlsx(sheets, path):
+    """Write [(title, chunks)] as one workbook, streaming rows through write-only sheets.
+
+    `sheets` and each sheet's chunks may be generators; only one chunk is held at a time.
+    """
+    workbook = Workbook(write_only=True)
+    for title, chunks in sheets:
+        sheet = workbook.create_sheet(title[:31])
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                sheet.append([str(col) for col in chunk.columns])
+            for row in _cells(chunk):
+                sheet.append(row)
+    workbook.save(path)
+
+
+# ---- cache ----
+class ExportCache:
+    """Export files on disk keyed by content (reports, options, data versions).
+
+    Files are written to a temp name and renamed into place, so a concurrent
+    request for the same export never reads a half-written file. The oldest
+    files beyond max_entries are removed; a file another session pruned in
+    the meantime is simply a miss.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_entries=MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, **parts):
+        text = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+    def fetch(self, key, ext, write):
+        """Path of the cached export, calling write(path) to create it on a miss."""
+        path = os.path.join(self.cache_dir, f"{key}.{ext}")
+        try:
+            os.utime(path)  # keep recently used exports through pruning
+        except FileNotFoundError:
+            pass
+        else:
+            with self._lock:
+                self.hits += 1
+            return path
+        with self._lock:
+            self.misses += 1
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            write(temp)
+            os.replace(temp, path)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+        self._prune()
+        return path
+
+    def _prune(self):
+        stamped = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith((".csv", ".xlsx")):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stamped.append((os.path.getmtime(path), path))
+                except FileNotFoundError:
+                    continue  # another thread pruned it first
+        stamped.sort()
+        for _, path in stamped[:max(0, len(stamped) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+
+
+EXPORT_CACHE = ExportCache()
+
+
+def _options(as_of=None, include_removed=False, curves=None):
+    as_of = pd.Timestamp(as_of if as_of is not None else pd.Timestamp.today()).normalize()
+    return {"as_of": as_of, "include_removed": bool(include_removed), "curves": curves}
+
+
+def _versions(source, names):
+    return {table: source.version(table) for table in sorted({REPORTS[name][1] for name in names})}
+
+
+def export_csv(source, name, cache=EXPORT_CACHE, **options):
+    """Path of `name` as a CSV file for the current data, written only if not cached."""
+    if name not in REPORTS:
+        raise ValueError(f"Unknown report: {name}")
+    options = _options(**options)
+    key = cache.key(database=(source.db.path, source.db.instance), reports=[name], format="csv", options=options,
+                    versions=_versions(source, [name]))
+    return cache.fetch(key, "csv", lambda path: write_csv(REPORTS[name][2](source, **options), path))
+
+
+def export_xlsx(source, names, cache=EXPORT_CACHE, **options):
+    """Path of a workbook with one sheet per report in `names`, written only if not cached."""
+    unknown = [name for name in names if name not in REPORTS]
+    if unknown or not names:
+        raise ValueError(f"Unknown report(s): {', '.join(unknown)}" if unknown else "No reports selected.")
+    options = _options(**options)
+    key = cache.key(database=(source.db.path, source.db.instance), reports=list(names), format="xlsx", options=options,
+                    versions=_versions(source, names))
+
+    def sheets():
+        for name in names:
+            title, _, build = REPORTS[name]
+            yield title, build(source, **options)
+
+    return cache.fetch(key, "xlsx", lambda path: write_xlsx(sheets(), path))
@@ -1,43 +1,62 @@
 import streamlit as st
-import pandas as pd
 
-# ---- HARD-CODED SCHEMA ----
-DEALER_COLUMNS = [
-    "first_name", "last_name", "nametag_id", "ee_number", "email", "phone", "ft_pt", "shift_type",
-    "dealer_group", "AVAIL-SUN", "AVAIL-MON", "AVAIL-TUE", "AVAIL-WED",
-    "AVAIL-THU", "AVAIL-FRI", "AVAIL-SAT"
-]
+from parse_cache import PARSE_CACHE, parse_upload
+from dealer.schema import DEALER_COLUMNS, extra_columns, key_problems, normalize_dealers, unmapped_counts
+from roster_db import get_roster_db
+from scheduler.schedule import normalize_employee_schedule
+from tournament.enrich import TOURNAMENT_COLUMNS
 
-TOURNAMENT_COLUMNS = [
-    "Date", "Time", "Event Number", "Event Name",
-    "Buy-in Amount", "Starting Chips", "Projection", "Longest Break (Dinner Break)"
-]
 
 def show_import_page():
     st.title("📥 Import Dealer System Data")
     st.markdown("Upload all applicable files. You may proceed without some, but certain features will be disabled.")
 
-    # Initialize placeholders
-    if "dealer_df" not in st.session_state:
-        st.session_state.dealer_df = None
-    if "tournament_df" not in st.session_state:
-        st.session_state.tournament_df = None
-    if "employee_df" not in st.session_state:
-        st.session_state.employee_df = None
+    # Dealers and tournaments live in the shared roster database, so a restart
+    # (or another supervisor's session) picks up where the last upload left off
+    db = get_roster_db()
+    saved_dealers = db.count("dealers")
+    saved_tournaments = db.count("tournaments")
+    saved_shifts = db.count("employee_shifts")
+    if saved_dealers or saved_tournaments or saved_shifts:
+        st.info(
+            f"💾 Saved data found: {saved_dealers} dealer(s), {saved_tournaments} tournament row(s), "
+            f"{saved_shifts} employee shift(s). "
+            "Proceed to keep using it, or upload new files to replace it."
+        )
 
     # ---- Dealer Upload ----
     st.subheader("🧍 Dealer List")
     dealer_file = st.file_uploader("Upload Dealer List (.csv or .xlsx)", type=["csv", "xlsx"], key="dealer")
     if dealer_file:
         try:
-            df = pd.read_csv(dealer_file) if dealer_file.name.endswith(".csv") else pd.read_excel(dealer_file)
-            missing = [col for col in DEALER_COLUMNS if col not in df.columns]
+            df, missing = parse_upload(dealer_file, "dealer", DEALER_COLUMNS)
             if missing:
                 st.error(f"Missing columns: {', '.join(missing)}")
             else:
                 st.success("✅ Dealer List uploaded successfully.")
-                st.session_state.dealer_df = df
                 st.dataframe(df.head())
+                df = normalize_dealers(df)
+                unmapped = unmapped_counts(df)
+                if unmapped:
+                    details = ", ".join(f"{col}: {n}" for col, n in unmapped.items())
+                    st.warning(f"Some values could not be recognized and were left blank ({details}).")
+                reasons = key_problems(df)
+                skipped = reasons != ""
+                if skipped.any():
+                    st.warning(f"{int(skipped.sum())} row(s) were skipped; every dealer needs its own EE number.")
+                    st.dataframe(
+                        df.loc[skipped, ["first_name", "last_name", "ee_number", "nametag_id"]]
+                        .assign(row=df.index[skipped] + 2, reason=reasons[skipped]),
+                        use_container_width=True
+                    )
+                    df = df[~skipped].reset_index(drop=True)
+                extra = extra_columns(df)
+                if extra:
+                    st.warning(f"These columns are not saved with the dealer list: {', '.join(extra)}.")
+                # Only write when a different file is uploaded, not on every rerun
+                if st.session_state.get("dealer_upload_id") != dealer_file.file_id:
+                    db.replace_dealers(df)
+                    st.session_state.dealer_upload_id = dealer_file.file_id
         except Exception as e:
             st.error(f"Error loading Dealer List: {e}")
 
@@ -46,29 +65,53 @@ def show_import_page():
     tourney_file = st.file_uploader("Upload Tournament Schedule (.csv or .xlsx)", type=["csv", "xlsx"], key="tourney")
     if tourney_file:
         try:
-            df = pd.read_csv(tourney_file) if tourney_file.name.endswith(".csv") else pd.read_excel(tourney_file)
-            missing = [col for col in TOURNAMENT_COLUMNS if col not in df.columns]
+            df, missing = parse_upload(tourney_file, "tournament", TOURNAMENT_COLUMNS)
             if missing:
                 st.error(f"Missing columns: {', '.join(missing)}")
             else:
                 st.success("✅ Tournament Schedule uploaded successfully.")
-                st.session_state.tournament_df = df
+                if st.session_state.get("tourney_upload_id") != tourney_file.file_id:
+                    db.replace_tournaments(df)
+                    st.session_state.tourney_upload_id = tourney_file.file_id
                 st.dataframe(df.head())
         except Exception as e:
             st.error(f"Error loading Tournament Schedule: {e}")
 
-    # ---- Employee Upload (No Schema Yet) ----
+    # ---- Employee Upload ----
     st.subheader("👥 Employee Schedule")
+    st.caption(
+        "One row per dealer with an ee_number column and one column per date. Cells hold the shift "
+        "(\"10:00-18:00\", \"7 PM - 3 AM\", DAY or SWING); leave blank or write OFF for days off."
+    )
     employee_file = st.file_uploader("Upload Employee Schedule (.csv or .xlsx)", type=["csv", "xlsx"], key="employee")
     if employee_file:
         try:
-            df = pd.read_csv(employee_file) if employee_file.name.endswith(".csv") else pd.read_excel(employee_file)
-            st.success("✅ Employee Schedule uploaded.")
-            st.session_state.employee_df = df
-            st.dataframe(df.head())
+            raw, missing = parse_upload(employee_file, "employee", ["ee_number"])
+            if missing:
+                st.error(f"Missing columns: {', '.join(missing)}")
+            else:
+                shifts, unparsed = normalize_employee_schedule(raw)
+                st.success(
+                    f"✅ Employee Schedule uploaded: {len(shifts)} shift(s) for "
+                    f"{shifts['ee_number'].nunique()} dealer(s)."
+                )
+                if len(unparsed):
+                    st.warning(f"{len(unparsed)} cell(s) could not be read as a shift and were skipped.")
+                    st.dataframe(unparsed.head(50))
+                if st.session_state.get("employee_upload_id") != employee_file.file_id:
+                    db.replace_shifts(shifts)
+                    st.session_state.employee_upload_id = employee_file.file_id
+                st.dataframe(shifts.head())
         except Exception as e:
             st.error(f"Error loading Employee Schedule: {e}")
 
+    # ---- Parse Cache Stats ----
+    stats = PARSE_CACHE.stats()
+    st.caption(
+        f"Parse cache: {stats['hits']} hits, {stats['misses']} misses, "
+        f"{stats['entries']}/{stats['max_entries']} entries"
+    )
+
     # ---- Continue Button ----
     st.divider()
     if st.button("Proceed to System"):
@@ -76,10 +119,10 @@ def show_import_page():
         st.rerun()
 
     # ---- Warning if Missing ----
-    if st.session_state.dealer_df is None or st.session_state.tournament_df is None:
+    if not db.count("dealers") or not db.count("tournaments"):
         missing = []
-        if not st.session_state.dealer_df:
+        if not db.count("dealers"):
             missing.append("Dealer List")
-        if not st.session_state.tournament_df:
+        if not db.count("tournaments"):
             missing.append("Tournament Schedule")
         st.warning(f"Missing: {', '.join(missing)}. Related features will be unavailable.")
\ No newline at end of file
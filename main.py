@@ -1,18 +1,8 @@
 # main.py
 import streamlit as st
 
-# Import setup and routing modules
-from auth import authenticate_user
-from importer import show_import_page
-from dealer.manage import show_dealer_management
-from dealer.add import show_add_dealer
-from dealer.remove import show_remove_dealer
-from dealer.uniform import show_uniform_return
-from scheduler.shifts import show_shift_swap
-from scheduler.carpool import show_carpool_management
-from scheduler.temp_adjustments import show_temp_adjustments
-from tournament.manage import show_tournament_manage
-from scheduler.metrics import show_scheduling_metrics
+from diagnostics import rerun, show_diagnostics_panel
+from page_registry import IMPORT_PAGE, LOGIN_PAGE, PAGES, load, show_page
 
 # ----------------------
 # 🧭 Streamlit Config
@@ -32,14 +22,16 @@ if "data_loaded" not in st.session_state:
 # 🔐 Phase 1: Login Page
 # ----------------------
 if not st.session_state.authenticated:
-    authenticate_user()
+    with rerun("Login"):
+        load(LOGIN_PAGE)()
     st.stop()
 
 # ----------------------
 # 📥 Phase 2: Import Page
 # ----------------------
 if not st.session_state.data_loaded:
-    show_import_page()
+    with rerun("Import"):
+        load(IMPORT_PAGE)()
     st.stop()
 
 # ----------------------
@@ -47,47 +39,12 @@ if not st.session_state.data_loaded:
 # ----------------------
 st.sidebar.title("🔧 Navigation")
 
-page_options = [
-    "Dealer Management",
-    "Add Dealer",
-    "Remove Dealer",
-    "Uniform Return",
-    "Schedule Management",
-    "Tournament Management",
-    "Scheduling Metrics"
-]
-
-selected_page = st.sidebar.radio("Go to:", page_options)
+selected_page = st.sidebar.radio("Go to:", list(PAGES))
 
 # ----------------------
 # 📦 Page Routing
 # ----------------------
-if selected_page == "Dealer Management":
-    show_dealer_management()
-
-elif selected_page == "Add Dealer":
-    show_add_dealer()
-
-elif selected_page == "Remove Dealer":
-    show_remove_dealer()    
-
-elif selected_page == "Uniform Return":
-    show_uniform_return()
-
-elif selected_page == "Schedule Management":
-    st.subheader("🚗 Schedule Management")
-    subtab = st.radio("Choose a task:", ["Shift Swap", "Carpool", "Temporary Adjustments"])
-    
-    if subtab == "Shift Swap":
-        show_shift_swap()
-    elif subtab == "Carpool":
-        show_carpool_management()
-    else:
-        show_temp_adjustments()
-
-elif selected_page == "Tournament Management":
-    show_tournament_manage()
+with rerun(selected_page):
+    show_page(selected_page)
 
-elif selected_page == "Scheduling Metrics":
-    from scheduler.metrics import show_scheduling_metrics
-    show_scheduling_metrics()    
\ No newline at end of file
+show_diagnostics_panel()
@@ -1,14 +1,215 @@
-import streamlit as st
-
-def show_dealer_management():
-    st.title("🧍 Dealer Management")
-    st.markdown("This page will eventually support:")
-    st.markdown("""
-    - ✅ Add new dealers
-    - 🔍 Lookup existing dealers
-    - 📝 Edit dealer details
-    - ❌ Remove dealers
-    - 👕 Handle uniform return
-    """)
-
-    st.info("Dealer functionality coming soon. Everything's connected properly!")
\ No newline at end of file
+# manage.py
+"""Headless batch jobs: forecasts and reports written to files, no Streamlit.
+
+    python manage.py forecast SCHEDULE.xlsx [MORE.xlsx ...] --out reports/ [--dealers DEALERS.xlsx]
+    python manage.py uniforms --out reports/ [--dealers DEALERS.xlsx] [--as-of 2026-06-01]
+    python manage.py export --out reports/ [--format xlsx|csv] [--reports roster,daily_forecast] [--as-of 2026-06-01]
+
+forecast treats every sheet of every schedule workbook (and every CSV) as one
+tournament series and runs the series across a process pool. Each series gets
+a folder with daily_forecast.csv, weekly_forecast.csv, restart_adjusted.csv
+and, when a dealer workbook is given, roster_forecast.csv.
+
+uniforms writes missing_uniform_returns.csv for the roster as of a date, read
+from a dealer workbook or, without one, the roster database (DMS_DB_PATH),
+which is where the app logs returns.
+
+export writes the app's report exports (exports.REPORTS) from the roster
+database: one workbook with a sheet per report, or a CSV per report. Files
+come from the same version-keyed export cache the app uses, so an unchanged
+database is not re-exported.
+
+Only the Streamlit-free engine modules are imported, so this starts quickly
+and runs from cron.
+"""
+import argparse
+import os
+import re
+import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from dealer.roster import RosterTimeline, missing_uniform_returns
+from dealer.schema import normalize_dealers
+from exports import REPORTS, ReportSource, export_csv, export_xlsx
+from roster_db import DB_PATH, RosterDB
+from scheduler.taper import DEFAULT_TAPER, parse_curve
+from tournament.enrich import TOURNAMENT_COLUMNS, enrich_tournaments
+from tournament.reports import daily_forecast, restart_adjusted, roster_forecast, weekly_forecast
+from tournament.rollup import DealerRollup
+
+
+def read_table(path, sheet=0):
+    if path.lower().endswith(".csv"):
+        return pd.read_csv(path)
+    return pd.read_excel(path, sheet_name=sheet)
+
+
+def series_jobs(paths):
+    """(path, sheet, name) for every schedule sheet to forecast.
+
+    Names double as output folder names, so they are unique per run: a name
+    that two inputs share (series.xlsx in two directories) gets the parent
+    directory in front, and a counter if that still clashes.
+    """
+    jobs = []
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if path.lower().endswith(".csv"):
+            jobs.append((path, 0, stem))
+            continue
+        sheets = pd.ExcelFile(path).sheet_names
+        for sheet in sheets:
+            jobs.append((path, sheet, stem if len(sheets) == 1 else f"{stem}-{sheet}"))
+
+    shared = Counter(_folder_name(name).lower() for _, _, name in jobs)
+    taken = set()
+    unique = []
+    for path, sheet, name in jobs:
+        if shared[_folder_name(name).lower()] > 1:
+            parent = os.path.basename(os.path.dirname(os.path.abspath(path)))
+            name = f"{parent}-{name}"
+        base, n = name, 1
+        while _folder_name(name).lower() in taken:
+            n += 1
+            name = f"{base}-{n}"
+        taken.add(_folder_name(name).lower())
+        unique.append((path, sheet, name))
+    return unique
+
+
+def _folder_name(name):
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "series"
+
+
+def forecast_series(path, sheet, name, out_dir, curves, dealers=None):
+    """Forecast one schedule sheet and write its reports. Returns a one-line summary."""
+    raw = read_table(path, sheet)
+    missing = [col for col in TOURNAMENT_COLUMNS if col not in raw.columns]
+    if missing:
+        return f"{name}: skipped (missing columns: {', '.join(missing)})"
+
+    df = enrich_tournaments(raw)
+    rollup = DealerRollup(df)
+    folder = os.path.join(out_dir, _folder_name(name))
+    os.makedirs(folder, exist_ok=True)
+
+    daily = daily_forecast(rollup)
+    daily.to_csv(os.path.join(folder, "daily_forecast.csv"), index=False)
+    weekly_forecast(daily).to_csv(os.path.join(folder, "weekly_forecast.csv"), index=False)
+    restarts = restart_adjusted(df, curves)
+    restarts.to_csv(os.path.join(folder, "restart_adjusted.csv"), index=False)
+    if dealers is not None and rollup.days:
+        roster_forecast(rollup, RosterTimeline(dealers)).to_csv(
+            os.path.join(folder, "roster_forecast.csv"), index=False
+        )
+    return f"{name}: {len(df)} events over {rollup.days} days, {len(restarts)} restart flights -> {folder}"
+
+
+def load_dealers(path):
+    return normalize_dealers(read_table(path))
+
+
+def cmd_forecast(args):
+    curves = {"default": parse_curve(args.holdem_taper), "mixed": parse_curve(args.mixed_taper)}
+    dealers = load_dealers(args.dealers) if args.dealers else None
+    jobs = series_jobs(args.schedules)
+    os.makedirs(args.out, exist_ok=True)
+
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(jobs)))
+    if workers == 1:
+        results = [forecast_series(path, sheet, name, args.out, curves, dealers) for path, sheet, name in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(forecast_series, path, sheet, name, args.out, curves, dealers)
+                for path, sheet, name in jobs
+            ]
+            results = [future.result() for future in futures]
+    for line in results:
+        print(line)
+    return 0
+
+
+def cmd_uniforms(args):
+    if args.dealers:
+        dealers = load_dealers(args.dealers)
+    else:
+        dealers = RosterDB(args.db).load_dealers()
+    as_of = pd.Timestamp(args.as_of) if args.as_of else pd.Timestamp.today().normalize()
+    missing = missing_uniform_returns(RosterTimeline(dealers), as_of, include_removed=args.include_removed)
+
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, "missing_uniform_returns.csv")
+    missing.to_csv(path, index=False)
+    print(f"{len(missing)} dealer(s) have not returned their shirt (roster as of {as_of.date()}) -> {path}")
+    return 0
+
+
+def cmd_export(args):
+    names = [name.strip() for name in args.reports.split(",") if name.strip()] if args.reports else list(REPORTS)
+    unknown = [name for name in names if name not in REPORTS]
+    if unknown:
+        raise ValueError(f"unknown report(s): {', '.join(unknown)} (choose from {', '.join(REPORTS)})")
+    source = ReportSource(RosterDB(args.db))
+    options = {"as_of": args.as_of, "include_removed": args.include_removed}
+
+    os.makedirs(args.out, exist_ok=True)
+    if args.format == "xlsx":
+        files = [(export_xlsx(source, names, **options), "reports.xlsx")]
+    else:
+        files = [(export_csv(source, name, **options), f"{name}.csv") for name in names]
+    for path, name in files:
+        target = os.path.join(args.out, name)
+        shutil.copyfile(path, target)
+        print(f"{name} -> {target}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Dealer Management System batch jobs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    default_taper = ", ".join(str(f) for f in DEFAULT_TAPER)
+    forecast = commands.add_parser("forecast", help="Daily/weekly forecasts and restart-adjusted projections.")
+    forecast.add_argument("schedules", nargs="+", help="Tournament schedule workbooks or CSVs.")
+    forecast.add_argument("--out", required=True, help="Output folder.")
+    forecast.add_argument("--dealers", help="Dealer workbook; adds roster_forecast.csv.")
+    forecast.add_argument("--workers", type=int, help="Worker processes (default: one per CPU).")
+    forecast.add_argument("--holdem-taper", default=default_taper, help="Restart taper for Hold'em events.")
+    forecast.add_argument("--mixed-taper", default=default_taper, help="Restart taper for Mixed events.")
+    forecast.set_defaults(run=cmd_forecast)
+
+    uniforms = commands.add_parser("uniforms", help="Missing uniform return report.")
+    uniforms.add_argument("--out", required=True, help="Output folder.")
+    uniforms.add_argument("--dealers", help="Dealer workbook (default: the roster database).")
+    uniforms.add_argument("--db", default=DB_PATH, help="Roster database when no workbook is given.")
+    uniforms.add_argument("--as-of", help="Roster date (default: today).")
+    uniforms.add_argument("--include-removed", action="store_true", help="Also list removed dealers.")
+    uniforms.set_defaults(run=cmd_uniforms)
+
+    export = commands.add_parser("export", help="Report exports (roster, removals, uniforms, forecasts).")
+    export.add_argument("--out", required=True, help="Output folder.")
+    export.add_argument("--format", choices=["xlsx", "csv"], default="xlsx", help="One workbook or a CSV per report.")
+    export.add_argument("--reports", help=f"Comma-separated, from: {', '.join(REPORTS)} (default: all).")
+    export.add_argument("--db", default=DB_PATH, help="Roster database.")
+    export.add_argument("--as-of", help="Roster date (default: today).")
+    export.add_argument("--include-removed", action="store_true", help="Missing returns include removed dealers.")
+    export.set_defaults(run=cmd_export)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+# page_registry.py
+"""Sidebar page registry for main.py.
+
+Pages are named by "module:function" and the module is only imported the
+first time its page is shown, so the login and import phases don't pay for
+pandas and every page's code up front. To add a page, add an entry to PAGES
+(or to a task group like SCHEDULE_TASKS); main.py needs no change.
+"""
+import importlib
+
+import streamlit as st
+
+LOGIN_PAGE = "auth:authenticate_user"
+IMPORT_PAGE = "importer:show_import_page"
+
+# Task groups render as a subheader plus a radio of their tasks
+SCHEDULE_TASKS = {
+    "Shift Swap": "scheduler.shifts:show_shift_swap",
+    "Carpool": "scheduler.carpool:show_carpool_management",
+    "Temporary Adjustments": "scheduler.temp_adjustments:show_temp_adjustments",
+}
+
+# Sidebar label -> "module:function", or (subheader, {task: "module:function"}); sidebar order
+PAGES = {
+    "Dealer Management": "dealer.manage:show_dealer_management",
+    "Add Dealer": "dealer.add:show_add_dealer",
+    "Remove Dealer": "dealer.remove:show_remove_dealer",
+    "Uniform Return": "dealer.uniform:show_uniform_return",
+    "Schedule Management": ("🚗 Schedule Management", SCHEDULE_TASKS),
+    "Tournament Management": "tournament.manage:show_tournament_manage",
+    "Tournament Forecasting": "tournament.forecast:show_forecasting",
+    "Scheduling Metrics": "scheduler.metrics:show_scheduling_metrics",
+    "Staffing Gaps": "scheduler.staffing:show_staffing_gaps",
+    "Report Exports": "export_page:show_export_page",
+}
+
+
+def load(target):
+    """"module:function" -> the function, importing the module on first use."""
+    module, _, name = target.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def show_page(label):
+    entry = PAGES[label]
+    if isinstance(entry, tuple):
+        title, tasks = entry
+        st.subheader(title)
+        task = st.radio("Choose a task:", list(tasks))
+        entry = tasks[task]
+    load(entry)()
@@ -0,0 +1,162 @@
+# parse_cache.py
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from diagnostics import register_cache, section
+
+# ---- CACHE SETTINGS ----
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "imports")
+MAX_ENTRIES = 16
+
+
+class ParseCache:
+    """Validated upload frames keyed by file content hash.
+
+    Frames live in a small in-memory LRU and are mirrored to a parquet sidecar
+    on disk so a re-upload of the same file skips openpyxl entirely. Sheets with
+    mixed-type columns that Arrow can't encode are cached in memory only; there
+    is no pickle fallback, since loading one would run whatever is in the cache
+    dir. The dir is created readable by the app user only.
+
+    One cache serves every session thread: the LRU is guarded by a lock, and
+    sidecars are written to a temp file and renamed into place so a concurrent
+    reader never sees a half-written one.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_entries=MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sidecar_prunes = 0
+        self._frames = OrderedDict()  # key -> DataFrame, most recently used last
+        self._lock = threading.Lock()
+
+    def key(self, data, kind):
+        digest = hashlib.sha256(data).hexdigest()
+        return f"{kind}-{digest[:32]}"
+
+    def get(self, key):
+        with self._lock:
+            df = self._frames.get(key)
+            if df is not None:
+                self._frames.move_to_end(key)
+        if df is None:
+            df = self._read_sidecar(key)
+            if df is not None:
+                self._remember(key, df)
+
+        with self._lock:
+            if df is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return df.copy()
+
+    def put(self, key, df):
+        self._remember(key, df.copy())
+        self._write_sidecar(key, df)
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+        for path in self._sidecars():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "sidecar_prunes": self.sidecar_prunes,
+                "entries": len(self._frames),
+                "max_entries": self.max_entries,
+            }
+
+    # ---- internals ----
+    def _remember(self, key, df):
+        with self._lock:
+            self._frames[key] = df
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+                self.evictions += 1
+
+    def _sidecars(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".parquet")
+        ]
+
+    def _read_sidecar(self, key):
+        try:
+            return pd.read_parquet(os.path.join(self.cache_dir, key + ".parquet"))
+        except Exception:
+            # Missing, corrupt or unreadable: just a miss
+            return None
+
+    def _write_sidecar(self, key, df):
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            base = os.path.join(self.cache_dir, key)
+            temp = f"{base}.{os.getpid()}-{threading.get_ident()}.tmp"
+            try:
+                df.to_parquet(temp, index=False)
+                os.replace(temp, base + ".parquet")
+            except Exception:
+                return  # Arrow can't encode this sheet: memory only
+            finally:
+                if os.path.exists(temp):
+                    os.remove(temp)
+            self._prune_sidecars()
+        except OSError:
+            # Read-only or full disk: keep working from memory only
+            pass
+
+    def _prune_sidecars(self):
+        paths = sorted(self._sidecars(), key=os.path.getmtime)
+        for path in paths[:max(0, len(paths) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue  # another thread pruned it first
+            with self._lock:
+                self.sidecar_prunes += 1
+
+
+PARSE_CACHE = ParseCache()
+register_cache("parse_cache.PARSE_CACHE", PARSE_CACHE._frames)
+
+
+def parse_upload(uploaded_file, kind, required_columns=()):
+    """Parse a Streamlit upload through the cache.
+
+    Returns ``(df, missing_columns)``. Only frames that pass validation are cached.
+    """
+    data = uploaded_file.getvalue()
+    key = PARSE_CACHE.key(data, kind)
+
+    df = PARSE_CACHE.get(key)
+    if df is not None:
+        return df, []
+
+    buffer = io.BytesIO(data)
+    with section("parse"):
+        df = pd.read_csv(buffer) if uploaded_file.name.endswith(".csv") else pd.read_excel(buffer)
+    missing = [col for col in required_columns if col not in df.columns]
+    if not missing:
+        PARSE_CACHE.put(key, df)
+    return df, missing
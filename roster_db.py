@@ -0,0 +1,412 @@
+# roster_db.py
+import os
+import secrets
+import sqlite3
+import threading
+
+import pandas as pd
+
+from dealer.schema import DEALER_SCHEMA, coerce_columns
+from tournament.enrich import parse_dates
+
+# ---- DATABASE LOCATION ----
+# One local file shared by every browser session on this server. Override with DMS_DB_PATH.
+DB_PATH = os.environ.get(
+    "DMS_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "roster.db")
+)
+
+DEALER_FIELDS = list(DEALER_SCHEMA)
+
+# Upload column -> tournaments table column
+TOURNAMENT_FIELDS = {
+    "Date": "date",
+    "Time": "time",
+    "Event Number": "event_number",
+    "Event Name": "event_name",
+    "Buy-in Amount": "buy_in_amount",
+    "Starting Chips": "starting_chips",
+    "Projection": "projection",
+    "Longest Break (Dinner Break)": "dinner_break",
+}
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS dealers (
+    ee_number TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL DEFAULT '',
+    last_name TEXT NOT NULL DEFAULT '',
+    nametag_id TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    phone TEXT NOT NULL DEFAULT '',
+    ft_pt TEXT,
+    shift_type TEXT,
+    dealer_group TEXT,
+    avail_mask INTEGER NOT NULL DEFAULT 0,
+    removal_effective_date TEXT,
+    uniform_return_date TEXT NOT NULL DEFAULT '',
+    uniform_return_items TEXT NOT NULL DEFAULT '',
+    uniform_return_confirm_id TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_dealers_nametag ON dealers (nametag_id);
+CREATE INDEX IF NOT EXISTS idx_dealers_last_name ON dealers (last_name);
+CREATE INDEX IF NOT EXISTS idx_dealers_removal ON dealers (removal_effective_date);
+CREATE INDEX IF NOT EXISTS idx_dealers_uniform ON dealers (uniform_return_date);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    row_id INTEGER PRIMARY KEY,
+    date TEXT,
+    time TEXT,
+    event_number TEXT,
+    event_name TEXT,
+    buy_in_amount TEXT,
+    starting_chips TEXT,
+    projection REAL,
+    dinner_break TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tournaments_date ON tournaments (date);
+CREATE INDEX IF NOT EXISTS idx_tournaments_event ON tournaments (event_number);
+
+CREATE TABLE IF NOT EXISTS uniform_returns (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ee_number TEXT NOT NULL,
+    return_date TEXT NOT NULL,
+    items TEXT NOT NULL,
+    confirm_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_uniform_returns_ee ON uniform_returns (ee_number);
+
+CREATE TABLE IF NOT EXISTS employee_shifts (
+    shift_id INTEGER PRIMARY KEY,
+    ee_number TEXT NOT NULL,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_employee_shifts_ee ON employee_shifts (ee_number);
+CREATE INDEX IF NOT EXISTS idx_employee_shifts_start ON employee_shifts (start);
+
+CREATE TABLE IF NOT EXISTS shift_swaps (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    shift_id INTEGER NOT NULL,
+    from_ee_number TEXT NOT NULL,
+    to_ee_number TEXT NOT NULL,
+    swapped_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS availability_overrides (
+    override_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ee_number TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    shift_type TEXT NOT NULL DEFAULT '',
+    reason TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_overrides_ee ON availability_overrides (ee_number);
+CREATE INDEX IF NOT EXISTS idx_overrides_dates ON availability_overrides (start_date, end_date);
+
+CREATE TABLE IF NOT EXISTS carpool_profiles (
+    ee_number TEXT PRIMARY KEY,
+    home_area TEXT NOT NULL DEFAULT '',
+    latitude REAL,
+    longitude REAL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def _text_or_number(series):
+    # Buy-in/Starting Chips mix numbers with words like "Restart"; keep both
+    numbers = pd.to_numeric(series, errors="coerce")
+    values = numbers.astype(object)
+    whole = numbers.notna() & (numbers % 1 == 0)
+    values[whole] = numbers[whole].astype("int64")
+    return values.where(numbers.notna(), series)
+
+
+class RosterDB:
+    """SQLite persistence for dealers, tournaments, uniform returns, shifts, overrides and carpools.
+
+    One connection per process (WAL mode, so readers never block the writer),
+    shared across Streamlit session threads behind a lock. Each table has a
+    version counter in `meta` that bumps on every write, so in-memory copies can
+    tell when another session or process has changed the data.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA_SQL)
+        # Stamped once per database file, so caches keyed on (path, versions) can
+        # tell a deleted and recreated database from the one they were built on
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('instance', ?)", (secrets.randbits(62),))
+        self.instance = self._conn.execute("SELECT value FROM meta WHERE key = 'instance'").fetchone()[0]
+
+    # ---- plumbing ----
+    def _write(self, table, statements):
+        """Run [(sql, params_or_seq, many)] in one transaction, bump the table version and return it."""
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params, many in statements:
+                    if many:
+                        cur.executemany(sql, params)
+                    else:
+                        cur.execute(sql, params)
+                cur.execute(
+                    "INSERT INTO meta (key, value) VALUES (?, 1) "
+                    "ON CONFLICT(key) DO UPDATE SET value = value + 1",
+                    (f"{table}_version",)
+                )
+                version = cur.execute("SELECT value FROM meta WHERE key = ?", (f"{table}_version",)).fetchone()[0]
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+        return version
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def reserve_sequence(self, name, count):
+        """Take `count` consecutive numbers from a named counter in `meta`; returns the first.
+
+        The bump runs in its own write transaction, so concurrent sessions and
+        server processes never get overlapping ranges.
+        """
+        key = f"{name}_seq"
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute(
+                    "INSERT INTO meta (key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+                    (key, count)
+                )
+                last = cur.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()[0]
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+        return last - count + 1
+
+    def version(self, table):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (f"{table}_version",)).fetchone()
+        return row[0] if row else 0
+
+    def count(self, table):
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    # ---- dealers ----
+    @staticmethod
+    def _dealer_rows(df):
+        out = df[DEALER_FIELDS].copy()
+        for col in ["ft_pt", "shift_type", "dealer_group"]:
+            out[col] = out[col].astype(object).where(out[col].notna(), None)
+        out["avail_mask"] = out["avail_mask"].astype(int)
+        dates = out["removal_effective_date"]
+        out["removal_effective_date"] = dates.dt.strftime("%Y-%m-%d").astype(object).where(dates.notna(), None)
+        return list(out.itertuples(index=False, name=None))
+
+    def _dealer_insert_sql(self):
+        placeholders = ", ".join("?" for _ in DEALER_FIELDS)
+        return f"INSERT INTO dealers ({', '.join(DEALER_FIELDS)}) VALUES ({placeholders})"
+
+    def replace_dealers(self, df):
+        self._write("dealers", [
+            ("DELETE FROM dealers", (), False),
+            (self._dealer_insert_sql(), self._dealer_rows(df), True),
+        ])
+
+    def insert_dealers(self, df):
+        self._write("dealers", [(self._dealer_insert_sql(), self._dealer_rows(df), True)])
+
+    def save_dealers(self, old_ee_numbers, df):
+        """Rewrite the given dealers (old keys) with the rows in df; handles ee_number renames."""
+        keys = [(str(ee),) for ee in old_ee_numbers]
+        self._write("dealers", [
+            ("DELETE FROM dealers WHERE ee_number = ?", keys, True),
+            (self._dealer_insert_sql(), self._dealer_rows(df), True),
+        ])
+
+    def load_dealers(self, where="", params=()):
+        raw = self._query(f"SELECT {', '.join(DEALER_FIELDS)} FROM dealers {where} ORDER BY rowid", params)
+        return coerce_columns(raw)[DEALER_FIELDS].reset_index(drop=True)
+
+    # ---- uniform returns ----
+    def log_uniform_returns(self, returns):
+        """returns: iterable of (ee_number, return_date, items, confirm_id)."""
+        returns = list(returns)
+        self._write("dealers", [
+            ("INSERT INTO uniform_returns (ee_number, return_date, items, confirm_id) VALUES (?, ?, ?, ?)",
+             returns, True),
+            ("UPDATE dealers SET uniform_return_date = ?, uniform_return_items = ?, "
+             "uniform_return_confirm_id = ? WHERE ee_number = ?",
+             [(date, items, confirm, ee) for ee, date, items, confirm in returns], True),
+        ])
+
+    def uniform_returns(self, ee_number=None):
+        if ee_number is None:
+            return self._query("SELECT * FROM uniform_returns ORDER BY id")
+        return self._query("SELECT * FROM uniform_returns WHERE ee_number = ? ORDER BY id", (str(ee_number),))
+
+    # ---- tournaments ----
+    def replace_tournaments(self, df):
+        out = df[list(TOURNAMENT_FIELDS)].rename(columns=TOURNAMENT_FIELDS)
+        out["date"] = parse_dates(out["date"]).dt.strftime("%Y-%m-%d")
+        out["projection"] = pd.to_numeric(out["projection"], errors="coerce")
+        for col in ["time", "event_number", "event_name", "buy_in_amount", "starting_chips", "dinner_break"]:
+            out[col] = out[col].astype(object).where(out[col].notna(), None)
+            out[col] = out[col].map(lambda v: None if v is None else str(v))
+        out = out.astype(object).where(out.notna(), None)
+        # row_id is the upload row position, so it stays stable across reloads
+        out.insert(0, "row_id", range(len(out)))
+        cols = list(out.columns)
+        self._write("tournaments", [
+            ("DELETE FROM tournaments", (), False),
+            (f"INSERT INTO tournaments ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})",
+             list(out.itertuples(index=False, name=None)), True),
+        ])
+
+    def load_tournaments(self, start=None, end=None):
+        """Tournament schedule in upload layout, optionally limited to a date range (inclusive)."""
+        where, params = [], []
+        if start is not None:
+            where.append("date >= ?")
+            params.append(pd.Timestamp(start).strftime("%Y-%m-%d"))
+        if end is not None:
+            where.append("date <= ?")
+            params.append(pd.Timestamp(end).strftime("%Y-%m-%d"))
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        raw = self._query(f"SELECT * FROM tournaments {clause} ORDER BY row_id", params)
+
+        df = raw.set_index("row_id").rename(columns={v: k for k, v in TOURNAMENT_FIELDS.items()})
+        df.index.name = None
+        df["Date"] = pd.to_datetime(df["Date"]).astype("datetime64[ns]")
+        for col in ["Buy-in Amount", "Starting Chips"]:
+            df[col] = _text_or_number(df[col])
+        return df
+
+    def update_projections(self, projections):
+        """projections: {row_id: projection} for edited tournament rows."""
+        rows = [(None if pd.isna(value) else float(value), int(row_id)) for row_id, value in projections.items()]
+        self._write("tournaments", [("UPDATE tournaments SET projection = ? WHERE row_id = ?", rows, True)])
+
+
+    # ---- employee shifts ----
+    @staticmethod
+    def _shift_rows(df):
+        return list(zip(
+            df["shift_id"].astype(int).tolist(),
+            df["ee_number"].astype(str).tolist(),
+            df["start"].dt.strftime("%Y-%m-%d %H:%M:%S").tolist(),
+            df["end"].dt.strftime("%Y-%m-%d %H:%M:%S").tolist(),
+        ))
+
+    def replace_shifts(self, df):
+        """Replace the employee schedule with df (scheduler.schedule.SHIFT_SCHEMA)."""
+        self._write("shifts", [
+            ("DELETE FROM employee_shifts", (), False),
+            ("INSERT INTO employee_shifts (shift_id, ee_number, start, end) VALUES (?, ?, ?, ?)",
+             self._shift_rows(df), True),
+        ])
+
+    def reassign_shifts(self, moves, swapped_at):
+        """Apply {shift_id: (from_ee_number, to_ee_number)} and log each move in shift_swaps.
+
+        Returns the shifts version the moves were written as.
+        """
+        return self._write("shifts", [
+            ("UPDATE employee_shifts SET ee_number = ? WHERE shift_id = ?",
+             [(str(to_ee), int(shift_id)) for shift_id, (_, to_ee) in moves.items()], True),
+            ("INSERT INTO shift_swaps (shift_id, from_ee_number, to_ee_number, swapped_at) VALUES (?, ?, ?, ?)",
+             [(int(shift_id), str(from_ee), str(to_ee), swapped_at) for shift_id, (from_ee, to_ee) in moves.items()],
+             True),
+        ])
+
+    def shift_swaps(self):
+        return self._query("SELECT * FROM shift_swaps ORDER BY id")
+
+    def load_shifts(self, start=None, end=None):
+        """Employee shifts, optionally only those overlapping start..end."""
+        where, params = [], []
+        if end is not None:
+            where.append("start < ?")
+            params.append(pd.Timestamp(end).strftime("%Y-%m-%d %H:%M:%S"))
+        if start is not None:
+            where.append("end > ?")
+            params.append(pd.Timestamp(start).strftime("%Y-%m-%d %H:%M:%S"))
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        df = self._query(f"SELECT * FROM employee_shifts {clause} ORDER BY start, shift_id", params)
+        df["start"] = pd.to_datetime(df["start"]).astype("datetime64[ns]")
+        df["end"] = pd.to_datetime(df["end"]).astype("datetime64[ns]")
+        return df
+
+    # ---- availability overrides ----
+    def add_overrides(self, overrides):
+        """overrides: iterable of (ee_number, start_date, end_date, kind, shift_type, reason)."""
+        rows = [
+            (str(ee), pd.Timestamp(start).strftime("%Y-%m-%d"), pd.Timestamp(end).strftime("%Y-%m-%d"),
+             kind, shift_type or "", reason or "")
+            for ee, start, end, kind, shift_type, reason in overrides
+        ]
+        self._write("overrides", [
+            ("INSERT INTO availability_overrides (ee_number, start_date, end_date, kind, shift_type, reason) "
+             "VALUES (?, ?, ?, ?, ?, ?)", rows, True),
+        ])
+
+    def delete_overrides(self, override_ids):
+        self._write("overrides", [
+            ("DELETE FROM availability_overrides WHERE override_id = ?", [(int(i),) for i in override_ids], True),
+        ])
+
+    def load_overrides(self):
+        df = self._query("SELECT * FROM availability_overrides ORDER BY override_id")
+        df["start_date"] = pd.to_datetime(df["start_date"]).astype("datetime64[ns]")
+        df["end_date"] = pd.to_datetime(df["end_date"]).astype("datetime64[ns]")
+        return df
+
+    # ---- carpool profiles ----
+    def replace_carpool_profiles(self, df):
+        """Replace the carpool profiles with df (scheduler.commute.PROFILE_COLUMNS)."""
+        lat = pd.to_numeric(df.get("latitude", pd.Series(None, index=df.index)), errors="coerce")
+        lon = pd.to_numeric(df.get("longitude", pd.Series(None, index=df.index)), errors="coerce")
+        rows = list(zip(
+            df["ee_number"].astype(str).str.strip().tolist(),
+            df.get("home_area", pd.Series("", index=df.index)).fillna("").astype(str).str.strip().tolist(),
+            [None if pd.isna(v) else float(v) for v in lat],
+            [None if pd.isna(v) else float(v) for v in lon],
+        ))
+        self._write("carpool", [
+            ("DELETE FROM carpool_profiles", (), False),
+            ("INSERT OR REPLACE INTO carpool_profiles (ee_number, home_area, latitude, longitude) "
+             "VALUES (?, ?, ?, ?)", rows, True),
+        ])
+
+    def load_carpool_profiles(self):
+        return self._query("SELECT * FROM carpool_profiles ORDER BY ee_number")
+
+
+_DB = {}
+_DB_LOCK = threading.Lock()
+
+
+def get_roster_db(path=DB_PATH):
+    """Process-wide RosterDB for path (connection reused across sessions and reruns)."""
+    with _DB_LOCK:
+        if path not in _DB:
+            _DB[path] = RosterDB(path)
+        return _DB[path]
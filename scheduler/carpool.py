@@ -1,6 +1,89 @@
 # scheduler/carpool.py
 import streamlit as st
+import pandas as pd
+
+from dealer.state import dealers_loaded, get_dealer_store
+from parse_cache import parse_upload
+from roster_db import get_roster_db
+from scheduler.commute import CELL_KM, PROFILE_COLUMNS, SEATS, WINDOW_MINUTES
+from scheduler.state import get_carpool_matcher
+
+
+def _clock(minutes):
+    minutes = minutes % (24 * 60)
+    return pd.to_datetime(minutes, unit="m").dt.strftime("%H:%M")
+
+
+def _upload_profiles():
+    with st.expander("📤 Upload Carpool Profiles"):
+        st.caption(
+            "CSV/XLSX with ee_number and home_area (ZIP or neighborhood), plus latitude/longitude if known. "
+            "Uploading replaces the current profiles."
+        )
+        profile_file = st.file_uploader("Upload profiles", type=["csv", "xlsx"], key="carpool_profiles")
+        if profile_file:
+            profiles, missing = parse_upload(profile_file, "carpool", PROFILE_COLUMNS[:1])
+            if missing:
+                st.error(f"Missing columns: {', '.join(missing)}")
+                return
+            if st.button(f"Save {len(profiles)} Profile(s)"):
+                get_roster_db().replace_carpool_profiles(profiles)
+                st.success("Carpool profiles saved.")
+                st.rerun()
+
 
 def show_carpool_management():
     st.title("🚘 Carpool Management")
-    st.text("Stub for setting up and managing carpools.")
\ No newline at end of file
+
+    if not dealers_loaded():
+        st.error("No dealer data loaded. Please upload the dealer list on the import page.")
+        return
+
+    _upload_profiles()
+    if not get_roster_db().count("carpool_profiles"):
+        st.info("No carpool profiles yet. Upload dealers' home areas to start matching.")
+        return
+
+    today = pd.Timestamp.today().normalize()
+    col1, col2 = st.columns(2)
+    start = col1.date_input("From", value=today.date())
+    end = col2.date_input("Through", value=(today + pd.Timedelta(days=13)).date())
+    if end < start:
+        st.error("The end date is before the start date.")
+        return
+
+    # Swaps, roster edits and temporary adjustments only re-pool the dealers they touched
+    matcher = get_carpool_matcher(start, end)
+    store = get_dealer_store()
+    st.caption(
+        f"Dealers are pooled when they start and finish within the same {WINDOW_MINUTES}-minute windows "
+        f"and live in the same ~{CELL_KM:g} km area (or give the same home area); up to {SEATS} per car."
+    )
+
+    riders = matcher.riders
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Commutes", len(riders))
+    col2.metric("Shared", int((riders["pool_size"] > 1).sum()))
+    col3.metric("Cars Saved", int((riders["pool_size"] > 1).sum() - len(matcher.pools())))
+
+    day = st.date_input("Show pools for:", value=start, min_value=start, max_value=end, key="carpool_day")
+    pools = matcher.pools(date=day)
+    if pools.empty:
+        st.info("No carpools on this date.")
+    else:
+        names = {ee: store.index.label(ee) for ee in set(", ".join(pools["members"]).split(", ")) if ee in store}
+        pools = pools.assign(
+            start=_clock(pools["start_minute"]),
+            end=_clock(pools["end_minute"]),
+            members=pools["members"].map(lambda m: "; ".join(names.get(ee, ee) for ee in m.split(", "))),
+        )
+        st.dataframe(pools[["start", "end", "home_area", "size", "members"]], hide_index=True, use_container_width=True)
+
+    st.markdown("---")
+    ee = st.text_input("Look up a dealer's carpools (EE Number)").strip()
+    if ee:
+        mine = matcher.pools_for(ee)
+        if mine.empty:
+            st.info("No carpools for this dealer in the selected dates.")
+        else:
+            st.dataframe(mine.assign(date=mine["date"].dt.date), hide_index=True, use_container_width=True)
@@ -0,0 +1,245 @@
+# scheduler/commute.py
+import numpy as np
+import pandas as pd
+
+from dealer.schema import weekday_bits
+from dealer.supply import SUPPLY_SHIFTS
+from tournament.enrich import SHIFT_HOURS
+
+# ---- CARPOOL SETTINGS ----
+SEATS = 4               # riders per car, driver included
+WINDOW_MINUTES = 30     # shift starts/ends are bucketed to this many minutes
+CELL_KM = 5.0           # home grid cell size
+_KM_PER_DEGREE = 111.0
+
+# Carpool profile upload: ee_number plus a home_area (ZIP, neighborhood) and/or
+# latitude/longitude. Points are placed on the grid; dealers with only a
+# home_area are pooled with others giving the same text.
+PROFILE_COLUMNS = ["ee_number", "home_area", "latitude", "longitude"]
+
+COMMUTE_COLUMNS = ["ee_number", "date", "start_minute", "end_minute", "source"]
+
+_SLOTS_PER_DAY = 24 * 60 // WINDOW_MINUTES
+_END_SLOTS = 2 * _SLOTS_PER_DAY + 1  # overnight shifts end past midnight
+_NEIGHBORS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+
+def home_areas(profiles):
+    """Profiles -> DataFrame indexed by ee_number with each dealer's home-area key and position.
+
+    The key is the dealer's CELL_KM grid cell (cell_row/cell_col) when they gave
+    a location, else their home_area text; dealers with neither are left out.
+    """
+    profiles = profiles.assign(ee_number=profiles["ee_number"].astype(str).str.strip())
+    profiles = profiles.drop_duplicates("ee_number", keep="last").set_index("ee_number")
+    blank = pd.Series(np.nan, index=profiles.index)
+    lat = pd.to_numeric(profiles.get("latitude", blank), errors="coerce")
+    lon = pd.to_numeric(profiles.get("longitude", blank), errors="coerce")
+    has_point = lat.notna() & lon.notna()
+
+    # One longitude scale for the whole roster keeps every cell the same width
+    ref = np.radians(lat[has_point].mean()) if has_point.any() else 0.0
+    row = np.floor(lat * _KM_PER_DEGREE / CELL_KM)
+    col = np.floor(lon * _KM_PER_DEGREE * np.cos(ref) / CELL_KM)
+    grid = "grid:" + row.astype("Int64").astype(str) + ":" + col.astype("Int64").astype(str)
+
+    area = profiles.get("home_area", blank).fillna("").astype(str).str.strip().str.upper()
+    key = grid.where(has_point, ("area:" + area).where(area != "", None))
+    label = area.where(area != "", key)
+    out = pd.DataFrame({
+        "home_area": label, "area_key": key, "latitude": lat, "longitude": lon,
+        "cell_row": row.where(has_point), "cell_col": col.where(has_point),
+    })
+    return out[out["area_key"].notna()]
+
+
+def commutes(schedule, dealers, dates, overrides=None, ee_numbers=None):
+    """Trips to work per dealer and date: ee_number, date, start_minute, end_minute, source.
+
+    Dealers with shifts on the employee schedule inside `dates` commute for
+    exactly those shifts; everyone else is assumed to work their shift_type's
+    SHIFT_HOURS on each available weekday. Temporary adjustments
+    (dealer.overrides.OverrideIndex) are laid over both: UNAVAILABLE drops the
+    day, and on roster-derived days AVAILABLE/SHIFT add or move it. Limit to
+    some dealers with ee_numbers (used for incremental re-pooling).
+    """
+    dates = pd.DatetimeIndex(dates).normalize()
+    dealers = dealers[dealers["removal_effective_date"].isna() |
+                      (dealers["removal_effective_date"] > dates[0])]
+    if ee_numbers is not None:
+        dealers = dealers[dealers["ee_number"].isin(list(ee_numbers))]
+    ee = dealers["ee_number"].astype(str)
+
+    scheduled = schedule.overlapping(dates[0], dates[-1] + pd.Timedelta(days=1)) if schedule is not None else None
+    frames = []
+    if scheduled is not None and len(scheduled):
+        scheduled = scheduled[scheduled["ee_number"].isin(ee) & scheduled["start"].dt.normalize().isin(dates)]
+        day = scheduled["start"].dt.normalize()
+        trips = pd.DataFrame({
+            "ee_number": scheduled["ee_number"].to_numpy(),
+            "date": day.to_numpy(),
+            "start_minute": ((scheduled["start"] - day) / pd.Timedelta(minutes=1)).to_numpy(dtype=np.int64),
+            "end_minute": ((scheduled["end"] - day) / pd.Timedelta(minutes=1)).to_numpy(dtype=np.int64),
+            "source": "schedule",
+        })
+        if overrides is not None and len(trips):
+            trips = _drop_unavailable(trips, dates, overrides)
+        frames.append(trips)
+        on_schedule = set(scheduled["ee_number"])
+        dealers = dealers[~ee.isin(on_schedule)]
+
+    frames.append(_roster_trips(dealers, dates, overrides))
+    return pd.concat(frames, ignore_index=True)[COMMUTE_COLUMNS]
+
+
+def _drop_unavailable(trips, dates, overrides):
+    riders = pd.Index(trips["ee_number"].unique())
+    available = np.ones((len(dates), len(riders)), dtype=bool)
+    shift = np.zeros(available.shape, dtype=np.int64)
+    overrides.overlay(available, shift, riders, dates, SUPPLY_SHIFTS)
+    day = dates.get_indexer(trips["date"])
+    return trips[available[day, riders.get_indexer(trips["ee_number"])]]
+
+
+def _roster_trips(dealers, dates, overrides):
+    available = (dealers["avail_mask"].to_numpy(dtype=np.uint8)[None, :] & weekday_bits(dates)[:, None]) != 0
+    shift = pd.Categorical(dealers["shift_type"].astype(object), categories=SUPPLY_SHIFTS).codes.astype(np.int64)
+    shift = np.broadcast_to(np.where(shift < 0, len(SUPPLY_SHIFTS) - 1, shift), available.shape).copy()
+    if overrides is not None:
+        overrides.overlay(available, shift, dealers["ee_number"].astype(str), dates, SUPPLY_SHIFTS)
+    removal = dealers["removal_effective_date"].to_numpy(dtype="datetime64[ns]")
+    available &= np.isnat(removal)[None, :] | (removal[None, :] > dates.to_numpy()[:, None])
+
+    hours = np.array([SHIFT_HOURS.get(name, (np.nan, np.nan)) for name in SUPPLY_SHIFTS]) * 60
+    day, col = np.nonzero(available & ~np.isnan(hours[shift, 0]))
+    return pd.DataFrame({
+        "ee_number": dealers["ee_number"].astype(str).to_numpy()[col],
+        "date": dates.to_numpy()[day],
+        "start_minute": hours[shift[day, col], 0].astype(np.int64),
+        "end_minute": hours[shift[day, col], 1].astype(np.int64),
+        "source": "roster",
+    })
+
+
+class CarpoolMatcher:
+    """Pools dealers who travel at the same times from the same home area.
+
+    Each commute is hashed to an int64 slot key built from its date and its
+    start and end rounded to WINDOW_MINUTES, and placed in its home-area cell
+    (a grid cell, so nearby dealers share a bucket without comparing any pair
+    of them). A dealer who would be alone in their cell on a slot probes the
+    eight neighboring cells and joins the busiest one, so a cell boundary
+    between two houses doesn't keep them apart. A bucket is cut into
+    ceil(n / SEATS) cars of near-equal size after sorting by position, so each
+    car is geographically contiguous. Pools are a pure function of the slot's
+    riders, which is what lets reschedule() redo only the slots a dealer left
+    or joined.
+    """
+
+    def __init__(self, trips, areas, seats=SEATS):
+        self.seats = seats
+        self.areas = areas
+        self._codes = pd.Index(areas["area_key"].unique())
+        cells = areas.drop_duplicates("area_key").set_index("area_key").reindex(self._codes)
+        self._rows = cells["cell_row"].to_numpy(dtype=float)
+        self._cols = cells["cell_col"].to_numpy(dtype=float)
+        self.riders = self._number(self._keyed(trips))
+
+    def _keyed(self, trips):
+        trips = trips[trips["ee_number"].isin(self.areas.index)]
+        area = self.areas.reindex(trips["ee_number"])
+        day = trips["date"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        start = trips["start_minute"].to_numpy(dtype=np.int64) // WINDOW_MINUTES
+        end = np.minimum(trips["end_minute"].to_numpy(dtype=np.int64) // WINDOW_MINUTES, _END_SLOTS - 1)
+        return trips.assign(
+            slot=(day * _SLOTS_PER_DAY + start) * _END_SLOTS + end,
+            cell=self._codes.get_indexer(area["area_key"]).astype(np.int64),
+            latitude=area["latitude"].to_numpy(),
+            longitude=area["longitude"].to_numpy(),
+        ).reset_index(drop=True)
+
+    def _merged_cells(self, riders):
+        """Each rider's bucket cell: their own, or a neighbor's when they'd be alone in it on that slot."""
+        groups = riders.groupby(["slot", "cell"], sort=True)
+        cells = groups.size().rename("n").reset_index()
+        cells["row"] = self._rows[cells["cell"].to_numpy()]
+        cells["col"] = self._cols[cells["cell"].to_numpy()]
+        target = np.arange(len(cells))
+
+        lone = cells[(cells["n"] == 1) & cells["row"].notna()]
+        if len(lone):
+            grid = cells[cells["row"].notna()].rename_axis("neighbor").reset_index()
+            probes = pd.concat([
+                lone.assign(row=lone["row"] + dr, col=lone["col"] + dc) for dr, dc in _NEIGHBORS
+            ]).rename_axis("lone").reset_index()
+            found = probes.merge(grid, on=["slot", "row", "col"], suffixes=("", "_neighbor"))
+            found = found.sort_values(["lone", "n_neighbor", "neighbor"], ascending=[True, False, True])
+            found = found.drop_duplicates("lone")
+            target[found["lone"].to_numpy()] = found["neighbor"].to_numpy()
+
+            # Two lone cells that picked each other meet in the lower one; any
+            # other lone cell follows its pick until it reaches a bucket that stays put
+            cell = np.arange(len(cells))
+            target = np.where(target[target] == cell, np.minimum(cell, target), target)
+            while (target[target] != target).any():
+                target = target[target]
+
+        return cells["cell"].to_numpy()[target][groups.ngroup().to_numpy()]
+
+    def _number(self, riders):
+        """Assign pool numbers within each bucket (riders of whole slots only)."""
+        riders = riders.assign(key=riders["slot"] * len(self._codes) + self._merged_cells(riders))
+        riders = riders.sort_values(["key", "latitude", "longitude", "ee_number"], kind="stable")
+        key = riders["key"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]]) if len(key) else np.array([], dtype=np.int64)
+        size = np.diff(np.r_[starts, len(key)])
+        rank = np.arange(len(key)) - np.repeat(starts, size)
+        n = np.repeat(size, size)
+        cars = -(-n // self.seats)
+        riders = riders.assign(pool=rank * cars // np.maximum(n, 1))
+        return riders.assign(pool_size=riders.groupby(["key", "pool"])["ee_number"].transform("size").to_numpy())
+
+    def reschedule(self, ee_numbers, trips):
+        """Replace the commutes of ee_numbers with trips and re-pool only the slots they touch."""
+        ee_numbers = set(map(str, ee_numbers))
+        leaving = self.riders["ee_number"].isin(ee_numbers)
+        joining = self._keyed(trips[trips["ee_number"].isin(ee_numbers)])
+        touched = np.union1d(self.riders.loc[leaving, "slot"].to_numpy(), joining["slot"].to_numpy())
+
+        affected = self.riders["slot"].isin(touched)
+        rest = self.riders[~affected]
+        redo = pd.concat([self.riders[affected & ~leaving], joining], ignore_index=True)
+        self.riders = pd.concat([rest, self._number(redo)], ignore_index=True)
+        return len(touched)
+
+    def pools(self, date=None, min_size=2):
+        """One row per car (on one date, or all): date, start/end minute, home area, size and members."""
+        riders = self.riders[self.riders["pool_size"] >= min_size]
+        if date is not None:
+            riders = riders[riders["date"] == pd.Timestamp(date).normalize()]
+        riders = riders.sort_values(["key", "pool"], kind="stable")
+        key, pool = riders["key"].to_numpy(), riders["pool"].to_numpy()
+        new_car = (key[1:] != key[:-1]) | (pool[1:] != pool[:-1])
+        first = np.flatnonzero(np.r_[True, new_car]) if len(key) else np.array([], dtype=np.int64)
+        # Members joined for every car at once: reduceat concatenates the "ee, " strings per car
+        joined = np.add.reduceat((riders["ee_number"] + ", ").to_numpy(dtype=object), first) if len(first) else []
+        out = pd.DataFrame({
+            "date": riders["date"].to_numpy()[first],
+            "start_minute": np.minimum.reduceat(riders["start_minute"].to_numpy(), first) if len(first) else [],
+            "end_minute": np.maximum.reduceat(riders["end_minute"].to_numpy(), first) if len(first) else [],
+            "first_ee": riders["ee_number"].to_numpy()[first],
+            "size": riders["pool_size"].to_numpy()[first],
+            "members": pd.Series(joined, dtype=object).str[:-2],
+        })
+        out.insert(3, "home_area", self.areas["home_area"].reindex(out.pop("first_ee")).to_numpy())
+        return out.sort_values(["date", "start_minute", "home_area"], kind="stable").reset_index(drop=True)
+
+    def unmatched(self):
+        """Commutes with nobody to share them."""
+        return self.riders[self.riders["pool_size"] < 2][COMMUTE_COLUMNS]
+
+    def pools_for(self, ee_number):
+        """Every car a dealer is in, with the other members."""
+        mine = self.riders[self.riders["ee_number"] == str(ee_number)][["key", "pool"]]
+        cars = self.riders.merge(mine, on=["key", "pool"])
+        return cars[COMMUTE_COLUMNS + ["pool_size"]].sort_values(["date", "ee_number"]).reset_index(drop=True)
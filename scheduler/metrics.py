@@ -3,26 +3,36 @@ import pandas as pd
 import calendar
 from datetime import datetime
 
+from scheduler.taper import DEFAULT_TAPER, apply_restart_taper, by_game_type, parse_curve
+from tournament.rollup import DealerRollup
+from tournament.state import get_demand_timeline, get_enriched_tournaments, get_rollup, tournaments_loaded
+from tournament.reports import weekly_table
+from tournament.enrich import SHIFT_HOURS
+from tournament.timeline import DEFAULT_EVENT_HOURS, shift_peaks, untimed_events
 
-def show_calendar_view(daily_df, value_col):
+TIME_WINDOWS = {"Total": None, "Day Shift": "DAY", "Swing Shift": "SWING"}
+
+
+def show_calendar_view(rollup, filters):
     st.subheader("🗓 Monthly Calendar View")
 
-    daily_df["Day"] = pd.to_datetime(daily_df["Day"])
+    active = rollup.active_days(**filters)
+    if active.empty:
+        st.info("No events to show for this selection.")
+        return
     selected_month = st.selectbox(
         "Select Month:",
-        sorted(set(daily_df["Day"].dt.strftime("%B %Y")))
+        list(dict.fromkeys(active.index.strftime("%B %Y")))
     )
 
     dt_filter = datetime.strptime(selected_month, "%B %Y")
-    month_df = daily_df[daily_df["Day"].dt.month == dt_filter.month]
-
     days_in_month = calendar.monthrange(dt_filter.year, dt_filter.month)[1]
     start_padding = calendar.monthrange(dt_filter.year, dt_filter.month)[0]
     calendar_data = [""] * start_padding
 
-    for day in range(1, days_in_month + 1):
-        d = datetime(dt_filter.year, dt_filter.month, day)
-        val = month_df[month_df["Day"] == d][value_col].sum()
+    # One rollup lookup for the whole month
+    month = rollup.daily(dt_filter, dt_filter.replace(day=days_in_month), **filters)["dealers"]
+    for day, val in enumerate(month.to_numpy(), start=1):
         if val != 0:
             val_int = int(round(val))
             display = f"**{day}**\n{val_int}"
@@ -41,66 +51,93 @@ def show_calendar_view(daily_df, value_col):
                 )
 
 
-def show_scheduling_metrics():
-    st.title("📊 Scheduling Metrics")
+def show_intraday_curve(df):
+    st.markdown("---")
+    st.subheader("⏱ Intra-Day Staffing Curve")
+    st.caption(
+        f"Concurrent dealers needed per 15 minutes, assuming {DEFAULT_EVENT_HOURS}-hour events "
+        "with tables closed for the listed dinner break."
+    )
 
-    if "tournament_df" not in st.session_state or st.session_state.tournament_df is None:
-        st.error("Tournament data not loaded. Please import it on the import page.")
+    timeline = get_demand_timeline()
+    if timeline.empty:
+        st.info("No timed events to plot.")
         return
+    peaks = shift_peaks(timeline)
+
+    selected = st.date_input(
+        "Day:",
+        value=peaks.index[0].date(),
+        min_value=peaks.index[0].date(),
+        max_value=peaks.index[-1].date(),
+        key="intraday_day"
+    )
+    day = pd.Timestamp(selected)
+    st.area_chart(timeline[day:day + pd.Timedelta(days=1, minutes=-1)].rename("Dealers on Floor"))
 
-    df = st.session_state.tournament_df.copy()
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+    cols = st.columns(len(SHIFT_HOURS) + 1)
+    for col, (shift, (low, high)) in zip(cols, SHIFT_HOURS.items()):
+        col.metric(f"{shift.title()} Peak ({low}:00-{high}:00)", int(peaks.loc[day, shift]))
+    cols[-1].metric("Daily Total (sum of events)", int(round(get_rollup().total(day, day))))
 
-    if "date" not in df.columns or "dealer_projection" not in df.columns:
-        st.warning("Tournament data missing required columns.")
+    with st.expander("📈 Shift Peaks for Every Day"):
+        table = peaks.assign(**{"Daily Total": get_rollup().daily(peaks.index[0], peaks.index[-1])["dealers"]})
+        table.index = table.index.date
+        st.dataframe(table.round().astype(int), use_container_width=True)
+
+    untimed = untimed_events(df)
+    if len(untimed):
+        st.caption(f"{len(untimed)} event(s) with a TBD start time are not on the curve.")
+
+
+def show_scheduling_metrics():
+    st.title("📊 Scheduling Metrics")
+
+    if not tournaments_loaded():
+        st.error("Tournament data not loaded. Please import it on the import page.")
         return
 
-    # 🗂 Split regular and restart events
-    df["is_restart"] = df["event_number"].astype(str).str.contains("R", case=False)
-    df["week"] = df["date"].dt.isocalendar().week
+    # Shared derived frame (dates, dealer_projection, is_restart, week), memoized on
+    # the data version; everything below only filters and aggregates it
+    df = get_enriched_tournaments()
 
     st.subheader("📅 Weekly Dealer Forecast")
 
     view_type = st.radio("Event Type:", ["Single-Day", "Restart"])
 
     if view_type == "Single-Day":
-        single_df = df[df["is_restart"] == False].copy()
-        time_window = st.radio("Time Window:", ["Total", "Day Shift", "Swing Shift"])
-
-        # Extract start hour
-        if "start_time" in single_df.columns:
-            single_df["start_hour"] = pd.to_datetime(single_df["start_time"], errors="coerce").dt.hour
-
-            if time_window == "Day Shift":
-                single_df = single_df[single_df["start_hour"].between(7, 14)]
-            elif time_window == "Swing Shift":
-                single_df = single_df[single_df["start_hour"].between(15, 21)]
+        time_window = st.radio("Time Window:", list(TIME_WINDOWS))
+        filters = {"restart": False, "window": TIME_WINDOWS[time_window]}
 
-        weekly = single_df.groupby(["week", single_df["date"].dt.date])["dealer_projection"].sum().reset_index()
-        weekly.columns = ["Week", "Day", "Projected Dealers"]
-        st.dataframe(weekly, use_container_width=True)
-        show_calendar_view(weekly, "Projected Dealers")
+        # Precomputed (date, restart, game, shift window) rollup; no per-render scans
+        rollup = get_rollup()
+        st.dataframe(weekly_table(rollup, filters, "Projected Dealers"), use_container_width=True)
+        show_calendar_view(rollup, filters)
 
     else:
-        restart_df = df[df["is_restart"] == True].copy()
-        restart_df = restart_df.sort_values("date")
-        taper_factors = [1.0, 0.5, 0.3, 0.1]
-
-        def apply_taper(group):
-            group = group.copy()
-            for i in range(len(group)):
-                factor = taper_factors[min(i, len(taper_factors) - 1)]
-                group.iloc[i, group.columns.get_loc("dealer_projection")] *= factor
-            return group
-
-        restart_df["event_base"] = restart_df["event_number"].str.extract(r"(\d+)")
-        grouped = restart_df.groupby("event_base", group_keys=False).apply(apply_taper)
-        grouped["adjusted_dealer_projection"] = grouped["dealer_projection"].round().astype(int)
-
-        weekly = grouped.groupby(["week", grouped["date"].dt.date])["adjusted_dealer_projection"].sum().reset_index()
-        weekly.columns = ["Week", "Day", "Adjusted Dealers"]
-        st.dataframe(weekly, use_container_width=True)
-        show_calendar_view(weekly, "Adjusted Dealers")
+        with st.expander("⚙️ Restart Taper Curves"):
+            st.caption("Share of the first flight's dealers needed on each restart; the last factor repeats.")
+            default_text = ", ".join(str(f) for f in DEFAULT_TAPER)
+            holdem_text = st.text_input("Hold'em events", value=default_text)
+            mixed_text = st.text_input("Mixed events", value=default_text)
+        try:
+            curves = {"default": parse_curve(holdem_text), "mixed": parse_curve(mixed_text)}
+        except ValueError as e:
+            st.error(f"Invalid taper curve: {e}")
+            return
+
+        grouped = apply_restart_taper(
+            df[df["is_restart"] == True],
+            curves=curves,
+            curve_for=by_game_type({"Mixed": "mixed"})
+        )
+
+        rollup = DealerRollup(grouped, value_col="adjusted_dealer_projection")
+        filters = {"restart": True}
+        st.dataframe(weekly_table(rollup, filters, "Adjusted Dealers"), use_container_width=True)
+        show_calendar_view(rollup, filters)
+
+    show_intraday_curve(df)
 
     st.markdown("---")
     st.caption("Dealer projections are based on current tournament data and restart taper assumptions.")
\ No newline at end of file
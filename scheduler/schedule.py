@@ -0,0 +1,189 @@
+# scheduler/schedule.py
+import numpy as np
+import pandas as pd
+
+from tournament.enrich import SHIFT_HOURS
+
+# ---- EMPLOYEE SCHEDULE UPLOAD ----
+# Wide layout: one row per dealer, an ee_number column (names optional, ignored)
+# and one column per date whose header is the date. Each cell is a shift:
+#   "10:00-18:00", "10-6p", "7:30 PM - 3:30 AM"   explicit times (overnight ok)
+#   "DAY" / "SWING"                               the standard SHIFT_HOURS
+#   blank, "OFF", "X", "-", "RDO", "PTO", "VAC"   not working
+# A long layout with ee_number, start and end columns (full timestamps) is also accepted.
+ID_COLUMNS = ["ee_number", "first_name", "last_name", "nametag_id"]
+OFF_CODES = {"", "OFF", "X", "-", "RDO", "PTO", "VAC", "NAN", "NONE", "NAT"}
+MAX_SHIFT_HOURS = 16
+
+# Compact long form: one row per worked shift
+SHIFT_SCHEMA = {"shift_id": "int64", "ee_number": "str", "start": "datetime64[ns]", "end": "datetime64[ns]"}
+
+_RANGE_PATTERN = (
+    r"^(?P<h1>\d{1,2})(?::(?P<m1>\d{2}))?\s*(?P<p1>[AP])?\.?M?\.?"
+    r"\s*(?:-|–|TO)\s*"
+    r"(?P<h2>\d{1,2})(?::(?P<m2>\d{2}))?\s*(?P<p2>[AP])?\.?M?\.?$"
+)
+
+
+def _clock_minutes(hour, minute, half):
+    hour = pd.to_numeric(hour, errors="coerce")
+    minute = pd.to_numeric(minute, errors="coerce").fillna(0)
+    hour = hour.where(half.isna(), hour % 12 + np.where(half == "P", 12, 0))
+    return hour * 60 + minute
+
+
+def parse_shift_cells(cells):
+    """Shift cell text -> DataFrame of start/end minutes after midnight (NaN when off or unreadable).
+
+    End minutes are past 1440 for shifts that run over midnight.
+    """
+    text = cells.astype(str).str.strip().str.upper()
+    parts = text.str.extract(_RANGE_PATTERN)
+    start = _clock_minutes(parts["h1"], parts["m1"], parts["p1"])
+    end = _clock_minutes(parts["h2"], parts["m2"], parts["p2"])
+    # A shift doesn't end before it starts: without am/pm "10-6" means 6 p.m., and
+    # anything still earlier ("22:00-06:00", "7:30 PM - 3:30 AM") runs past midnight
+    half_day = end + 12 * 60
+    end = end.mask((end <= start) & parts["p2"].isna() & (half_day > start), half_day)
+    end = end.where(end > start, end + 24 * 60)
+
+    for code, (low, high) in SHIFT_HOURS.items():
+        named = text == code
+        start = start.mask(named, low * 60)
+        end = end.mask(named, high * 60)
+
+    valid = start.between(0, 24 * 60 - 1) & (end > start) & (end - start <= MAX_SHIFT_HOURS * 60)
+    return pd.DataFrame({
+        "start_minutes": start.where(valid),
+        "end_minutes": end.where(valid),
+        "off": text.isin(OFF_CODES) | cells.isna(),
+    }, index=cells.index)
+
+
+def _date_columns(raw):
+    columns = [col for col in raw.columns if str(col).strip().lower() not in ID_COLUMNS]
+    dates = pd.to_datetime(pd.Series(columns, dtype=object).astype(str), errors="coerce", format="mixed")
+    return {col: date for col, date in zip(columns, dates) if pd.notna(date)}
+
+
+def normalize_employee_schedule(raw):
+    """Employee schedule upload (wide or long layout) -> (shifts, unparsed).
+
+    shifts follows SHIFT_SCHEMA, numbered by shift_id in start order;
+    unparsed lists the ee_number/date/cell of any cell that was neither a shift
+    nor an off code, so the importer can show what was skipped.
+    """
+    raw = raw.rename(columns=lambda col: str(col).strip().lower() if str(col).strip().lower() in
+                     ID_COLUMNS + ["start", "end"] else col)
+    if "ee_number" not in raw.columns:
+        raise ValueError("Employee schedule needs an ee_number column.")
+    ee = raw["ee_number"]
+    if pd.api.types.is_float_dtype(ee):
+        ee = ee.astype("Int64")
+    raw = raw.assign(ee_number=ee.astype(str).str.strip())
+
+    if {"start", "end"} <= set(raw.columns):
+        shifts = pd.DataFrame({
+            "ee_number": raw["ee_number"],
+            "start": pd.to_datetime(raw["start"], errors="coerce"),
+            "end": pd.to_datetime(raw["end"], errors="coerce"),
+        })
+        bad = shifts["start"].isna() | shifts["end"].isna() | (shifts["end"] <= shifts["start"])
+        unparsed = raw.loc[bad, ["ee_number", "start", "end"]].astype(str)
+        unparsed = unparsed.rename(columns={"start": "date", "end": "cell"})
+        return _finish(shifts[~bad]), unparsed.reset_index(drop=True)
+
+    date_columns = _date_columns(raw)
+    if not date_columns:
+        raise ValueError("No date columns found in the employee schedule.")
+    long = raw[["ee_number", *date_columns]].melt(id_vars="ee_number", var_name="column", value_name="cell")
+    long["date"] = long["column"].map(date_columns).astype("datetime64[ns]").dt.normalize()
+
+    parsed = parse_shift_cells(long["cell"])
+    worked = parsed["start_minutes"].notna()
+    unparsed = long.loc[~worked & ~parsed["off"], ["ee_number", "date", "cell"]].reset_index(drop=True)
+
+    long = long[worked]
+    shifts = pd.DataFrame({
+        "ee_number": long["ee_number"],
+        "start": long["date"] + pd.to_timedelta(parsed.loc[worked, "start_minutes"], unit="min"),
+        "end": long["date"] + pd.to_timedelta(parsed.loc[worked, "end_minutes"], unit="min"),
+    })
+    return _finish(shifts), unparsed
+
+
+def _finish(shifts):
+    shifts = shifts.sort_values(["start", "ee_number"], kind="stable").reset_index(drop=True)
+    shifts.insert(0, "shift_id", np.arange(len(shifts), dtype=np.int64))
+    return shifts.astype(SHIFT_SCHEMA)
+
+
+class EmployeeSchedule:
+    """Worked shifts as integer-coded intervals with a start-sorted interval index.
+
+    Dealers are encoded once (`dealers[dealer_id]` is the ee_number) and shifts
+    are held as parallel NumPy arrays sorted by start. Because no shift is longer
+    than `max_span`, every shift covering an instant t starts in (t - max_span, t],
+    so point and range queries are two searchsorted calls plus a filter over
+    that small slice, never a scan of the season.
+    """
+
+    def __init__(self, shifts):
+        shifts = shifts.sort_values(["start", "shift_id"], kind="stable")
+        codes, self.dealers = pd.factorize(shifts["ee_number"], sort=True)
+        self.dealers = pd.Index(self.dealers, dtype=object)
+        self.shift_id = shifts["shift_id"].to_numpy(dtype=np.int64)
+        self.dealer_id = codes.astype(np.int32)
+        self.start = shifts["start"].to_numpy(dtype="datetime64[ns]")
+        self.end = shifts["end"].to_numpy(dtype="datetime64[ns]")
+        self.max_span = (self.end - self.start).max() if len(shifts) else np.timedelta64(0, "ns")
+        self._sorted_end = np.sort(self.end)
+
+        # Per-dealer view: positions grouped by dealer, then by start
+        self._by_dealer = np.lexsort((self.start, self.dealer_id))
+        self._dealer_offsets = np.searchsorted(self.dealer_id[self._by_dealer], np.arange(len(self.dealers) + 1))
+
+    def __len__(self):
+        return len(self.shift_id)
+
+    def _frame(self, positions):
+        return pd.DataFrame({
+            "shift_id": self.shift_id[positions],
+            "ee_number": self.dealers.to_numpy()[self.dealer_id[positions]],
+            "start": self.start[positions],
+            "end": self.end[positions],
+        })
+
+    def to_frame(self):
+        return self._frame(np.arange(len(self)))
+
+    def overlapping(self, start, end):
+        """Shifts that overlap [start, end)."""
+        start, end = np.datetime64(pd.Timestamp(start), "ns"), np.datetime64(pd.Timestamp(end), "ns")
+        lo = np.searchsorted(self.start, start - self.max_span, side="right")
+        hi = np.searchsorted(self.start, end, side="left")
+        positions = lo + np.flatnonzero(self.end[lo:hi] > start)
+        return self._frame(positions)
+
+    def on_floor(self, when):
+        """Shifts in progress at `when` ("who is on the floor at 14:00 on June 3")."""
+        when = np.datetime64(pd.Timestamp(when), "ns")
+        lo = np.searchsorted(self.start, when - self.max_span, side="right")
+        hi = np.searchsorted(self.start, when, side="right")
+        positions = lo + np.flatnonzero(self.end[lo:hi] > when)
+        return self._frame(positions)
+
+    def headcount(self, times):
+        """Dealers on the floor at each of `times` (started at or before, not yet ended)."""
+        times = pd.DatetimeIndex(times).to_numpy(dtype="datetime64[ns]")
+        started = np.searchsorted(self.start, times, side="right")
+        ended = np.searchsorted(self._sorted_end, times, side="right")
+        return pd.Series(started - ended, index=pd.DatetimeIndex(times))
+
+    def shifts_for(self, ee_number):
+        """All shifts of one dealer, in start order."""
+        code = self.dealers.get_indexer([str(ee_number)])[0]
+        if code < 0:
+            return self._frame(np.array([], dtype=np.int64))
+        positions = self._by_dealer[self._dealer_offsets[code]:self._dealer_offsets[code + 1]]
+        return self._frame(positions)
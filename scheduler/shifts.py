@@ -1,6 +1,94 @@
 # scheduler/shifts.py
 import streamlit as st
+import pandas as pd
+
+from dealer.state import dealers_loaded, get_dealer_store
+from parse_cache import parse_upload
+from scheduler.state import apply_swaps, get_employee_schedule, get_swap_validator, schedule_loaded
+from scheduler.swaps import SWAP_COLUMNS
+
+
+def _shift_label(row):
+    return f"#{row['shift_id']}  {row['start']:%a %b %d %H:%M} - {row['end']:%H:%M}"
+
+
+def _pick_shift(schedule, ee_number, label, key):
+    shifts = schedule.shifts_for(ee_number)
+    shifts = shifts[shifts["end"] > pd.Timestamp.now()]
+    if shifts.empty:
+        st.info("No upcoming shifts for this dealer.")
+        return None
+    labels = {_shift_label(row): row["shift_id"] for _, row in shifts.iterrows()}
+    return labels[st.selectbox(label, list(labels), key=key)]
+
+
+def _show_results(validated):
+    ok = int(validated["ok"].sum())
+    st.caption(f"{ok} of {len(validated)} request(s) can be approved.")
+    st.dataframe(validated, use_container_width=True)
+    return ok
+
 
 def show_shift_swap():
     st.title("🕓 Shift Swap")
-    st.text("Stub for employee shift swap logic.")
\ No newline at end of file
+
+    if not schedule_loaded() or not dealers_loaded():
+        st.error("The employee schedule and dealer list are both needed. Please upload them on the import page.")
+        return
+
+    schedule = get_employee_schedule()
+    store = get_dealer_store()
+    validator = get_swap_validator()
+
+    # ---- Single Swap ----
+    st.subheader("🔁 Single Swap")
+    col1, col2 = st.columns(2)
+    giver = col1.text_input("EE Number giving up a shift").strip()
+    receiver = col2.text_input("EE Number taking the shift").strip()
+
+    unknown = [ee for ee in (giver, receiver) if ee and ee not in store]
+    for ee in unknown:
+        st.error(f"EE# {ee} is not on the roster.")
+
+    if giver and receiver and not unknown:
+        st.markdown(f"**{store.index.label(giver)}** ➜ **{store.index.label(receiver)}**")
+        shift_id = _pick_shift(schedule, giver, "Shift to give up:", "swap_give")
+        trade = st.checkbox("Trade: take one of their shifts in return")
+        swap_shift_id = _pick_shift(schedule, receiver, "Shift to take back:", "swap_take") if trade else None
+
+        if shift_id is not None and (not trade or swap_shift_id is not None):
+            request = pd.DataFrame([{
+                "shift_id": shift_id,
+                "to_ee_number": receiver,
+                "swap_shift_id": swap_shift_id if trade else None,
+            }])
+            result = validator.validate(request).iloc[0]
+            if result["warning"]:
+                st.warning(result["warning"])
+            if result["ok"]:
+                st.success("✅ No conflicts found.")
+                if st.button("Approve Swap"):
+                    apply_swaps(validator.validate(request))
+                    st.success("Swap applied.")
+                    st.rerun()
+            else:
+                st.error(f"Can't approve: {result['reason']}")
+
+    # ---- Batch Queue ----
+    st.markdown("---")
+    with st.expander("📋 Validate a Queue of Swap Requests"):
+        st.caption(
+            "Upload a CSV/XLSX with shift_id and to_ee_number (add swap_shift_id for trades). "
+            "Requests are checked in file order; earlier approvals count against later ones."
+        )
+        queue_file = st.file_uploader("Upload swap requests", type=["csv", "xlsx"], key="swap_queue")
+        if queue_file:
+            queue, missing = parse_upload(queue_file, "swaps", SWAP_COLUMNS[:2])
+            if missing:
+                st.error(f"Missing columns: {', '.join(missing)}")
+                return
+            validated = validator.validate(queue)
+            ok = _show_results(validated)
+            if ok and st.button(f"✅ Apply {ok} Approved Swap(s)"):
+                moves = apply_swaps(validated)
+                st.success(f"Moved {len(moves)} shift(s).")
@@ -0,0 +1,85 @@
+# scheduler/staffing.py
+import streamlit as st
+import pandas as pd
+
+from dealer.schema import DEALER_GROUPS
+from dealer.state import dealers_loaded, get_roster_supply
+from tournament.assign import GROUPS_FOR_GAME
+from tournament.state import get_rollup, tournaments_loaded
+
+# Gap rows per date: each shift against events starting in its window, and the
+# whole day (every dealer, including those with no shift set) against every event
+GAP_SHIFTS = {"DAY": "DAY", "SWING": "SWING", "ALL": None}
+
+
+def staffing_gaps(supply, rollup):
+    """Available dealers vs forecast dealer demand per date x shift for the supply's date range.
+
+    Columns: date, shift, available (plus one per dealer group), available_live
+    (groups that can deal mixed games), demand, mixed_demand, gap, mixed_gap and
+    shortfall (dealers missing on the tighter of the two, 0 when covered).
+    """
+    start, end = supply.dates[0], supply.dates[-1]
+    frames = []
+    for label, shift in GAP_SHIFTS.items():
+        demand = rollup.daily(start, end, window=shift)["dealers"].to_numpy()
+        mixed = rollup.daily(start, end, window=shift, game_type="Mixed")["dealers"].to_numpy()
+        frame = pd.DataFrame({
+            "date": supply.dates,
+            "shift": label,
+            "available": supply.available(shift).to_numpy(),
+            **{group.lower(): supply.available(shift, group).to_numpy() for group in DEALER_GROUPS},
+            "available_live": supply.available(shift, GROUPS_FOR_GAME["Mixed"]).to_numpy(),
+            "demand": demand.round().astype(int),
+            "mixed_demand": mixed.round().astype(int),
+        })
+        frames.append(frame)
+
+    gaps = pd.concat(frames, ignore_index=True)
+    gaps["gap"] = gaps["available"] - gaps["demand"]
+    gaps["mixed_gap"] = gaps["available_live"] - gaps["mixed_demand"]
+    gaps["shortfall"] = (-gaps[["gap", "mixed_gap"]].min(axis=1)).clip(lower=0)
+    order = pd.Categorical(gaps["shift"], categories=list(GAP_SHIFTS))
+    return gaps.assign(_order=order).sort_values(["date", "_order"], kind="stable").drop(columns="_order")
+
+
+def show_staffing_gaps():
+    st.title("⚖️ Staffing Gaps")
+
+    if not tournaments_loaded() or not dealers_loaded():
+        st.error("Tournament data and the dealer list are both needed. Please import them on the import page.")
+        return
+
+    rollup = get_rollup()
+    if not rollup.days:
+        st.warning("The tournament schedule has no dated events.")
+        return
+    start = rollup.start
+    end = rollup.start + pd.Timedelta(days=rollup.days - 1)
+
+    # Kept in step with roster edits; only edited dealers are recounted
+    gaps = staffing_gaps(get_roster_supply(start, end), rollup)
+
+    shift = st.radio("Shift:", list(GAP_SHIFTS), horizontal=True)
+    only_short = st.checkbox("Show shortfalls only", value=True)
+
+    view = gaps[gaps["shift"] == shift]
+    short = view[view["shortfall"] > 0]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Days Short", len(short))
+    col2.metric("Dealers Short (total)", int(short["shortfall"].sum()))
+    col3.metric("Worst Day", short.loc[short["shortfall"].idxmax(), "date"].strftime("%b %d") if len(short) else "—")
+
+    st.line_chart(view.set_index("date")[["available", "demand"]])
+
+    table = short if only_short else view
+    if table.empty:
+        st.success("Supply covers the forecast on every day for this shift.")
+    else:
+        st.dataframe(table.assign(date=table["date"].dt.date), use_container_width=True)
+
+    st.caption(
+        "Demand is the unadjusted dealer projection. DAY/SWING compare dealers on that shift with events "
+        "starting in its window; ALL compares every available dealer with every event that day."
+    )
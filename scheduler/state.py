@@ -0,0 +1,128 @@
+# scheduler/state.py
+import threading
+from collections import deque
+
+import pandas as pd
+
+from dealer.overrides import changed_dealers
+from dealer.state import get_dealer_store, get_override_index
+from diagnostics import register_cache, section
+from roster_db import get_roster_db
+from scheduler.commute import CarpoolMatcher, commutes, home_areas
+from scheduler.schedule import EmployeeSchedule
+from scheduler.swaps import SwapValidator
+
+_SHARED = register_cache("scheduler.state._SHARED", {})
+_VALIDATOR = register_cache("scheduler.state._VALIDATOR", {})
+_CARPOOL = register_cache("scheduler.state._CARPOOL", {})
+_SWAPS = {}  # db.path -> recent (shifts version, ee_numbers moved) from apply_swaps
+_LOCK = threading.Lock()
+
+# How many recent swap batches _swapped_since() can report on
+SWAP_HISTORY = 64
+
+
+def _employee_schedule():
+    db = get_roster_db()
+    with _LOCK:
+        version = db.version("shifts")
+        cached = _SHARED.get(db.path)
+        if cached is None or cached[0] != version:
+            with section("load"):
+                cached = (version, EmployeeSchedule(db.load_shifts()))
+            _SHARED[db.path] = cached
+    return cached
+
+
+def get_employee_schedule():
+    """Process-wide EmployeeSchedule, rebuilt only when the shifts version changes."""
+    return _employee_schedule()[1]
+
+
+def get_swap_validator():
+    """SwapValidator over the current schedule and roster; rebuilt when either changes."""
+    db = get_roster_db()
+    schedule = get_employee_schedule()
+    store = get_dealer_store()
+    with _LOCK:
+        cached = _VALIDATOR.get(db.path)
+        if cached is not None and cached[0] is schedule and cached[1] is store and cached[2] == store.version:
+            return cached[3]
+    with section("aggregate"):
+        validator = SwapValidator(schedule, store.df)
+    with _LOCK:
+        _VALIDATOR[db.path] = (schedule, store, store.version, validator)
+    return validator
+
+
+def apply_swaps(validated):
+    """Write the approved rows of SwapValidator.validate() to the schedule. Returns the moves made."""
+    moves = get_swap_validator().approved_moves(validated)
+    if moves:
+        db = get_roster_db()
+        version = db.reassign_shifts(moves, pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S"))
+        moved = {str(ee) for pair in moves.values() for ee in pair}
+        with _LOCK:
+            _SWAPS.setdefault(db.path, deque(maxlen=SWAP_HISTORY)).append((version, moved))
+    return moves
+
+
+def _swapped_since(path, version, current):
+    """ee_numbers moved by swaps between two shifts versions, or None if any other write came between."""
+    moved = [ee for v, ee in _SWAPS.get(path, ()) if version < v <= current]
+    if len(moved) != current - version:
+        return None
+    return set().union(*moved)
+
+
+def get_carpool_matcher(start, end):
+    """CarpoolMatcher for start..end, kept in step with the schedule, roster and overrides.
+
+    Swaps, roster edits and temporary adjustments re-pool only the dealers they
+    touched; a new carpool profile upload, a schedule upload (or any shifts
+    write this process didn't make), a reloaded store or a different date range
+    rebuilds the pools.
+    """
+    db = get_roster_db()
+    schedule_version, schedule = _employee_schedule() if schedule_loaded() else (None, None)
+    store = get_dealer_store()
+    overrides = get_override_index()
+    dates = pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), freq="D")
+    profiles = db.version("carpool")
+
+    with _LOCK, section("aggregate"):
+        cached = _CARPOOL.get(db.path)
+        changed = None
+        if (cached is not None and cached["profiles"] == profiles and cached["store"] is store
+                and cached["dates"].equals(dates)):
+            positions = store.changed_since(cached["store_version"])
+            if positions is not None:
+                roster = store.df["ee_number"].to_numpy()
+                old = cached["roster"]
+                changed = set(roster[positions]) | set(old[positions[positions < len(old)]])
+                changed |= changed_dealers(cached["overrides"], overrides)
+                if cached["schedule"] is not schedule:
+                    moved = None
+                    if cached["schedule"] is not None and schedule is not None:
+                        moved = _swapped_since(db.path, cached["schedule_version"], schedule_version)
+                    changed = None if moved is None else changed | moved
+
+        if changed is None:
+            trips = commutes(schedule, store.df, dates, overrides)
+            matcher = CarpoolMatcher(trips, home_areas(db.load_carpool_profiles()))
+        else:
+            matcher = cached["matcher"]
+            changed &= set(matcher.areas.index)
+            if changed:
+                matcher.reschedule(changed, commutes(schedule, store.df, dates, overrides, changed))
+
+        _CARPOOL[db.path] = {
+            "profiles": profiles, "store": store, "store_version": store.version,
+            "roster": store.df["ee_number"].to_numpy(), "overrides": overrides,
+            "schedule": schedule, "schedule_version": schedule_version, "dates": dates, "matcher": matcher,
+        }
+    return matcher
+
+
+def schedule_loaded():
+    return get_roster_db().count("employee_shifts") > 0
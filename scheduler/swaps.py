@@ -0,0 +1,262 @@
+# scheduler/swaps.py
+import numpy as np
+import pandas as pd
+
+from dealer.schema import DAYS, weekday_bits
+from tournament.assign import GROUPS_FOR_GAME, WEEKLY_HOURS
+
+# A swap request moves shift_id to to_ee_number. With swap_shift_id it is a
+# trade: that shift (held by to_ee_number) moves back to the first shift's holder.
+SWAP_COLUMNS = ["shift_id", "to_ee_number", "swap_shift_id"]
+
+_MIXED_GROUPS = GROUPS_FOR_GAME["Mixed"]
+_DEALER_STRIDE = np.int64(1) << 32  # composite key: dealer_id * stride + start minute
+
+
+def _week_start(times):
+    """datetime64 values -> the Monday (datetime64[D]) of their week."""
+    day = times.astype("datetime64[D]")
+    return day - ((day.astype(np.int64) + 3) % 7).astype("timedelta64[D]")  # 1970-01-01 was a Thursday
+
+
+class SwapValidator:
+    """Checks swap requests against the employee schedule and the roster.
+
+    Each request becomes one transfer (or two for a trade) of a shift to a
+    receiving dealer, and every transfer must pass: the receiver is on the
+    roster and not removed by the shift date, is available that weekday, has
+    no shift overlapping it, and stays within the FT/PT weekly hours. Shifts
+    don't say which game they deal, so a mixed-capable giver (LIVE/ANY)
+    handing a shift to a HOLDEM dealer is only a warning.
+
+    The schedule's shifts are kept sorted by (dealer, start) under a single
+    composite int64 key, with a running total of hours alongside. The overlap
+    and weekly-hours checks for a whole queue are then vectorized searchsorted
+    calls on that key, so each transfer costs O(log n) however big the
+    schedule is.
+    """
+
+    def __init__(self, schedule, dealers):
+        self.schedule = schedule
+        self.dealers = dealers.reset_index(drop=True)
+        self._dealer_rows = pd.Index(self.dealers["ee_number"].astype(str))
+        self._shift_rows = pd.Index(schedule.shift_id)
+
+        key = schedule.dealer_id.astype(np.int64) * _DEALER_STRIDE + self._minutes(schedule.start)
+        order = np.argsort(key, kind="stable")
+        self._key = key[order]
+        self._end = schedule.end[order]
+        self._shift_at = schedule.shift_id[order]
+        hours = (schedule.end[order] - schedule.start[order]) / np.timedelta64(1, "h")
+        self._cum_hours = np.concatenate([[0.0], np.cumsum(hours)])
+
+    @staticmethod
+    def _minutes(times):
+        return (times.astype("datetime64[m]") - np.datetime64("1970-01-01", "m")).astype(np.int64)
+
+    # ---- transfers ----
+    def _transfers(self, requests):
+        """One row per shift that changes hands: request, shift position, receiver, shift they release."""
+        requests = requests.reset_index(drop=True)
+        shift_pos = self._shift_rows.get_indexer(pd.to_numeric(requests["shift_id"], errors="coerce").fillna(-1))
+        swap_ids = pd.to_numeric(requests.get("swap_shift_id", pd.Series(np.nan, index=requests.index)),
+                                 errors="coerce")
+        # -2: no trade; -1: trade with a shift id that doesn't exist (fails as "Unknown shift")
+        swap_pos = np.where(swap_ids.notna(), self._shift_rows.get_indexer(swap_ids.fillna(-1)), -2)
+
+        giver = np.where(shift_pos >= 0, self._holder(shift_pos), "")
+        receiver = requests["to_ee_number"].astype(str).str.strip().to_numpy()
+
+        forward = pd.DataFrame({
+            "request": requests.index, "shift_pos": shift_pos, "giver": giver,
+            "receiver": receiver, "released_pos": np.where(swap_pos >= 0, swap_pos, -1),
+        })
+        trades = swap_pos != -2
+        back = pd.DataFrame({
+            "request": requests.index[trades], "shift_pos": swap_pos[trades],
+            "giver": np.where(swap_pos[trades] >= 0, self._holder(swap_pos[trades]), ""),
+            "receiver": giver[trades], "released_pos": shift_pos[trades],
+        })
+        return pd.concat([forward, back], ignore_index=True)
+
+    def _holder(self, positions):
+        positions = np.maximum(positions, 0)
+        return self.schedule.dealers.to_numpy()[self.schedule.dealer_id[positions]].astype(str)
+
+    def _check(self, transfers):
+        n = len(transfers)
+        reasons = np.full(n, "", dtype=object)
+
+        def fail(mask, message):
+            # Keep the first reason each transfer fails on
+            now = mask & (reasons == "")
+            reasons[now] = message[now] if isinstance(message, np.ndarray) else message
+
+        pos = transfers["shift_pos"].to_numpy()
+        released = transfers["released_pos"].to_numpy()
+        receiver = transfers["receiver"].to_numpy().astype(str)
+        giver = transfers["giver"].to_numpy().astype(str)
+        fail(pos < 0, "Unknown shift")
+        fail(receiver == giver, "Shift already belongs to this dealer")
+        # In a trade the receiver has to hold the shift they give back
+        trade = released >= 0
+        fail(trade & (self._holder(released) != receiver), "Swap shift doesn't belong to the other dealer")
+
+        row = self._dealer_rows.get_indexer(receiver)
+        fail(row < 0, "Dealer not on the roster")
+        giver_row = self._dealer_rows.get_indexer(giver)
+
+        safe_pos = np.maximum(pos, 0)
+        safe_row = np.maximum(row, 0)
+        start = self.schedule.start[safe_pos]
+        end = self.schedule.end[safe_pos]
+
+        removal = self.dealers["removal_effective_date"].to_numpy(dtype="datetime64[ns]")[safe_row]
+        fail(~np.isnat(removal) & (removal <= start.astype("datetime64[D]").astype("datetime64[ns]")),
+             "Dealer removed by the shift date")
+
+        day_bits = weekday_bits(start)
+        mask = self.dealers["avail_mask"].to_numpy(dtype=np.uint8)[safe_row]
+        day_names = np.array(DAYS)[np.log2(day_bits).astype(int)]
+        fail((mask & day_bits) == 0, np.array([f"Not available on {d}" for d in day_names], dtype=object))
+
+        groups = self.dealers["dealer_group"].astype(object).to_numpy()
+        giver_mixed = np.isin(groups[np.maximum(giver_row, 0)], _MIXED_GROUPS) & (giver_row >= 0)
+        holdem_only = (row >= 0) & ~np.isin(groups[safe_row], _MIXED_GROUPS)
+        warnings = np.where(giver_mixed & holdem_only, "Receiver deals Hold'em only; check the shift's game", "")
+
+        overlaps = self._overlaps(receiver, start, end, released)
+        fail(overlaps, "Overlaps another shift")
+
+        # The weekly-hours limit is checked in _queue_conflicts, with the rest of the batch
+        hours, limit = self._week_hours(receiver, safe_row, start, end, released)
+
+        return transfers.assign(
+            shift_id=np.where(pos >= 0, self.schedule.shift_id[safe_pos], -1),
+            start=start, end=end, week_hours=hours, hour_limit=limit, reason=reasons, warning=warnings
+        )
+
+    def _codes(self, receiver):
+        return self.schedule.dealers.get_indexer(receiver)
+
+    def _overlaps(self, receiver, start, end, released):
+        code = self._codes(receiver)
+        has_shifts = code >= 0
+        base = np.maximum(code, 0).astype(np.int64) * _DEALER_STRIDE
+        seg_lo = np.searchsorted(self._key, base, side="left")
+        before_end = np.searchsorted(self._key, base + self._minutes(end), side="left")
+        released_id = np.where(released >= 0, self.schedule.shift_id[np.maximum(released, 0)], -1)
+
+        # The receiver's last shift starting before this one ends is the only one that can
+        # overlap it (their own shifts don't overlap); skip past the shift they're trading away
+        overlap = np.zeros(len(receiver), dtype=bool)
+        candidate = before_end - 1
+        for _ in range(2):
+            valid = has_shifts & (candidate >= seg_lo)
+            idx = np.maximum(candidate, 0)
+            is_released = valid & (self._shift_at[idx] == released_id)
+            hit = valid & ~is_released & (self._end[idx] > start)
+            overlap |= hit
+            candidate = np.where(is_released, candidate - 1, -1)
+        return overlap
+
+    def _week_hours(self, receiver, row, start, end, released):
+        code = self._codes(receiver)
+        base = np.maximum(code, 0).astype(np.int64) * _DEALER_STRIDE
+        monday = _week_start(start)
+        week_lo = np.searchsorted(self._key, base + self._minutes(monday.astype("datetime64[ns]")), side="left")
+        week_hi = np.searchsorted(self._key, base + self._minutes((monday + 7).astype("datetime64[ns]")), side="left")
+        current = np.where(code >= 0, self._cum_hours[week_hi] - self._cum_hours[week_lo], 0.0)
+
+        added = (end - start) / np.timedelta64(1, "h")
+        safe_released = np.maximum(released, 0)
+        rel_start = self.schedule.start[safe_released]
+        same_week = (released >= 0) & (_week_start(rel_start) == monday)
+        freed = np.where(same_week, (self.schedule.end[safe_released] - rel_start) / np.timedelta64(1, "h"), 0.0)
+
+        ft_pt = self.dealers["ft_pt"].astype(object).to_numpy()[row]
+        limit = pd.Series(ft_pt).map(WEEKLY_HOURS).fillna(WEEKLY_HOURS["PART TIME"]).to_numpy(dtype=float)
+        return current + added - freed, limit
+
+    # ---- public ----
+    def validate(self, requests):
+        """Validate a queue of requests (SWAP_COLUMNS) in order.
+
+        Returns the requests with from_ee_number, ok, reason and warning. Each
+        is checked against the schedule as it stands plus the requests approved
+        ahead of it in the queue: a shift can only move once per batch, earlier
+        approvals count towards a receiver's overlaps, and the hours they move
+        count for both the receiving and the giving dealer's week.
+        """
+        requests = requests.reset_index(drop=True)
+        if requests.empty:
+            return requests.assign(from_ee_number=[], ok=[], reason=[], warning=[])
+        checked = self._check(self._transfers(requests))
+        checked = self._queue_conflicts(checked)
+
+        by_request = checked.groupby("request")
+        first_reason = by_request["reason"].agg(lambda r: next((x for x in r if x), ""))
+        first_warning = by_request["warning"].agg(lambda w: next((x for x in w if x), ""))
+        forward = checked.drop_duplicates("request").set_index("request")
+        return requests.assign(
+            from_ee_number=forward["giver"].reindex(requests.index).to_numpy(),
+            ok=(first_reason == "").reindex(requests.index).to_numpy(),
+            reason=first_reason.reindex(requests.index).to_numpy(),
+            warning=first_warning.reindex(requests.index).to_numpy(),
+        )
+
+    def _queue_conflicts(self, checked):
+        # Individually valid transfers still compete with each other inside one batch.
+        # Walk them in queue order, keeping the shifts each dealer has picked up and
+        # one running hours change per (dealer, week) for receivers and givers alike.
+        request = checked["request"].to_numpy()
+        shift_id = checked["shift_id"].to_numpy()
+        giver = checked["giver"].to_numpy().astype(str)
+        receiver = checked["receiver"].to_numpy().astype(str)
+        start = checked["start"].to_numpy(dtype="datetime64[ns]")
+        end = checked["end"].to_numpy(dtype="datetime64[ns]")
+        week = _week_start(start)
+        hours = (end - start) / np.timedelta64(1, "h")
+        week_hours = checked["week_hours"].to_numpy(dtype=float)
+        limit = checked["hour_limit"].to_numpy(dtype=float)
+        reasons = checked["reason"].to_numpy(dtype=object).copy()
+
+        failed = set(request[reasons != ""])
+        taken = {}    # shift_id -> request that moved it
+        picked = {}   # ee_number -> [(start, end)] picked up so far
+        change = {}   # (ee_number, week) -> hours gained minus hours given away so far
+        for req, rows in sorted(checked.groupby("request").indices.items()):
+            if req in failed:
+                continue
+            reason = ""
+            for i in rows:
+                if shift_id[i] in taken:
+                    reason = f"Shift already moved by request {taken[shift_id[i]] + 1}"
+                    break
+                if any(s < end[i] and start[i] < e for s, e in picked.get(receiver[i], ())):
+                    reason = "Overlaps a shift picked up earlier in this batch"
+                    break
+                earlier = change.get((receiver[i], week[i]), 0.0)
+                total = week_hours[i] + earlier
+                if total > limit[i]:
+                    reason = (f"Over weekly hours with earlier swaps in this batch ({total:g}h)" if earlier
+                              else f"Over weekly hours ({total:g}h > {limit[i]:g}h)")
+                    break
+            if reason:
+                reasons[rows] = reason
+                continue
+            for i in rows:
+                taken[shift_id[i]] = req
+                picked.setdefault(receiver[i], []).append((start[i], end[i]))
+                change[(receiver[i], week[i])] = change.get((receiver[i], week[i]), 0.0) + hours[i]
+                change[(giver[i], week[i])] = change.get((giver[i], week[i]), 0.0) - hours[i]
+        return checked.assign(reason=reasons)
+
+    def approved_moves(self, validated):
+        """{shift_id: (from_ee_number, to_ee_number)} for the ok rows of validate()'s result."""
+        moves = {}
+        for row in validated[validated["ok"]].itertuples():
+            moves[int(row.shift_id)] = (str(row.from_ee_number), str(row.to_ee_number).strip())
+            if pd.notna(getattr(row, "swap_shift_id", np.nan)):
+                moves[int(row.swap_shift_id)] = (str(row.to_ee_number).strip(), str(row.from_ee_number))
+        return moves
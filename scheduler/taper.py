@@ -0,0 +1,85 @@
+# scheduler/taper.py
+import numpy as np
+import pandas as pd
+
+# Share of the first flight's dealers still needed on each later restart of an
+# event; the last factor repeats for any further restarts.
+DEFAULT_TAPER = (1.0, 0.5, 0.3, 0.1)
+TAPER_CURVES = {"default": DEFAULT_TAPER}
+
+
+def parse_curve(text):
+    """"1, 0.5, 0.3" -> (1.0, 0.5, 0.3); raises ValueError on anything else."""
+    factors = tuple(float(part) for part in str(text).replace(";", ",").split(",") if part.strip())
+    if not factors:
+        raise ValueError("A taper curve needs at least one factor.")
+    if any(f < 0 for f in factors):
+        raise ValueError("Taper factors can't be negative.")
+    return factors
+
+
+def restart_key(event_number):
+    """Digits of the event number that tie restarts together ("58-D2" -> "58"); NaN when none."""
+    return event_number.astype(str).str.extract(r"(\d+)", expand=False)
+
+
+def by_game_type(curves_by_game, default="default"):
+    """Curve chooser: curve name per row from game_type (e.g. {"Mixed": "mixed"})."""
+    def choose(df):
+        return df["game_type"].map(curves_by_game).fillna(default)
+    return choose
+
+
+def by_buy_in_tier(tiers, default="default"):
+    """Curve chooser from buy-in tiers: [(min_buy_in, curve_name), ...]; the highest tier reached wins."""
+    tiers = sorted(tiers)
+    def choose(df):
+        buy_in = pd.to_numeric(df["buy-in_amount"], errors="coerce").to_numpy(dtype=float)
+        names = np.full(len(df), default, dtype=object)
+        for threshold, name in tiers:
+            names[buy_in >= threshold] = name
+        return pd.Series(names, index=df.index)
+    return choose
+
+
+def _factor_table(curves):
+    # One row per curve, padded with its last factor so a single clipped column index works for all
+    width = max(len(curve) for curve in curves.values())
+    table = np.array([list(curve) + [curve[-1]] * (width - len(curve)) for curve in curves.values()])
+    return table, width
+
+
+def apply_restart_taper(df, curves=None, curve_for=None, value_col="dealer_projection"):
+    """Scale value_col on each restart by its position within the event.
+
+    Rows are ordered by date within each restart_key() group; the nth row gets
+    factor n of its curve. curve_for(df) returns a curve name per row (see
+    by_game_type/by_buy_in_tier) and each event uses the curve of its first
+    flight; without it every event uses curves["default"]. Rows with no digits
+    in the event number have no group and are dropped.
+
+    Returns a date-ordered copy with taper_factor, the scaled value_col and
+    adjusted_dealer_projection (rounded int, 0 where there is no projection).
+    """
+    curves = dict(TAPER_CURVES if curves is None else curves)
+    out = df.sort_values("date", kind="stable")
+    out = out.assign(restart_key=restart_key(out["event_number"]))
+    out = out[out["restart_key"].notna()].copy()
+
+    groups = out.groupby("restart_key", sort=False)
+    position = groups.cumcount().to_numpy()
+    if curve_for is None:
+        names = pd.Series("default", index=out.index)
+    else:
+        names = curve_for(out).reindex(out.index)
+        names = names.groupby(out["restart_key"], sort=False).transform("first")
+    unknown = set(names.unique()) - set(curves)
+    if unknown:
+        raise ValueError(f"No taper curve named {', '.join(sorted(map(str, unknown)))}.")
+
+    table, width = _factor_table(curves)
+    codes = pd.Categorical(names, categories=list(curves)).codes
+    out["taper_factor"] = table[codes, np.minimum(position, width - 1)]
+    out[value_col] = out[value_col] * out["taper_factor"]
+    out["adjusted_dealer_projection"] = out[value_col].fillna(0).round().astype(int)
+    return out.drop(columns="restart_key")
@@ -1,11 +1,99 @@
+# scheduler/temp_adjustments.py
 import streamlit as st
+import pandas as pd
+
+from dealer.overrides import OVERRIDE_KINDS, effective_roster
+from dealer.schema import SHIFT_TYPES
+from dealer.state import dealers_loaded, get_dealer_store, get_override_index
+from roster_db import get_roster_db
+
+KIND_LABELS = {
+    "UNAVAILABLE": "🚫 Unavailable (illness, emergency)",
+    "AVAILABLE": "✅ Extra availability",
+    "SHIFT": "🔄 Shift change",
+}
+
+
+def _add_override_form(store):
+    st.subheader("➕ New Adjustment")
+    ee = st.text_input("EE Number").strip()
+    if ee and ee not in store:
+        st.warning(f"EE# {ee} is not on the roster.")
+        return
+    if ee:
+        st.markdown(f"**{store.index.label(ee)}**")
+
+    kind = st.radio("Type:", OVERRIDE_KINDS, format_func=KIND_LABELS.get, horizontal=True)
+    col1, col2 = st.columns(2)
+    start = col1.date_input("From", value=pd.Timestamp.today().date())
+    end = col2.date_input("Through", value=start)
+    shift = st.selectbox("Works shift:", SHIFT_TYPES) if kind == "SHIFT" else ""
+    reason = st.text_input("Reason (optional)")
+
+    if st.button("Save Adjustment", disabled=not ee):
+        if end < start:
+            st.error("The end date is before the start date.")
+            return
+        get_roster_db().add_overrides([(ee, start, end, kind, shift, reason)])
+        st.success(f"Saved {KIND_LABELS[kind].split(' ', 1)[1].lower()} for EE# {ee}, {start} to {end}.")
+        st.rerun()
+
+
+def _override_list(overrides):
+    st.subheader("📋 Current and Upcoming Adjustments")
+    frame = overrides.frame
+    frame = frame[frame["end_date"] >= pd.Timestamp.today().normalize()]
+    if frame.empty:
+        st.info("No temporary adjustments in effect or scheduled.")
+        return
+    table = frame.assign(
+        start_date=frame["start_date"].dt.date,
+        end_date=frame["end_date"].dt.date,
+        delete=False,
+    )
+    edited = st.data_editor(table, disabled=list(frame.columns), hide_index=True, use_container_width=True)
+    doomed = edited.loc[edited["delete"], "override_id"]
+    if len(doomed) and st.button(f"🗑️ Delete {len(doomed)} Adjustment(s)"):
+        get_roster_db().delete_overrides(doomed)
+        st.rerun()
+
+
+def _roster_for_day(store, overrides):
+    st.subheader("📅 Effective Roster")
+    day = st.date_input("Date:", value=pd.Timestamp.today().date(), key="effective_day")
+    roster = effective_roster(store.df, day, overrides)
+    available = roster[roster["available"]]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Available", len(available))
+    col2.metric(f"Adjusted {day.strftime('%b %d')}", int(roster["overridden"].sum()))
+    col3.metric("Off by Adjustment", int((roster["overridden"] & ~roster["available"]).sum()))
+
+    st.dataframe(
+        available.groupby("shift_type")["dealer_group"].value_counts().unstack(fill_value=0),
+        use_container_width=True,
+    )
+    if st.checkbox("Show only adjusted dealers", value=True):
+        roster = roster[roster["overridden"]]
+    st.dataframe(roster, hide_index=True, use_container_width=True)
+
 
 def show_temp_adjustments():
     st.title("⏱️ Temporary Adjustments")
-    st.markdown("""
-    This page will support:
-    - 📅 Making short-term dealer scheduling overrides
-    - ✏️ Editing availability due to illness or emergencies
-    - 🕵️ Conflict resolution alerts
-    """)
-    st.info("Temporary Adjustments stub is live and wired!")
\ No newline at end of file
+
+    if not dealers_loaded():
+        st.error("No dealer data loaded. Please upload the dealer list on the import page.")
+        return
+
+    store = get_dealer_store()
+    overrides = get_override_index()
+    st.caption(
+        "Adjustments cover whole days (inclusive) and sit on top of each dealer's usual availability "
+        "and shift; the roster itself is not changed. The newest adjustment wins where two overlap."
+    )
+
+    _add_override_form(store)
+    st.markdown("---")
+    _override_list(overrides)
+    st.markdown("---")
+    _roster_for_day(store, overrides)
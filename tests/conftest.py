@@ -0,0 +1,86 @@
+# tests/conftest.py
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# The app's modules live at the repo root (streamlit run main.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from roster_db import RosterDB  # noqa: E402
+
+# Employee schedule shared by the scheduler tests; 2026-06-10 is a Wednesday
+SHIFTS = [
+    (1, "1001", "2026-06-10 10:00", "2026-06-10 18:00"),
+    (2, "1003", "2026-06-10 10:00", "2026-06-10 18:00"),
+    (3, "1002", "2026-06-11 18:00", "2026-06-12 02:00"),
+    (4, "1003", "2026-06-12 10:00", "2026-06-12 18:00"),
+    (5, "1001", "2026-06-13 10:00", "2026-06-13 18:00"),
+    (6, "1002", "2026-06-15 10:00", "2026-06-15 18:00"),
+    (7, "1003", "2026-06-15 12:00", "2026-06-15 20:00"),
+]
+
+# Temporary adjustments; 1001's one-day AVAILABLE is newer than their week off
+OVERRIDES = [
+    (1, "1001", "2026-06-08", "2026-06-14", "UNAVAILABLE", "", "surgery"),
+    (2, "1001", "2026-06-10", "2026-06-10", "AVAILABLE", "", ""),
+    (3, "1002", "2026-06-10", "2026-06-10", "SHIFT", "DAY", ""),
+    (4, "1003", "2026-06-15", "2026-06-16", "AVAILABLE", "", ""),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    return RosterDB(str(tmp_path / "roster.db"))
+
+
+@pytest.fixture
+def dealers():
+    from dealer.schema import dealer_record
+
+    rows = [
+        dealer_record(ee_number="1001", first_name="David", last_name="Ng", nametag_id="David",
+                      phone="702-555-0101", shift_type="DAY", ft_pt="FULL TIME", dealer_group="HOLDEM"),
+        dealer_record(ee_number="1002", first_name="David", last_name="Ortiz", nametag_id="David",
+                      phone="702-555-0102", shift_type="SWING", ft_pt="PART TIME", dealer_group="LIVE"),
+        dealer_record(ee_number="1003", first_name="Maria", last_name="Lopez", nametag_id="Mari",
+                      phone="702-555-0103", shift_type="DAY", ft_pt="FULL TIME", dealer_group="ANY"),
+    ]
+    return pd.concat(rows, ignore_index=True)
+
+
+@pytest.fixture
+def shifts():
+    frame = pd.DataFrame(SHIFTS, columns=["shift_id", "ee_number", "start", "end"])
+    frame[["start", "end"]] = frame[["start", "end"]].apply(pd.to_datetime)
+    return frame
+
+
+@pytest.fixture
+def schedule(shifts):
+    from scheduler.schedule import EmployeeSchedule
+
+    return EmployeeSchedule(shifts)
+
+
+@pytest.fixture
+def overrides():
+    from dealer.overrides import OverrideIndex
+
+    return OverrideIndex(pd.DataFrame(
+        OVERRIDES, columns=["override_id", "ee_number", "start_date", "end_date", "kind", "shift_type", "reason"]
+    ))
+
+
+@pytest.fixture
+def areas():
+    # Everyone lives within a few hundred metres of each other
+    from scheduler.commute import home_areas
+
+    return home_areas(pd.DataFrame({
+        "ee_number": ["1001", "1002", "1003"],
+        "home_area": ["", "", "Henderson"],
+        "latitude": [36.03, 36.031, 36.032],
+        "longitude": [-115.05, -115.051, -115.052],
+    }))
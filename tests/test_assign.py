@@ -0,0 +1,26 @@
+# tests/test_assign.py
+import pandas as pd
+
+from tournament.assign import assign_dealers
+from tournament.enrich import TOURNAMENT_COLUMNS, enrich_tournaments
+
+
+def _schedule(*names):
+    raw = pd.DataFrame({col: [None] * len(names) for col in TOURNAMENT_COLUMNS})
+    raw["Date"] = pd.Timestamp("2026-06-10")
+    raw["Time"] = "10:00:00"
+    raw["Event Number"] = [str(n) for n in range(1, len(names) + 1)]
+    raw["Event Name"] = list(names)
+    raw["Projection"] = 20
+    return enrich_tournaments(raw)
+
+
+def test_holdem_dealer_staffs_no_limit_event(dealers):
+    assignments, _ = assign_dealers(dealers, _schedule("No-Limit Hold'em"))
+    assert "1001" in assignments["ee_number"].tolist()
+
+
+def test_holdem_dealer_skips_mixed_event(dealers):
+    assignments, unfilled = assign_dealers(dealers, _schedule("Limit 2-7 Triple Draw"))
+    assert assignments["ee_number"].tolist() == ["1003"]
+    assert unfilled["unfilled"].tolist() == [9]
@@ -0,0 +1,85 @@
+# tests/test_carpool.py
+import pandas as pd
+
+from scheduler.commute import CELL_KM, CarpoolMatcher, commutes, home_areas
+
+DATES = pd.date_range("2026-06-10", "2026-06-11")
+
+
+def test_pools_share_window_and_area(dealers, areas):
+    matcher = CarpoolMatcher(commutes(None, dealers, DATES), areas)
+    pools = matcher.pools()
+    assert pools["members"].tolist() == ["1001, 1003", "1001, 1003"]  # both DAY; 1002 works SWING
+    assert matcher.unmatched()["ee_number"].unique().tolist() == ["1002"]
+
+
+def test_reschedule_matches_rebuild(dealers, areas):
+    matcher = CarpoolMatcher(commutes(None, dealers, DATES), areas)
+    dealers = dealers.copy()
+    dealers.loc[dealers["ee_number"] == "1003", "shift_type"] = "SWING"
+
+    matcher.reschedule({"1003"}, commutes(None, dealers, DATES, ee_numbers={"1003"}))
+
+    rebuilt = CarpoolMatcher(commutes(None, dealers, DATES), areas)
+    pd.testing.assert_frame_equal(matcher.pools(), rebuilt.pools())
+    assert matcher.pools_for("1003")["ee_number"].unique().tolist() == ["1002", "1003"]
+
+
+def _areas(latitudes):
+    return home_areas(pd.DataFrame({
+        "ee_number": ["1001", "1002", "1003"],
+        "latitude": latitudes,
+        "longitude": [-115.05, -115.05, -115.05],
+    }))
+
+
+def test_lone_dealers_pool_across_a_cell_boundary(dealers):
+    edge = 800 * CELL_KM / 111.0  # a grid row boundary
+    areas = _areas([edge - 0.001, 36.5, edge + 0.001])
+    assert areas.loc["1001", "cell_row"] + 1 == areas.loc["1003", "cell_row"]
+
+    matcher = CarpoolMatcher(commutes(None, dealers, DATES), areas)
+    assert matcher.pools()["members"].tolist() == ["1001, 1003", "1001, 1003"]
+
+    two_rows_apart = _areas([edge - 0.001, 36.5, edge + 0.05])
+    assert CarpoolMatcher(commutes(None, dealers, DATES), two_rows_apart).pools().empty
+
+
+def test_reschedule_across_a_boundary_matches_rebuild(dealers):
+    edge = 800 * CELL_KM / 111.0
+    areas = _areas([edge - 0.001, edge + 0.002, edge + 0.001])
+    matcher = CarpoolMatcher(commutes(None, dealers, DATES), areas)
+    dealers = dealers.copy()
+    dealers.loc[dealers["ee_number"] == "1002", "shift_type"] = "DAY"
+
+    matcher.reschedule({"1002"}, commutes(None, dealers, DATES, ee_numbers={"1002"}))
+
+    rebuilt = CarpoolMatcher(commutes(None, dealers, DATES), areas)
+    pd.testing.assert_frame_equal(matcher.pools(), rebuilt.pools())
+    assert matcher.pools_for("1001")["ee_number"].unique().tolist() == ["1001", "1002", "1003"]
+
+
+def test_swaps_repool_only_the_moved_dealers(db, dealers, shifts, monkeypatch):
+    from dealer import state as dealer_state
+    from scheduler import state
+    from scheduler.swaps import SWAP_COLUMNS
+
+    monkeypatch.setattr(state, "get_roster_db", lambda: db)
+    monkeypatch.setattr(dealer_state, "get_roster_db", lambda: db)
+    db.replace_dealers(dealers)
+    db.replace_shifts(shifts)
+    db.replace_carpool_profiles(pd.DataFrame({
+        "ee_number": ["1001", "1002", "1003"], "latitude": [36.03] * 3, "longitude": [-115.05] * 3,
+    }))
+    matcher = state.get_carpool_matcher("2026-06-10", "2026-06-16")
+
+    validated = state.get_swap_validator().validate(pd.DataFrame([(4, "1001", None)], columns=SWAP_COLUMNS))
+    assert state.apply_swaps(validated) == {4: ("1003", "1001")}
+    assert state.get_carpool_matcher("2026-06-10", "2026-06-16") is matcher  # re-pooled in place
+
+    state._CARPOOL.pop(db.path)
+    rebuilt = state.get_carpool_matcher("2026-06-10", "2026-06-16")
+    pd.testing.assert_frame_equal(matcher.pools(), rebuilt.pools())
+
+    db.replace_shifts(shifts)
+    assert state.get_carpool_matcher("2026-06-10", "2026-06-16") is not rebuilt
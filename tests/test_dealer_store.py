@@ -0,0 +1,52 @@
+# tests/test_dealer_store.py
+import numpy as np
+import pandas as pd
+
+from dealer.schema import DAY_BITS, dealer_record
+from dealer.store import DealerStore
+
+
+def test_bulk_update_skips_blank_cells(dealers):
+    store = DealerStore(dealers)
+    before = int(store.row("1002")["avail_mask"])
+    # What read_csv gives for a sheet where each row fills in different columns
+    changes = pd.DataFrame(
+        {"phone": ["702-555-0199", ""], "dealer_group": [np.nan, "HOLDEM"], "AVAIL-MON": ["NO", np.nan]},
+        index=["1001", "1002"],
+    )
+
+    assert store.update_many(changes, skip_blank=True) == []
+
+    first, second = store.row("1001"), store.row("1002")
+    assert first["phone"] == "702-555-0199"
+    assert first["dealer_group"] == "HOLDEM"
+    assert int(first["avail_mask"]) & int(DAY_BITS["MON"]) == 0
+    assert second["phone"] == "702-555-0102"
+    assert second["dealer_group"] == "HOLDEM"
+    assert int(second["avail_mask"]) == before
+
+
+def test_update_writes_blank_fields(dealers):
+    # The edit form sends every field, and an emptied one clears the value
+    store = DealerStore(dealers)
+    store.update("1003", {"phone": "", "ee_number": "1003"})
+    assert store.row("1003")["phone"] == ""
+
+
+def test_changed_since_reports_touched_rows(dealers):
+    store = DealerStore(dealers)
+    start = store.version
+    store.update("1002", {"phone": "702-555-0142"})
+    store.append(dealer_record(ee_number="1004", first_name="Ana", last_name="Diaz"))
+
+    assert store.changed_since(start).tolist() == [1, 3]
+    assert store.changed_since(store.version).tolist() == []
+    assert store.changed_since(start - 1) is None
+
+
+def test_rename_keeps_row_lookup(dealers):
+    store = DealerStore(dealers)
+    store.update("1001", {"ee_number": "2001"})
+    assert "1001" not in store
+    assert store.row("2001")["last_name"] == "Ng"
+    assert store.index.exact("ee_number", "2001") == ["2001"]
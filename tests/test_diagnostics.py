@@ -0,0 +1,26 @@
+# tests/test_diagnostics.py
+import numpy as np
+import pandas as pd
+
+import diagnostics
+from diagnostics import cache_frames, frame_footprint, register_cache
+
+
+class _Holder:
+    def __init__(self, frame):
+        self.frame = frame
+        self.mask = np.zeros(len(frame), dtype=bool)
+        self.flag = np.uint8(1)
+
+
+def test_cache_frames_finds_nested_frames_once(monkeypatch):
+    monkeypatch.setattr(diagnostics, "_CACHES", {})
+    frame = pd.DataFrame({"a": range(10)})
+    register_cache("store", {"/data/roster.db": _Holder(frame)})
+    register_cache("timeline", {"/data/roster.db": (1, frame, _Holder(frame.iloc[:5]))})
+
+    found = cache_frames()
+
+    assert list(found) == ["store.frame", "store.mask", "timeline[2].frame", "timeline[2].mask"]
+    rows = {row["key"]: row["rows"] for row in frame_footprint(found)}
+    assert rows["store.frame"] == 10 and rows["timeline[2].frame"] == 5
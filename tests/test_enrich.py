@@ -0,0 +1,9 @@
+# tests/test_enrich.py
+import pandas as pd
+
+from tournament.enrich import classify_game
+
+
+def test_no_limit_is_holdem():
+    names = pd.Series(["No-Limit Hold'em", "NLH No Limit 6 Max", "Limit Hold'em", "Pot-Limit Omaha", "HORSE"])
+    assert classify_game(names).tolist() == ["Hold'em", "Hold'em", "Mixed", "Mixed", "Mixed"]
@@ -0,0 +1,44 @@
+# tests/test_equivalence.py
+"""The vectorized engines against the row-wise code they replaced (see benchmarks/)."""
+import os
+
+import pytest
+
+from benchmarks.bench_enrich import (
+    SAMPLE, UNCLASSIFIED, assert_identical, legacy_enrich, no_limit_reclassified, tiled_schedule,
+)
+from benchmarks.bench_taper import assert_same_taper, legacy_taper
+from benchmarks.synthetic import schedule
+from scheduler.taper import apply_restart_taper
+from tournament.enrich import enrich_tournaments
+
+needs_sample = pytest.mark.skipif(not os.path.exists(SAMPLE), reason="sample schedule not in data/")
+
+
+def _assert_matches(old, new):
+    # The row-wise code classed No-Limit events as Mixed; those rows differ in
+    # game_type (and the handedness/dealer_projection derived from it) only
+    moved = no_limit_reclassified(old, new)
+    assert (old.loc[moved, "game_type"] == "Mixed").all() and (new.loc[moved, "game_type"] == "Hold'em").all()
+    assert_identical(old[~moved], new[~moved])
+    assert_identical(old[moved], new[moved], UNCLASSIFIED)
+    return moved
+
+
+@needs_sample
+def test_enrich_matches_row_wise_on_sample():
+    raw = tiled_schedule(2)
+    moved = _assert_matches(legacy_enrich(raw), enrich_tournaments(raw))
+    assert moved.sum() == 2 * 189  # of 756 events per copy
+
+
+def test_enrich_matches_row_wise_on_synthetic():
+    raw = schedule(days=10, events_per_day=12)
+    moved = _assert_matches(legacy_enrich(raw), enrich_tournaments(raw))
+    assert moved.any()
+
+
+@needs_sample
+def test_taper_matches_per_group():
+    df = enrich_tournaments(tiled_schedule(2))
+    assert_same_taper(legacy_taper(df), apply_restart_taper(df[df["is_restart"] == True]))  # noqa: E712
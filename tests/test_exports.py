@@ -0,0 +1,87 @@
+# tests/test_exports.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+import exports
+from exports import REPORTS, ExportCache, ReportSource, build_report, export_csv
+
+
+@pytest.fixture
+def source(db, dealers):
+    dealers = dealers.copy()
+    dealers.loc[dealers["ee_number"] == "1002", "removal_effective_date"] = pd.Timestamp("2026-06-01")
+    db.replace_dealers(dealers)
+    return ReportSource(db)
+
+
+@pytest.mark.parametrize("name", ["roster", "removals", "uniform_status", "missing_uniform_returns"])
+def test_dealer_reports_come_in_chunks(source, name, monkeypatch):
+    whole = build_report(source, name, as_of="2026-06-15")
+    monkeypatch.setattr(exports, "CHUNK_ROWS", 1)
+    chunks = list(REPORTS[name][2](source, **exports._options(as_of="2026-06-15")))
+
+    assert max(len(chunk) for chunk in chunks) == 1
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole)
+
+
+def test_roster_report_as_of(source):
+    assert build_report(source, "roster", as_of="2026-06-15")["ee_number"].tolist() == ["1001", "1003"]
+    removals = build_report(source, "removals", as_of="2026-05-15")
+    assert removals[["ee_number", "status"]].values.tolist() == [["1002", "Scheduled"]]
+
+
+def test_export_csv_is_cached_until_dealers_change(source, tmp_path, monkeypatch):
+    monkeypatch.setattr(exports, "CHUNK_ROWS", 2)
+    cache = ExportCache(cache_dir=str(tmp_path))
+    path = export_csv(source, "uniform_status", cache=cache, as_of="2026-06-15")
+    assert export_csv(source, "uniform_status", cache=cache, as_of="2026-06-15") == path
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(pd.read_csv(path)) == 3
+
+    source.db.log_uniform_returns([("1001", "2026-06-14", "Shirt", "06141530-1")])
+    assert export_csv(source, "uniform_status", cache=cache, as_of="2026-06-15") != path
+
+
+def test_empty_report_keeps_header(source, tmp_path):
+    empty = exports._take(source.roster.dealers, [], exports.DEALER_EXPORT_COLUMNS)
+    exports.write_csv(empty, str(tmp_path / "empty.csv"))
+    assert list(pd.read_csv(tmp_path / "empty.csv").columns) == exports.DEALER_EXPORT_COLUMNS
+
+
+def test_pruned_export_is_a_miss(tmp_path, monkeypatch):
+    cache = ExportCache(cache_dir=str(tmp_path), max_entries=1)
+    written = []
+
+    def write(path):
+        written.append(path)
+        with open(path, "w") as f:
+            f.write("ee_number\n")
+
+    path = cache.fetch("a", "csv", write)
+    os.remove(path)  # pruned by another session
+    assert cache.fetch("a", "csv", write) == path and os.path.exists(path)
+    assert (cache.hits, cache.misses, len(written)) == (0, 2, 2)
+
+    real_remove = os.remove
+
+    def raced(path):
+        real_remove(path)
+        raise FileNotFoundError(path)  # another thread got there first
+
+    monkeypatch.setattr(exports.os, "remove", raced)
+    cache.fetch("b", "csv", write)
+    assert os.listdir(tmp_path) == ["b.csv"]
+
+
+def test_counters_under_concurrent_fetches(tmp_path):
+    cache = ExportCache(cache_dir=str(tmp_path), max_entries=2)
+
+    def fetch(n):
+        return cache.fetch(str(n % 3), "csv", lambda path: open(path, "w").close())
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(fetch, range(300)))
+    assert cache.hits + cache.misses == 300
@@ -0,0 +1,18 @@
+# tests/test_manage.py
+from manage import _folder_name, series_jobs
+
+
+def test_series_names_are_unique_folders(tmp_path):
+    paths = []
+    for folder in ["east", "west", "old/east"]:
+        (tmp_path / folder).mkdir(parents=True)
+        path = tmp_path / folder / "series.csv"
+        path.write_text("Date\n")
+        paths.append(str(path))
+    solo = tmp_path / "main event.csv"
+    solo.write_text("Date\n")
+
+    jobs = series_jobs(paths + [str(solo)])
+
+    assert [name for _, _, name in jobs] == ["east-series", "west-series", "east-series-2", "main event"]
+    assert len({_folder_name(name) for _, _, name in jobs}) == len(jobs)
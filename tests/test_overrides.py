@@ -0,0 +1,25 @@
+# tests/test_overrides.py
+import pandas as pd
+
+from dealer.overrides import OverrideIndex, changed_dealers, effective_roster
+
+
+def test_between_finds_overlapping_ranges(overrides):
+    assert sorted(overrides.override_id[overrides.between("2026-06-10", "2026-06-12")]) == [1, 2, 3]
+    assert sorted(overrides.override_id[overrides.between("2026-06-13", "2026-06-15")]) == [1, 4]
+    assert overrides.active_on("2026-06-21").empty
+
+
+def test_effective_roster_applies_newest_override(dealers, overrides):
+    roster = effective_roster(dealers, "2026-06-10", overrides).set_index("ee_number")
+    assert roster.loc["1001", "available"]
+    assert roster.loc["1002", "shift_type"] == "DAY"
+    assert roster["overridden"].tolist() == [True, True, False]
+
+    assert not effective_roster(dealers, "2026-06-11", overrides).set_index("ee_number").loc["1001", "available"]
+
+
+def test_changed_dealers(overrides):
+    before = OverrideIndex(overrides.frame.iloc[:2])
+    assert changed_dealers(before, overrides) == {"1002", "1003"}
+    assert changed_dealers(None, before) == {"1001"}
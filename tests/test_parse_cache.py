@@ -0,0 +1,50 @@
+# tests/test_parse_cache.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from parse_cache import ParseCache
+
+
+def test_sidecar_survives_restart(tmp_path):
+    frame = pd.DataFrame({"Date": pd.to_datetime(["2026-06-01", "2026-06-02"]), "Projection": [100, 250]})
+    cache = ParseCache(cache_dir=str(tmp_path), max_entries=2)
+    key = cache.key(b"schedule bytes", "tournaments")
+    cache.put(key, frame)
+
+    assert sorted(os.listdir(tmp_path)) == [f"{key}.parquet"]
+    pd.testing.assert_frame_equal(ParseCache(cache_dir=str(tmp_path)).get(key), frame)
+
+
+def test_lru_under_concurrent_sessions(tmp_path):
+    cache = ParseCache(cache_dir=str(tmp_path), max_entries=4)
+
+    def session(n):
+        key = cache.key(str(n % 8).encode(), "dealers")
+        if cache.get(key) is None:
+            cache.put(key, pd.DataFrame({"n": [n % 8]}))
+        got = cache.get(key)  # may already be evicted by the other sessions
+        return got is None or int(got["n"].iloc[0]) == n % 8
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(session, range(400)))
+    assert cache.stats()["entries"] <= 4
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_sidecar_prunes_are_not_evictions(tmp_path):
+    cache = ParseCache(cache_dir=str(tmp_path), max_entries=2)
+    for n in range(3):
+        cache.put(cache.key(bytes([n]), "dealers"), pd.DataFrame({"n": [n]}))
+    stats = cache.stats()
+    assert (stats["evictions"], stats["sidecar_prunes"]) == (1, 1)
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_unencodable_sheet_stays_in_memory(tmp_path):
+    cache = ParseCache(cache_dir=str(tmp_path))
+    key = cache.key(b"mixed", "dealers")
+    cache.put(key, pd.DataFrame({"Zip": [89052, "89052-1234"]}, dtype=object))
+    assert os.listdir(tmp_path) == []
+    assert cache.get(key)["Zip"].tolist() == [89052, "89052-1234"]
@@ -0,0 +1,36 @@
+# tests/test_returns.py
+from dealer.returns import AMBIGUOUS, QUEUED, RETURNED, UNKNOWN, UPDATED, ReturnQueue
+from dealer.store import DealerStore
+
+
+def test_shared_nametag_is_ambiguous(dealers):
+    store = DealerStore(dealers)
+    queue = ReturnQueue()
+
+    assert queue.scan(store, "david", ["Shirt"]) == (AMBIGUOUS, ["1001", "1002"])
+    assert len(queue) == 0
+    assert queue.scan(store, "1002", ["Shirt"]) == (QUEUED, "1002")
+
+
+def test_scan_outcomes(dealers):
+    store = DealerStore(dealers)
+    queue = ReturnQueue()
+    results = queue.scan_many(store, ["MARI", "1003", "9999"], ["Shirt"])
+    assert [(outcome, ee) for _, outcome, ee in results] == [(QUEUED, "1003"), (UPDATED, "1003"), (UNKNOWN, None)]
+
+    queue.scan(store, "1003", ["Vest"])
+    assert queue.entries["1003"] == ["Shirt", "Vest"]
+
+
+def test_commit_logs_batch_once(dealers):
+    store = DealerStore(dealers)
+    queue = ReturnQueue()
+    queue.scan_many(store, ["1001", "1003"], ["Shirt", "Name Tag"])
+
+    logged = queue.commit(store, return_date="2026-06-14")
+
+    assert [row[0] for row in logged] == ["1001", "1003"]
+    assert len({row[3] for row in logged}) == 2
+    assert store.row("1003")["uniform_return_items"] == "Shirt, Name Tag"
+    assert len(queue) == 0
+    assert queue.scan(store, "1001", ["Shirt"]) == (RETURNED, "1001")
@@ -0,0 +1,31 @@
+# tests/test_rollup.py
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import schedule
+from tournament.enrich import enrich_tournaments, forecast_dealers
+from tournament.rollup import ROLLUP_COLUMNS, DealerRollup
+
+COLUMNS = ROLLUP_COLUMNS + ["dealer_projection"]
+
+
+def test_update_matches_rebuild():
+    df = enrich_tournaments(schedule(days=12, events_per_day=10))
+    rollup = DealerRollup(df)
+    rollup.total(df["date"].min(), df["date"].max())  # build the cumulative sum before editing
+
+    edited = df.copy()
+    ids = edited.index[::7]
+    edited.loc[ids, "projection"] = np.arange(len(ids)) * 150.0
+    edited.loc[ids[:3], "projection"] = np.nan
+    edited.loc[ids, "dealer_projection"] = forecast_dealers(edited.loc[ids, "projection"], edited.loc[ids, "handedness"])
+    rollup.update(df.loc[ids, COLUMNS], edited.loc[ids, COLUMNS])
+
+    fresh = DealerRollup(edited)
+    first, last = edited["date"].min(), edited["date"].max()
+    for filters in [{}, {"restart": True}, {"game_type": "Mixed", "window": ["DAY", "SWING"]}]:
+        pd.testing.assert_frame_equal(rollup.daily(first, last, **filters), fresh.daily(first, last, **filters))
+        assert rollup.total(first, last, **filters) == fresh.total(first, last, **filters)
+        assert rollup.total(first + pd.Timedelta(days=3), first + pd.Timedelta(days=9), **filters) == \
+            fresh.total(first + pd.Timedelta(days=3), first + pd.Timedelta(days=9), **filters)
+    assert rollup.event_count(first, last) == fresh.event_count(first, last) == int(edited["date"].notna().sum())
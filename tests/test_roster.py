@@ -0,0 +1,57 @@
+# tests/test_roster.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dealer.roster import RosterTimeline
+
+DATES = pd.date_range("2026-06-09", "2026-06-13")
+
+
+@pytest.fixture
+def roster(dealers):
+    # 1001 leaves on 06-12, 1002 stays, 1003 leaves on 06-10
+    removal = pd.to_datetime(["2026-06-12", None, "2026-06-10"]).astype("datetime64[ns]")
+    return dealers.assign(removal_effective_date=removal)
+
+
+def test_removal_date_is_the_first_day_off(roster):
+    timeline = RosterTimeline(roster)
+    assert sorted(timeline.positions_on("2026-06-11")) == [0, 1]
+    assert sorted(timeline.positions_on("2026-06-12")) == [1]
+    assert sorted(timeline.positions_on("2026-06-12 08:00")) == [1]  # time of day is ignored
+    assert timeline.positions_on("2100-01-01").tolist() == [1]  # no removal date: never leaves
+    assert timeline.removed_between("2026-06-10", "2026-06-12").tolist() == [0]
+    assert timeline.counts(DATES).tolist() == [3, 2, 2, 1, 1]
+
+
+def test_masks_agree_with_positions(roster):
+    timeline = RosterTimeline(roster)
+    matrix = timeline.active_matrix(DATES)
+    assert matrix.shape == (len(DATES), len(roster))
+    for row, date in zip(matrix, DATES):
+        expected = np.isin(np.arange(len(roster)), timeline.positions_on(date))
+        np.testing.assert_array_equal(timeline.mask_on(date), expected)
+        np.testing.assert_array_equal(row, expected)
+    assert timeline.on("2026-06-11")["ee_number"].tolist() == ["1001", "1002"]
+
+
+def test_unchanged_tracks_removal_dates(roster):
+    timeline = RosterTimeline(roster)
+    assert timeline.unchanged(roster, [0, 1, 2])
+    assert not timeline.unchanged(roster.copy(), [0])
+
+    roster.loc[1, "removal_effective_date"] = pd.Timestamp("2026-06-11")
+    assert timeline.unchanged(roster, [0, 2])
+    assert not timeline.unchanged(roster, [1])
+
+
+def test_empty_roster(dealers):
+    empty = dealers.iloc[:0]
+    timeline = RosterTimeline(empty)
+    assert len(timeline) == 0
+    assert timeline.positions_on("2026-06-10").tolist() == []
+    assert timeline.mask_on("2026-06-10").shape == (0,)
+    assert timeline.active_matrix(DATES).shape == (len(DATES), 0)
+    assert timeline.counts(DATES).tolist() == [0] * len(DATES)
+    assert timeline.unchanged(empty, [])
@@ -0,0 +1,47 @@
+# tests/test_roster_db.py
+import pandas as pd
+
+from dealer.schema import DEALER_COLUMNS, extra_columns, key_problems, normalize_dealers
+from roster_db import TOURNAMENT_FIELDS
+
+
+def test_serial_dates_round_trip(db, tmp_path):
+    # Date cells stored as numbers come back from read_excel as Excel serials
+    schedule = pd.DataFrame({field: [None, None] for field in TOURNAMENT_FIELDS})
+    schedule["Date"] = [45500, 45501]
+    schedule["Event Name"] = ["No-Limit Hold'em", "H.O.R.S.E."]
+    schedule["Projection"] = [1200, 300]
+    path = tmp_path / "schedule.xlsx"
+    schedule.to_excel(path, index=False)
+
+    db.replace_tournaments(pd.read_excel(path))
+    loaded = db.load_tournaments()
+
+    assert loaded["Date"].tolist() == [pd.Timestamp("2024-07-27"), pd.Timestamp("2024-07-28")]
+    assert len(db.load_tournaments(start="2024-07-28")) == 1
+
+
+def test_text_dates_round_trip(db):
+    schedule = pd.DataFrame({field: [None] for field in TOURNAMENT_FIELDS})
+    schedule["Date"] = ["2024-07-26"]
+    db.replace_tournaments(schedule)
+    assert db.load_tournaments()["Date"].tolist() == [pd.Timestamp("2024-07-26")]
+
+
+def test_dealer_list_with_repeated_and_blank_ee_numbers(db, tmp_path):
+    upload = pd.DataFrame({col: ["x"] * 4 for col in DEALER_COLUMNS})
+    upload["ee_number"] = [1001, 1002, 1001, None]
+    upload["first_name"] = ["David", "Maria", "Dave", "Ken"]
+    upload["User_Added"] = ["yes"] * 4
+    path = tmp_path / "dealers.xlsx"
+    upload.to_excel(path, index=False)
+
+    df = normalize_dealers(pd.read_excel(path))
+    reasons = key_problems(df)
+    assert reasons.tolist() == ["", "", "EE number repeated in file", "Missing EE number"]
+    assert extra_columns(df) == ["User_Added"]
+
+    db.replace_dealers(df[reasons == ""])
+    loaded = db.load_dealers()
+    assert loaded["ee_number"].tolist() == ["1001", "1002"]
+    assert loaded["first_name"].tolist() == ["David", "Maria"]
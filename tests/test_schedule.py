@@ -0,0 +1,45 @@
+# tests/test_schedule.py
+import numpy as np
+import pandas as pd
+
+from scheduler.schedule import EmployeeSchedule, parse_shift_cells
+
+
+def _brute_on_floor(shifts, when):
+    return sorted(shifts.loc[(shifts["start"] <= when) & (shifts["end"] > when), "shift_id"])
+
+
+def test_queries_across_midnight(schedule):
+    # Shift 3 is 1002's 18:00-02:00 on June 11
+    assert schedule.overlapping("2026-06-12 00:00", "2026-06-12 01:00")["shift_id"].tolist() == [3]
+    assert schedule.on_floor("2026-06-12 01:59")["shift_id"].tolist() == [3]
+    assert schedule.on_floor("2026-06-12 02:00").empty
+    assert schedule.overlapping("2026-06-11 00:00", "2026-06-11 18:00").empty
+    assert schedule.headcount(["2026-06-11 23:00", "2026-06-12 02:00"]).tolist() == [1, 0]
+    assert schedule.shifts_for("1003")["shift_id"].tolist() == [2, 4, 7]
+    assert schedule.shifts_for("9999").empty
+
+
+def test_long_shift_widens_the_search_window(shifts):
+    # 14 hours, starting well before everything else on the floor at 19:00
+    long = pd.DataFrame([(8, "1004", pd.Timestamp("2026-06-13 06:00"), pd.Timestamp("2026-06-13 20:00"))],
+                        columns=shifts.columns)
+    shifts = pd.concat([shifts, long], ignore_index=True)
+    schedule = EmployeeSchedule(shifts)
+    assert schedule.max_span == np.timedelta64(14, "h")
+    assert schedule.on_floor("2026-06-13 19:00")["shift_id"].tolist() == [8]
+    assert schedule.overlapping("2026-06-13 19:30", "2026-06-13 23:00")["shift_id"].tolist() == [8]
+
+    instants = pd.date_range("2026-06-10", "2026-06-16", freq="30min")
+    for when in instants:
+        assert sorted(schedule.on_floor(when)["shift_id"]) == _brute_on_floor(shifts, when)
+    brute = [len(_brute_on_floor(shifts, when)) for when in instants]
+    assert schedule.headcount(instants).tolist() == brute
+
+
+def test_parse_shift_cells():
+    parsed = parse_shift_cells(pd.Series(["10:00-18:00", "10-6", "7:30 PM - 3:30 AM", "22:00-06:00", "SWING", "OFF", "??"]))
+    assert parsed["start_minutes"].tolist()[:5] == [600, 600, 1170, 1320, 900]
+    assert parsed["end_minutes"].tolist()[:5] == [1080, 1080, 1650, 1800, 1380]
+    assert parsed["off"].tolist() == [False] * 5 + [True, False]
+    assert parsed.iloc[5:, :2].isna().all().all()
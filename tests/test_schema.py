@@ -0,0 +1,56 @@
+# tests/test_schema.py
+import numpy as np
+import pandas as pd
+
+from dealer.schema import (
+    ALL_DAYS_MASK, AVAIL_COLUMNS, DEALER_SCHEMA, availability_mask, coerce_columns, normalize_dealers, to_wide,
+)
+
+
+def _upload(**extra):
+    return pd.DataFrame({
+        "first_name": [" Maria ", "Ken"], "last_name": ["Lopez", "Ito"], "nametag_id": ["Mari", 7],
+        "ee_number": [1003.0, 1004.0], "email": [None, "ken@example.com"], "phone": ["702-555-0103", ""],
+        "ft_pt": ["Full Time", "pt"], "shift_type": ["day", "graveyard"], "dealer_group": ["Hold'em", "mixed"],
+        **extra,
+    })
+
+
+def test_normalize_dealers_types_and_values():
+    df = normalize_dealers(_upload(**{col: ["YES", "NO"] for col in AVAIL_COLUMNS}, User_Added=["x", "y"]))
+    assert {col: str(df[col].dtype) for col in DEALER_SCHEMA} == {col: str(dtype) for col, dtype in DEALER_SCHEMA.items()}
+    assert df["ee_number"].tolist() == ["1003", "1004"]
+    assert df["nametag_id"].tolist() == ["Mari", "7"]
+    assert df["first_name"].tolist() == ["Maria", "Ken"]
+    assert df["email"].tolist() == ["", "ken@example.com"]
+    assert df["ft_pt"].tolist() == ["FULL TIME", "PART TIME"]
+    assert df["shift_type"].isna().tolist() == [False, True]  # "graveyard" isn't a shift type
+    assert df["dealer_group"].tolist() == ["HOLDEM", "LIVE"]
+    assert df["avail_mask"].tolist() == [ALL_DAYS_MASK, 0]
+    assert df["User_Added"].tolist() == ["x", "y"]
+
+
+def test_missing_avail_columns_mean_available():
+    df = normalize_dealers(_upload(**{"AVAIL-SUN": ["NO", "yes"]}))
+    sunday = availability_mask({"SUN": True})
+    assert df["avail_mask"].tolist() == [ALL_DAYS_MASK & ~sunday, ALL_DAYS_MASK]
+    assert normalize_dealers(_upload())["avail_mask"].tolist() == [ALL_DAYS_MASK] * 2
+
+
+def test_coerce_columns_partial_edit():
+    out = coerce_columns(pd.DataFrame({
+        "ee_number": [1003.0], "shift_type": [" swing "], "avail_mask": [5], "AVAIL-MON": ["YES"], "notes": ["n"],
+    }))
+    assert out.columns.tolist() == ["ee_number", "shift_type", "avail_mask", "notes"]
+    assert out.iloc[0].tolist() == ["1003", "SWING", np.uint8(5), "n"]
+    assert out["avail_mask"].dtype == np.uint8
+
+
+def test_to_wide_round_trips():
+    df = normalize_dealers(_upload(**{col: ["NO", "YES"] for col in AVAIL_COLUMNS}))
+    df.loc[0, "removal_effective_date"] = pd.Timestamp("2026-07-01")
+    wide = to_wide(df)
+    assert wide.columns.tolist()[9:16] == AVAIL_COLUMNS
+    assert wide["AVAIL-WED"].tolist() == ["NO", "YES"]
+    assert wide["removal_effective_date"].tolist()[0] == "2026-07-01"
+    pd.testing.assert_frame_equal(normalize_dealers(wide)[list(DEALER_SCHEMA)], df[list(DEALER_SCHEMA)])
@@ -0,0 +1,40 @@
+# tests/test_search.py
+import pandas as pd
+
+from dealer.schema import dealer_record
+from dealer.search import DealerSearchIndex
+
+
+def test_search_orders_exact_prefix_then_substring(dealers):
+    index = DealerSearchIndex(dealers)
+    assert index.search("last_name", "ortiz") == ["1002"]
+    assert index.search("last_name", "o") == ["1002", "1003"]  # "Ortiz" starts with it, "Lopez" contains it
+    assert index.search("last_name", "ez") == ["1003"]
+    assert index.search("nametag_id", "mari") == ["1003"]
+    assert index.search("ee_number", "00") == ["1001", "1002", "1003"]
+    assert index.search("first_name", "david", limit=1) == ["1001"]
+    assert index.search("first_name", "  ") == []
+
+
+def test_exact_lookup_ignores_partial_ids(dealers):
+    index = DealerSearchIndex(dealers)
+    assert index.exact("nametag_id", "DAVID") == ["1001", "1002"]
+    assert index.exact("nametag_id", "Dav") == []
+    assert index.label("1003") == "Lopez, Maria (EE# 1003)"
+
+
+def test_incremental_edits_match_rebuild(dealers):
+    index = DealerSearchIndex(dealers)
+    added = dealer_record(ee_number="1004", first_name="Ana", last_name="De La Cruz", nametag_id="Ana")
+    index.add(added.iloc[0])
+    index.remove("1001")
+    renamed = dealers.iloc[2].copy()
+    renamed["ee_number"], renamed["last_name"] = "1005", "Perez"
+    index.update("1003", renamed)
+
+    rebuilt = DealerSearchIndex(pd.concat([dealers.iloc[[1]], added, renamed.to_frame().T], ignore_index=True))
+    for field, term in [("last_name", "cruz"), ("last_name", "ez"), ("first_name", "a"), ("ee_number", "100")]:
+        assert index.search(field, term) == rebuilt.search(field, term)
+    assert index.search("last_name", "lopez") == []
+    assert index.search("last_name", "cruz") == ["1004"]
+    assert len(index) == 3
@@ -0,0 +1,37 @@
+# tests/test_supply.py
+import numpy as np
+import pandas as pd
+
+from dealer.overrides import OverrideIndex, changed_dealers
+from dealer.schema import availability_mask, dealer_record
+from dealer.supply import RosterSupply
+
+START, END = "2026-06-08", "2026-06-21"
+
+
+def test_incremental_updates_match_rebuild(dealers, overrides):
+    supply = RosterSupply(dealers, START, END, overrides)
+
+    edited = pd.concat([dealers, dealer_record(ee_number="1004", shift_type="SWING", dealer_group="HOLDEM")],
+                       ignore_index=True)
+    edited.loc[1, ["shift_type", "avail_mask"]] = ["DAY", availability_mask({"MON": True, "FRI": True})]
+    edited.loc[2, "removal_effective_date"] = pd.Timestamp("2026-06-12")
+    before = supply.counts.copy()
+    supply.refresh(edited, [1, 2, 3])
+    assert (supply.counts != before).any()
+    np.testing.assert_array_equal(supply.counts, RosterSupply(edited, START, END, overrides).counts)
+
+    # Drop 1001's week off, move 1004 to DAY for a day
+    rows = overrides.frame[overrides.frame["override_id"] != 1]
+    added = pd.DataFrame([(5, "1004", "2026-06-16", "2026-06-16", "SHIFT", "DAY", "")], columns=rows.columns)
+    changed = OverrideIndex(pd.concat([rows, added], ignore_index=True))
+    before = supply.counts.copy()
+    supply.set_overrides(changed, changed_dealers(overrides, changed))
+    assert (supply.counts != before).any()
+    rebuilt = RosterSupply(edited, START, END, changed)
+    np.testing.assert_array_equal(supply.counts, rebuilt.counts)
+    pd.testing.assert_series_equal(supply.available("DAY"), rebuilt.available("DAY"))
+
+    # Removing every override is a change for all of them
+    supply.set_overrides(None, changed_dealers(changed, None))
+    np.testing.assert_array_equal(supply.counts, RosterSupply(edited, START, END).counts)
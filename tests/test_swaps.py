@@ -0,0 +1,67 @@
+# tests/test_swaps.py
+import pandas as pd
+import pytest
+
+from scheduler.swaps import SwapValidator
+
+
+@pytest.fixture
+def validator(schedule, dealers):
+    return SwapValidator(schedule, dealers)
+
+
+def _requests(*rows):
+    return pd.DataFrame(rows, columns=["shift_id", "to_ee_number", "swap_shift_id"])
+
+
+def test_validate_reasons(validator):
+    validated = validator.validate(_requests(
+        (1, "1003", None),   # 1003 already works 10-18 that day
+        (3, "1001", None),   # 1002 is LIVE; fine for a HOLDEM dealer, with a warning
+        (2, "9999", None),
+        (99, "1001", None),
+        (1, "1001", None),
+        (4, "1002", None),
+    ))
+    assert validated["reason"].tolist() == [
+        "Overlaps another shift",
+        "",
+        "Dealer not on the roster",
+        "Unknown shift",
+        "Shift already belongs to this dealer",
+        "",
+    ]
+    assert validated["from_ee_number"].tolist()[-1] == "1003"
+    assert validated["warning"].tolist()[1] == "Receiver deals Hold'em only; check the shift's game"
+    assert validated["warning"].tolist()[5] == ""  # ANY -> LIVE
+
+
+def test_queue_checks_earlier_approvals(validator):
+    validated = validator.validate(_requests((4, "1002", None), (4, "1002", None), (1, "1002", None)))
+    assert validated["ok"].tolist() == [True, False, True]
+    assert validated["reason"].tolist()[1] == "Shift already moved by request 1"
+    assert validator.approved_moves(validated) == {4: ("1003", "1002"), 1: ("1001", "1002")}
+
+
+def test_weekly_hours_count_the_batch(validator):
+    # Part-timers cap at 24h: 8h scheduled plus three 8h pickups is one too many
+    validated = validator.validate(_requests((4, "1002", None), (1, "1002", None), (5, "1002", None)))
+    assert validated["ok"].tolist() == [True, True, False]
+    assert validated["reason"].tolist()[2].startswith("Over weekly hours")
+
+
+def test_hours_given_away_earlier_in_the_batch_count(validator):
+    # 1002 is at 24h after two pickups, then gives shift 3 to 1001 and has room for shift 5
+    validated = validator.validate(_requests(
+        (4, "1002", None), (1, "1002", None), (3, "1001", None), (5, "1002", None)
+    ))
+    assert validated["ok"].tolist() == [True, True, True, True]
+
+
+def test_trade_releases_the_shift_given_back(validator):
+    # A straight move would overlap, but in a trade 1002 gives shift 6 back to 1003
+    assert validator.validate(_requests((7, "1002", None)))["reason"].tolist() == ["Overlaps another shift"]
+
+    validated = validator.validate(_requests((7, "1002", 6)))
+    assert validated["ok"].tolist() == [True]
+    assert validator.approved_moves(validated) == {7: ("1003", "1002"), 6: ("1002", "1003")}
@@ -0,0 +1,74 @@
+# tests/test_timeline.py
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from tournament.enrich import shift_window
+from tournament.timeline import BREAK_COLUMN, demand_timeline, parse_dinner_breaks, shift_peaks
+
+
+def _events(*rows):
+    """(date, "HH:MM", dealers, dinner break text) -> the enriched columns the timeline reads."""
+    frame = pd.DataFrame(rows, columns=["date", "time", "dealer_projection", BREAK_COLUMN])
+    frame["date"] = pd.to_datetime(frame["date"])
+    frame["time"] = [datetime.time(*map(int, t.split(":"))) if t else None for t in frame["time"]]
+    return frame
+
+
+def test_parse_dinner_breaks():
+    breaks = parse_dinner_breaks(pd.Series([
+        "75-min dinner break level 16 (≈ 7:00 p.m.)",
+        "60 min Dinner Break after Level 10 (~ 12:30 AM)",
+        "Dinner Break TBD",
+        None,
+    ]))
+    assert breaks["break_minutes"].tolist()[:2] == [75, 60]
+    assert breaks["break_start"].tolist()[:2] == [19 * 60, 30]
+    assert breaks.iloc[2:].isna().all().all()
+
+
+def test_timeline_adds_events_and_takes_out_breaks():
+    timeline = demand_timeline(_events(
+        ("2026-06-10", "12:00", 40, "60-min dinner break (6:00 p.m.)"),
+        ("2026-06-10", "14:00", 20, "Dinner Break TBD"),
+        ("2026-06-11", "", 30, None),  # TBD start: left out
+    ), duration_hours=4)
+    assert timeline.index.freqstr == "15min" and len(timeline) == 2 * 96
+    at = timeline.loc
+    assert at["2026-06-10 11:45"] == 0
+    assert at["2026-06-10 12:00"] == at["2026-06-10 13:45"] == 40
+    assert at["2026-06-10 14:00"] == at["2026-06-10 15:45"] == 60
+    assert at["2026-06-10 16:00"] == 20  # the noon event closed; its break (18:00) is after it ended
+    assert at["2026-06-10 18:00"] == 0
+    assert timeline["2026-06-11"].sum() == 0
+
+
+def test_late_event_runs_past_the_last_date():
+    timeline = demand_timeline(_events(("2026-06-10", "20:00", 10, None)))
+    assert timeline.index[-1] == pd.Timestamp("2026-06-11 23:45")
+    assert timeline["2026-06-11 05:45"] == 10 and timeline["2026-06-11 06:00"] == 0
+
+
+def test_shift_peaks_with_a_break_across_the_shift_change():
+    # 07:00-17:00 with a dinner break 14:30-15:30 straddling the DAY/SWING boundary at 15:00
+    timeline = demand_timeline(_events(
+        ("2026-06-10", "07:00", 50, "60-min dinner break (2:30 p.m.)"),
+        ("2026-06-10", "15:15", 30, None),
+    ), duration_hours=10)
+    assert timeline["2026-06-10 14:30"] == 0
+    assert timeline["2026-06-10 15:15"] == 30
+    assert timeline["2026-06-10 15:30"] == 80
+
+    peaks = shift_peaks(timeline)
+    assert peaks.columns.tolist() == ["DAY", "SWING", "ALL"]
+    assert peaks.loc["2026-06-10"].tolist() == [50, 80, 80]
+    assert peaks.loc["2026-06-11"].tolist() == [0, 0, 30]  # the 15:15 event runs to 01:15, outside both shifts
+    assert shift_peaks(timeline.iloc[:0]).empty
+
+
+def test_shift_window_uses_shift_hours():
+    times = pd.Series([datetime.time(6, 59), datetime.time(7), datetime.time(14, 59), datetime.time(15),
+                       datetime.time(22, 30), datetime.time(23), None])
+    assert shift_window(times).tolist() == ["OTHER", "DAY", "DAY", "SWING", "SWING", "OTHER", "OTHER"]
+    assert np.isnan(parse_dinner_breaks(pd.Series(["75 min"]))["break_start"].iloc[0])
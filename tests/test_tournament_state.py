@@ -0,0 +1,41 @@
+# tests/test_tournament_state.py
+import pandas as pd
+import pytest
+
+from roster_db import TOURNAMENT_FIELDS
+from tournament import state
+from tournament.rollup import DealerRollup
+
+
+@pytest.fixture
+def schedule_db(db, monkeypatch):
+    schedule = pd.DataFrame({field: [None] * 3 for field in TOURNAMENT_FIELDS})
+    schedule["Date"] = ["2026-06-10", "2026-06-10", "2026-06-11"]
+    schedule["Time"] = ["11:00", "16:00", "12:00"]
+    schedule["Event Number"] = ["1", "2", "3"]
+    schedule["Event Name"] = ["No-Limit Hold'em", "H.O.R.S.E.", "Seniors No-Limit Hold'em"]
+    schedule["Projection"] = [900, 300, 1800]
+    db.replace_tournaments(schedule)
+    monkeypatch.setattr(state, "get_roster_db", lambda: db)
+    return db
+
+
+def test_saved_projections_replace_the_memoized_frames(schedule_db):
+    held = state.get_enriched_tournaments()
+    held_rollup = state.get_rollup()
+    row_id = held.index[0]
+    held_total = held_rollup.total("2026-06-10", "2026-06-11")
+
+    updated = state.apply_projection_edits({row_id: 1800})
+
+    enriched = state.get_enriched_tournaments()
+    assert enriched is not held
+    assert updated.loc[row_id, "dealer_projection"] == enriched.loc[row_id, "dealer_projection"] == 240
+    assert enriched.loc[row_id, "projection"] == 1800
+    # What another session already held is untouched
+    assert held.loc[row_id, "projection"] == 900
+    assert held_rollup.total("2026-06-10", "2026-06-11") == held_total
+    assert state.get_tournament_df().loc[row_id, "Projection"] == 1800
+
+    fresh = DealerRollup(enriched)
+    assert state.get_rollup().total("2026-06-10", "2026-06-11") == fresh.total("2026-06-10", "2026-06-11")
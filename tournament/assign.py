@@ -0,0 +1,132 @@
+# tournament/assign.py
+import numpy as np
+import pandas as pd
+
+from dealer.roster import RosterTimeline
+from dealer.schema import weekday_bits
+from tournament.enrich import OTHER_WINDOW, SHIFT_HOURS
+
+# ---- STAFFING RULES ----
+# Weekly hour targets by employment type; a dealer is never scheduled past theirs.
+# Dealers with no FT/PT value get the part-time target.
+HOURS_PER_SHIFT = 8
+WEEKLY_HOURS = {"FULL TIME": 40, "PART TIME": 24}
+
+# Which dealer_group values can deal each game_type
+GROUPS_FOR_GAME = {"Hold'em": ["ANY", "LIVE", "HOLDEM"], "Mixed": ["ANY", "LIVE"]}
+
+ASSIGNMENT_COLUMNS = [
+    "date", "event_row", "event_number", "event_name", "game_type", "shift_window",
+    "ee_number", "first_name", "last_name", "dealer_group", "ft_pt"
+]
+
+
+def _eligibility(dealers, events, roster):
+    """Boolean matrices the solver ANDs together instead of testing dealers one by one.
+
+    Returns (by_day, by_window, by_game, day_index): by_day is days x dealers
+    (weekday availability and on the roster that date), by_window/by_game map
+    each shift window / game type to a dealer-length mask.
+    """
+    days = pd.DatetimeIndex(events["date"].dt.normalize().unique()).sort_values()
+    mask = dealers["avail_mask"].to_numpy(dtype=np.uint8)
+    available = (mask[None, :] & weekday_bits(days)[:, None]) != 0
+    by_day = available & roster.active_matrix(days)
+
+    shift = dealers["shift_type"].astype(object).to_numpy()
+    unknown_shift = pd.isna(shift)
+    by_window = {window: (shift == window) | unknown_shift for window in SHIFT_HOURS}
+    # Events outside both windows (late starts, no time) can take either shift
+    by_window[OTHER_WINDOW] = np.ones(len(dealers), dtype=bool)
+
+    group = dealers["dealer_group"].astype(object).to_numpy()
+    by_game = {game: np.isin(group, groups) for game, groups in GROUPS_FOR_GAME.items()}
+
+    return by_day, by_window, by_game, {day: i for i, day in enumerate(days)}
+
+
+def assign_dealers(dealers, events, demand_col="dealer_projection", roster=None):
+    """Staff each event in `events` (enriched schedule rows) from the `dealers` roster.
+
+    A dealer works at most one event per day and only where they are available
+    that weekday, not yet removed, on a matching shift (DAY/SWING by the event's
+    start window) and group (mixed games need LIVE/ANY dealers), and below their
+    FT/PT weekly hour target. Each day, the most constrained events are staffed
+    first (mixed before hold'em, fixed windows before OTHER, larger first), and
+    each event takes the eligible dealers who are furthest below their target
+    for that ISO week, ties going to roster order.
+
+    Returns (assignments, unfilled): one row per dealer placed (ASSIGNMENT_COLUMNS)
+    and one row per event that could not be fully staffed with its demand,
+    assigned and unfilled counts. `roster` is a RosterTimeline over `dealers`
+    (dealer.state.get_roster_timeline() for the shared store); one is built
+    when it isn't passed.
+    """
+    dealers = dealers.reset_index(drop=True)
+    roster = roster if roster is not None else RosterTimeline(dealers)
+    events = events[events["date"].notna()]
+    demand = pd.to_numeric(events[demand_col], errors="coerce").fillna(0).round().astype(int)
+    events = events.assign(demand=demand.clip(lower=0))
+    events = events[events["demand"] > 0]
+
+    by_day, by_window, by_game, day_index = _eligibility(dealers, events, roster)
+
+    target = dealers["ft_pt"].astype(object).map(WEEKLY_HOURS).fillna(WEEKLY_HOURS["PART TIME"])
+    target = target.to_numpy(dtype=float)
+    max_shifts = (target // HOURS_PER_SHIFT).astype(int)
+
+    order = events.assign(
+        _day=events["date"].dt.normalize(),
+        _holdem=events["game_type"] != "Mixed",
+        _other=events["shift_window"] == OTHER_WINDOW,
+    ).sort_values(["_day", "_holdem", "_other", "demand"], ascending=[True, True, True, False], kind="stable")
+
+    placed_event, placed_dealer, shortfalls = [], [], []
+    week_shifts = np.zeros(len(dealers), dtype=int)
+    current_week = None
+    for day, day_events in order.groupby("_day", sort=False):
+        week = tuple(day.isocalendar()[:2])
+        if week != current_week:
+            current_week = week
+            week_shifts[:] = 0
+        free = by_day[day_index[day]] & (week_shifts < max_shifts)
+
+        for row, window, game, need in zip(
+            day_events.index, day_events["shift_window"], day_events["game_type"], day_events["demand"]
+        ):
+            eligible = free & by_window.get(window, by_window[OTHER_WINDOW]) & by_game.get(game, by_game["Mixed"])
+            candidates = np.flatnonzero(eligible)
+            if len(candidates) > need:
+                load = week_shifts[candidates] * HOURS_PER_SHIFT / target[candidates]
+                candidates = candidates[np.argsort(load, kind="stable")[:need]]
+            free[candidates] = False
+            week_shifts[candidates] += 1
+            placed_event.extend([row] * len(candidates))
+            placed_dealer.extend(candidates.tolist())
+            if len(candidates) < need:
+                shortfalls.append((row, len(candidates)))
+
+    return _assignment_table(dealers, events, placed_event, placed_dealer), _unfilled_table(events, shortfalls)
+
+
+def _assignment_table(dealers, events, placed_event, placed_dealer):
+    if not placed_event:
+        return pd.DataFrame(columns=ASSIGNMENT_COLUMNS)
+    event_rows = events.loc[placed_event, ["date", "event_number", "event_name", "game_type", "shift_window"]]
+    dealer_rows = dealers.loc[placed_dealer, ["ee_number", "first_name", "last_name", "dealer_group", "ft_pt"]]
+    out = pd.concat(
+        [event_rows.reset_index(names="event_row"), dealer_rows.reset_index(drop=True)],
+        axis=1
+    )
+    return out[ASSIGNMENT_COLUMNS].sort_values(["date", "event_row"], kind="stable").reset_index(drop=True)
+
+
+def _unfilled_table(events, shortfalls):
+    columns = ["date", "event_number", "event_name", "game_type", "shift_window", "demand", "assigned", "unfilled"]
+    if not shortfalls:
+        return pd.DataFrame(columns=columns)
+    rows, got = zip(*shortfalls)
+    out = events.loc[list(rows), columns[:6]].copy()
+    out["assigned"] = list(got)
+    out["unfilled"] = out["demand"] - out["assigned"]
+    return out.sort_values(["date", "event_number"], kind="stable")
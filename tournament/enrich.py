@@ -0,0 +1,135 @@
+# tournament/enrich.py
+import re
+
+import numpy as np
+import pandas as pd
+
+# Tournament schedule upload layout the importer requires
+TOURNAMENT_COLUMNS = [
+    "Date", "Time", "Event Number", "Event Name",
+    "Buy-in Amount", "Starting Chips", "Projection", "Longest Break (Dinner Break)"
+]
+
+# Event names containing any of these are dealt by LIVE/ANY dealers, not HOLDEM
+MIXED_TAGS = [
+    "mixed", "razz", "stud", "plo", "omaha", "horse", "big o", "draw",
+    "badugi", "limit", "triple", "dealer's choice", "eight game", "seven card"
+]
+_MIXED_PATTERN = "|".join(re.escape(tag) for tag in MIXED_TAGS)
+# "limit" is for fixed-limit games; No-Limit Hold'em is removed before matching
+NO_LIMIT_PATTERN = r"no[\s-]*limit"
+
+# Players per table -> dealers needed, plus relief dealers, rounded up to the next 10
+DEALER_RELIEF_FACTOR = 1.175
+DEALER_ROUNDING = 10
+
+# Hours of the day (start inclusive, end exclusive) each dealer shift covers.
+# An event's dealers come from the shift its start time falls in.
+SHIFT_HOURS = {"DAY": (7, 15), "SWING": (15, 23)}
+OTHER_WINDOW = "OTHER"
+
+
+def normalize_columns(df):
+    """Upload headers ("Event Number") -> snake_case ("event_number")."""
+    df = df.copy()
+    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+    return df
+
+
+def parse_dates(series):
+    # Excel serial numbers when the sheet wasn't read as dates; text dates from CSV
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_datetime(series, unit="D", origin="1899-12-30")
+    return pd.to_datetime(series, errors="coerce", format="mixed").astype("datetime64[ns]")
+
+
+def parse_times(series):
+    """Mixed time cells (time objects, "12:00:00", "TBD") -> datetime.time or None."""
+    parsed = pd.to_datetime(series.astype(str), errors="coerce", format="mixed")
+    times = parsed.dt.time.astype(object)
+    return times.where(parsed.notna(), None)
+
+
+def shift_window(times):
+    """Start times -> "DAY"/"SWING" by SHIFT_HOURS, "OTHER" when outside both or unknown."""
+    hours = pd.to_datetime(times.astype(str), format="%H:%M:%S", errors="coerce").dt.hour
+    conditions = [((hours >= low) & (hours < high)).to_numpy() for low, high in SHIFT_HOURS.values()]
+    return pd.Series(np.select(conditions, list(SHIFT_HOURS), default=OTHER_WINDOW), index=times.index)
+
+
+def classify_game(event_name):
+    lowered = event_name.astype(str).str.lower().str.replace(NO_LIMIT_PATTERN, "", regex=True)
+    return pd.Series(
+        np.where(lowered.str.contains(_MIXED_PATTERN, regex=True), "Mixed", "Hold'em"),
+        index=event_name.index
+    )
+
+
+def detect_handedness(event_name, game_type):
+    lowered = event_name.astype(str).str.lower()
+    six = lowered.str.contains("6-handed", regex=False) | lowered.str.contains("6 max", regex=False)
+    eight = lowered.str.contains("8-handed", regex=False) | lowered.str.contains("8 max", regex=False)
+    mixed = (game_type == "Mixed").to_numpy()
+    triple_draw = lowered.str.contains("triple draw", regex=False)
+    return pd.Series(
+        np.select(
+            [six, eight, mixed & triple_draw, mixed],
+            [6, 8, 6, 8],
+            default=9
+        ),
+        index=event_name.index
+    )
+
+
+def forecast_dealers(projection, handedness):
+    """Dealers needed per event; NaN where the projection is missing."""
+    projection = pd.to_numeric(projection, errors="coerce").to_numpy(dtype=float)
+    handedness = np.asarray(handedness, dtype=float)
+    estimate = projection / handedness * DEALER_RELIEF_FACTOR
+    return np.ceil(estimate / DEALER_ROUNDING) * DEALER_ROUNDING
+
+
+def base_event(event_number):
+    """Leading digits of the event number ("58-D2" -> "58", "1A" -> "1"), else the stripped value."""
+    stripped = event_number.astype(str).str.strip()
+    return stripped.str.extract(r"^(\d+)", expand=False).fillna(stripped)
+
+
+def flag_restarts(event_base):
+    """Events whose base number appears on more than one row (flights and Day 2+)."""
+    counts = event_base.map(event_base.value_counts())
+    return counts > 1
+
+
+def enrich_tournaments(raw):
+    """Upload-layout schedule -> snake_case frame with every derived forecasting column.
+
+    Adds shift_window, game_type, handedness, dealer_projection, event_number_str,
+    event_base, is_restart and ISO week. Pure pandas/NumPy; safe to call outside Streamlit.
+    """
+    df = normalize_columns(raw)
+    df["date"] = parse_dates(df["date"])
+    df["time"] = parse_times(df["time"])
+    df["shift_window"] = shift_window(df["time"])
+    df["projection"] = pd.to_numeric(df["projection"], errors="coerce")
+
+    df["game_type"] = classify_game(df["event_name"])
+    df["handedness"] = detect_handedness(df["event_name"], df["game_type"])
+    df["dealer_projection"] = forecast_dealers(df["projection"], df["handedness"])
+
+    df["event_number_str"] = df["event_number"].astype(str).str.strip()
+    df["event_base"] = base_event(df["event_number_str"])
+    df["is_restart"] = flag_restarts(df["event_base"])
+    df["week"] = df["date"].dt.isocalendar().week
+    return df
+
+
+def projection_changes(before, after):
+    """{row: new projection} for rows whose projection differs between two frames (NaN-aware)."""
+    shared = before.index.intersection(after.index)
+    old = pd.to_numeric(before.loc[shared, "projection"], errors="coerce")
+    new = pd.to_numeric(after.loc[shared, "projection"], errors="coerce")
+    changed = ~((old == new) | (old.isna() & new.isna()))
+    return new[changed].to_dict()
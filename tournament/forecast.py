@@ -1,11 +1,41 @@
+# tournament/forecast.py
 import streamlit as st
 
+from dealer.state import dealers_loaded, get_roster_timeline
+from tournament.reports import roster_forecast
+from tournament.state import get_rollup, tournaments_loaded
+
+
 def show_forecasting():
     st.title("♠️ Tournament Forecasting")
-    st.markdown("""
-    This page will eventually include:
-    - 📊 Dealer forecasting based on tournament size
-    - 🔁 Historical pattern analysis
-    - 🧮 Shift load estimation + profitability modeling
-    """)
-    st.info("Forecasting stub is wired and ready for buildout!")
\ No newline at end of file
+
+    if not tournaments_loaded() or not dealers_loaded():
+        st.error("Tournament data and the dealer list are both needed. Please import them on the import page.")
+        return
+
+    rollup = get_rollup()
+    if not rollup.days:
+        st.warning("The tournament schedule has no dated events.")
+        return
+
+    forecast = roster_forecast(rollup, get_roster_timeline())
+    # dealers_per_roster is NaN on days nobody is on the roster (all of them if everyone was removed)
+    ratio = forecast["dealers_per_roster"].dropna()
+    busiest = forecast.loc[ratio.idxmax()] if forecast["dealers"].any() and len(ratio) else None
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Peak Forecast Dealers", int(round(forecast["dealers"].max())))
+    col2.metric("Roster at Series End", int(forecast["roster"].iloc[-1]),
+                delta=-int(forecast["roster"].iloc[0] - forecast["roster"].iloc[-1]) or None)
+    col3.metric("Tightest Day", busiest["date"].strftime("%b %d") if busiest is not None else "—")
+
+    st.line_chart(forecast.set_index("date")[["dealers", "roster"]])
+
+    drops = forecast[forecast["removed"] > 0]
+    if not drops.empty:
+        st.caption("Roster changes from scheduled removals during the series:")
+        st.dataframe(drops.assign(date=drops["date"].dt.date)[["date", "removed", "roster"]], hide_index=True,
+                     use_container_width=True)
+
+    with st.expander("📋 Daily Forecast"):
+        st.dataframe(forecast.assign(date=forecast["date"].dt.date), hide_index=True, use_container_width=True)
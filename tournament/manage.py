@@ -1,83 +1,31 @@
 import streamlit as st
 import pandas as pd
-import math
 import datetime
-import re
+
+from dealer.state import dealers_loaded, get_dealer_store, get_roster_timeline
+from tournament.assign import assign_dealers
+from tournament.enrich import projection_changes
+from tournament.state import apply_projection_edits, get_enriched_tournaments, get_rollup, tournaments_loaded
 
 def show_tournament_manage():
     st.title("🃏 Tournament Management")
 
-    if "tournament_df" not in st.session_state or st.session_state.tournament_df is None:
+    if not tournaments_loaded():
         st.error("Tournament data not loaded. Please import it on the import page.")
         return
 
-    df = st.session_state.tournament_df.copy()
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
-
-    if df["date"].dtype != "datetime64[ns]":
-        df["date"] = pd.to_datetime(df["date"], unit="D", origin="1899-12-30")
-
-    def safe_parse_time(val):
-        try:
-            return pd.to_datetime(str(val), errors="coerce").time()
-        except:
-            return None
-
-    df["time"] = df["time"].apply(safe_parse_time)
-    df["projection"] = pd.to_numeric(df["projection"], errors="coerce")
-
-    def classify_game(name):
-        name = str(name).lower()
-        mixed_tags = [
-            "mixed", "razz", "stud", "plo", "omaha", "horse", "big o", "draw",
-            "badugi", "limit", "triple", "dealer's choice", "eight game", "seven card"
-        ]
-        if any(tag in name for tag in mixed_tags):
-            return "Mixed"
-        return "Hold'em"
-
-    df["game_type"] = df["event_name"].apply(classify_game)
-
-    def detect_handedness(row):
-        name = str(row["event_name"]).lower()
-        if "6-handed" in name or "6 max" in name:
-            return 6
-        if "8-handed" in name or "8 max" in name:
-            return 8
-        if row["game_type"] == "Mixed":
-            if "triple draw" in name:
-                return 6
-            return 8
-        return 9
-
-    df["handedness"] = df.apply(detect_handedness, axis=1)
-
-    def forecast_dealers(projection, handedness):
-        if pd.isnull(projection) or pd.isnull(handedness):
-            return None
-        est = projection / handedness * 1.175
-        return int(math.ceil(est / 10) * 10)
-
-    df["dealer_projection"] = df.apply(
-        lambda row: forecast_dealers(row["projection"], row["handedness"]),
-        axis=1
-    )
-
-    df["event_number_str"] = df["event_number"].astype(str).str.strip()
-
-    def base_event(ev):
-        match = re.match(r"(\d+)", str(ev).strip())
-        return match.group(1) if match else str(ev).strip()
-
-    df["event_base"] = df["event_number_str"].apply(base_event)
-    base_counts = df["event_base"].value_counts()
-    df["is_restart"] = df["event_base"].apply(lambda x: base_counts.get(x, 0) > 1)
-
-    tab1, tab2 = st.tabs(["🔵 Single-Day Events", "↻ Restart Events"])
+    # Memoized on the tournaments data version; read-only (saves replace it)
+    df = get_enriched_tournaments()
+
+    tab1, tab2, tab3 = st.tabs(["🔵 Single-Day Events", "↻ Restart Events", "👥 Dealer Assignments"])
 
     def editable_table_view(dataframe, editable_cols, key_prefix):
         edit_mode = st.toggle("Edit Projections", key=f"{key_prefix}_edit_toggle")
 
+        saved = st.session_state.pop(f"{key_prefix}_saved", None)
+        if saved:
+            st.success(f"Updated {saved} projection(s) and dealer estimates.")
+
         if edit_mode:
             edited_df = st.data_editor(
                 dataframe[editable_cols],
@@ -90,23 +38,25 @@ def show_tournament_manage():
                     "buy-in_amount": st.column_config.NumberColumn(disabled=True),
                     "game_type": st.column_config.TextColumn(disabled=True)
                 },
-                num_rows="dynamic",
+                num_rows="fixed",
                 use_container_width=True,
                 key=f"editor_{key_prefix}"
             )
 
-            if st.button("Save and Recalculate - Press Twice To View Results", key=f"save_btn_{key_prefix}"):
-                dataframe.loc[edited_df.index, "projection"] = edited_df["projection"]
-                dataframe["projection"] = pd.to_numeric(dataframe["projection"], errors="coerce")
-                dataframe["dealer_projection"] = dataframe.apply(
-                    lambda row: forecast_dealers(row["projection"], row["handedness"]), axis=1
-                )
-                st.success("Updated projections and dealer estimates.")
+            if st.button("Save and Recalculate", key=f"save_btn_{key_prefix}"):
+                # Only rows whose projection actually changed are written and recomputed
+                changes = projection_changes(dataframe, edited_df)
+                if changes:
+                    apply_projection_edits(changes)
+                    # Rerun so the editor is rebuilt from the saved values
+                    st.session_state.pop(f"editor_{key_prefix}", None)
+                    st.session_state[f"{key_prefix}_saved"] = len(changes)
+                    st.rerun()
+                else:
+                    st.info("No projection changes to save.")
         else:
             st.dataframe(dataframe[editable_cols], use_container_width=True)
 
-        return dataframe
-
     with tab1:
         single_df = df[df["is_restart"] == False]
         available_dates = sorted(single_df["date"].dt.date.dropna().unique())
@@ -128,20 +78,19 @@ def show_tournament_manage():
                 "projection", "dealer_projection", "game_type"
             ]
 
-            day_df = editable_table_view(day_df, editable_cols, f"single_{selected_day}")
-            df.update(day_df)
+            editable_table_view(day_df, editable_cols, f"single_{selected_day}")
 
             st.markdown("### 7-Day Regular Dealer Projection Summary")
-            summary_days = [selected_day + datetime.timedelta(days=i) for i in range(7)]
-            summary_data = []
-            for day in summary_days:
-                events = df[(df["is_restart"] == False) & (df["date"].dt.date == day)]
-                total = events["dealer_projection"].sum(skipna=True)
-                summary_data.append({
-                    "Date": day.strftime("%Y-%m-%d"),
-                    "Regular Dealers": int(total) if pd.notnull(total) else 0
-                })
-            st.dataframe(pd.DataFrame(summary_data), use_container_width=True)
+            # Rollup lookup instead of one scan per day
+            rollup = get_rollup()
+            week_end = selected_day + datetime.timedelta(days=6)
+            summary = rollup.daily(selected_day, week_end, restart=False)
+            summary_data = pd.DataFrame({
+                "Date": summary.index.strftime("%Y-%m-%d"),
+                "Regular Dealers": summary["dealers"].round().astype(int).to_numpy()
+            })
+            st.caption(f"7-day total: {int(round(rollup.total(selected_day, week_end, restart=False)))}")
+            st.dataframe(summary_data, use_container_width=True)
         else:
             st.warning("No single-day tournament dates available.")
 
@@ -166,21 +115,51 @@ def show_tournament_manage():
                 "projection", "dealer_projection", "game_type"
             ]
 
-            day_df = editable_table_view(day_df, editable_cols, f"restart_{selected_day_restart}")
-            df.update(day_df)
+            editable_table_view(day_df, editable_cols, f"restart_{selected_day_restart}")
 
             st.markdown("### 7-Day Restart Dealer Projection Summary")
-            summary_days = [selected_day_restart + datetime.timedelta(days=i) for i in range(7)]
-            summary_data = []
-            for day in summary_days:
-                events = df[(df["is_restart"] == True) & (df["date"].dt.date == day)]
-                total = events["dealer_projection"].sum(skipna=True)
-                summary_data.append({
-                    "Date": day.strftime("%Y-%m-%d"),
-                    "Restart Dealers": int(total) if pd.notnull(total) else 0
-                })
-            st.dataframe(pd.DataFrame(summary_data), use_container_width=True)
+            # Rollup lookup instead of one scan per day
+            rollup = get_rollup()
+            week_end = selected_day_restart + datetime.timedelta(days=6)
+            summary = rollup.daily(selected_day_restart, week_end, restart=True)
+            summary_data = pd.DataFrame({
+                "Date": summary.index.strftime("%Y-%m-%d"),
+                "Restart Dealers": summary["dealers"].round().astype(int).to_numpy()
+            })
+            st.caption(f"7-day total: {int(round(rollup.total(selected_day_restart, week_end, restart=True)))}")
+            st.dataframe(summary_data, use_container_width=True)
         else:
             st.warning("No restart tournament dates available.")
 
-    st.session_state.tournament_df = df
+    with tab3:
+        st.caption(
+            "Staffs each day's events from the roster by availability, shift, dealer group, "
+            "removal date and FT/PT weekly hours."
+        )
+        if not dealers_loaded():
+            st.warning("Dealer list not loaded. Please upload it on the import page.")
+        else:
+            dates = df["date"].dropna()
+            col1, col2 = st.columns(2)
+            start = col1.date_input("From", value=dates.min().date(), key="assign_start")
+            end = col2.date_input("To", value=dates.max().date(), key="assign_end")
+
+            if st.button("Assign Dealers", key="assign_btn"):
+                in_range = df[(df["date"] >= pd.Timestamp(start)) & (df["date"] <= pd.Timestamp(end))]
+                assignments, unfilled = assign_dealers(get_dealer_store().df, in_range, roster=get_roster_timeline())
+
+                st.success(f"Placed {len(assignments)} dealer shift(s) across {in_range['date'].nunique()} day(s).")
+                st.dataframe(assignments, use_container_width=True)
+                st.download_button(
+                    "📥 Download Assignments",
+                    data=assignments.to_csv(index=False).encode("utf-8"),
+                    file_name="dealer_assignments.csv",
+                    mime="text/csv"
+                )
+
+                st.markdown("### Unfilled Demand")
+                if unfilled.empty:
+                    st.info("Every event is fully staffed.")
+                else:
+                    st.warning(f"{int(unfilled['unfilled'].sum())} dealer slot(s) unfilled across {len(unfilled)} event(s).")
+                    st.dataframe(unfilled, use_container_width=True)
@@ -0,0 +1,90 @@
+# tournament/reports.py
+import pandas as pd
+
+from scheduler.taper import apply_restart_taper, by_game_type
+
+# Columns of the restart-adjusted projection report
+RESTART_COLUMNS = [
+    "date", "event_number", "event_name", "game_type", "shift_window",
+    "dealer_projection", "taper_factor", "adjusted_dealer_projection",
+]
+
+
+def weekly_table(rollup, filters, value_label):
+    """Active days of a DealerRollup with their ISO week and rounded dealers (metrics page layout)."""
+    days = rollup.active_days(**filters)
+    return pd.DataFrame({
+        "Week": days.index.isocalendar().week.to_numpy(),
+        "Day": days.index.date,
+        value_label: days["dealers"].round().astype(int).to_numpy()
+    })
+
+
+def daily_forecast(rollup):
+    """Forecast dealers for every date of the schedule, split the ways the pages show it.
+
+    Columns: date, events, dealers, single_day, restart, day_shift, swing_shift,
+    other_window and mixed (dealers for mixed-game events).
+    """
+    if not rollup.days:
+        return pd.DataFrame(columns=["date", "events", "dealers"])
+    start = rollup.start
+    end = start + pd.Timedelta(days=rollup.days - 1)
+    total = rollup.daily(start, end)
+
+    def dealers(**filters):
+        return rollup.daily(start, end, **filters)["dealers"].to_numpy().round(2)
+
+    return pd.DataFrame({
+        "date": total.index,
+        "events": total["events"].to_numpy(),
+        "dealers": total["dealers"].to_numpy().round(2),
+        "single_day": dealers(restart=False),
+        "restart": dealers(restart=True),
+        "day_shift": dealers(window="DAY"),
+        "swing_shift": dealers(window="SWING"),
+        "other_window": dealers(window="OTHER"),
+        "mixed": dealers(game_type="Mixed"),
+    })
+
+
+def weekly_forecast(daily):
+    """daily_forecast() rolled up by ISO week (Monday start), with each week's peak day."""
+    if daily.empty:
+        return pd.DataFrame(columns=["week_start", "events", "dealers", "peak_day", "peak_dealers"])
+    week_start = daily["date"] - pd.to_timedelta(daily["date"].dt.dayofweek, unit="D")
+    by_week = daily.groupby(week_start)
+    sums = by_week[[col for col in daily.columns if col != "date"]].sum()
+    peak = daily.loc[by_week["dealers"].idxmax().to_numpy()]
+    sums.insert(1, "peak_day", peak["date"].to_numpy())
+    sums.insert(2, "peak_dealers", peak["dealers"].to_numpy())
+    return sums.rename_axis("week_start").reset_index()
+
+
+def restart_adjusted(df, curves=None):
+    """Restart flights with their taper factor and adjusted dealers (Mixed events use curves["mixed"])."""
+    tapered = apply_restart_taper(
+        df[df["is_restart"] == True],
+        curves=curves,
+        curve_for=by_game_type({"Mixed": "mixed"}) if curves and "mixed" in curves else None,
+    )
+    # apply_restart_taper scales dealer_projection in place; report the untapered figure
+    tapered["dealer_projection"] = df.loc[tapered.index, "dealer_projection"]
+    return tapered[RESTART_COLUMNS].reset_index(drop=True)
+
+
+def roster_forecast(rollup, roster):
+    """Forecast dealers vs active roster headcount for every date of the series.
+
+    Columns: date, dealers (forecast), events, roster (dealers on the roster
+    that date, so removals dated mid-series count from their own day),
+    removed (roster drop since the previous date) and dealers_per_roster.
+    """
+    start = rollup.start
+    end = start + pd.Timedelta(days=rollup.days - 1)
+    daily = rollup.daily(start, end).rename_axis("date").reset_index()
+    headcount = roster.counts(daily["date"]).to_numpy()
+    out = daily.assign(roster=headcount)
+    out["removed"] = (-out["roster"].diff()).fillna(0).astype(int)
+    out["dealers_per_roster"] = (out["dealers"] / out["roster"].where(out["roster"] > 0)).round(3)
+    return out
@@ -0,0 +1,127 @@
+# tournament/rollup.py
+import numpy as np
+import pandas as pd
+
+from tournament.enrich import OTHER_WINDOW, SHIFT_HOURS
+
+# Cube axes after the date axis
+RESTART_KEYS = [False, True]
+GAME_TYPES = ["Hold'em", "Mixed"]
+WINDOWS = list(SHIFT_HOURS) + [OTHER_WINDOW]
+
+ROLLUP_COLUMNS = ["date", "is_restart", "game_type", "shift_window"]
+
+
+class DealerRollup:
+    """Per-day dealer totals keyed by (date, is_restart, game_type, shift_window).
+
+    Built once from the enriched schedule into a dense day x restart x game x
+    window array of dealer sums and event counts. Single days are direct slices;
+    week/month/arbitrary ranges come from a cumulative sum along the date axis,
+    so a calendar or summary never rescans the schedule. update() applies the
+    before/after difference of edited rows and drops the cumulative sum, which is
+    rebuilt on the next range lookup.
+
+    Filters (restart, game_type, window) take a single value, a list, or None for all.
+    """
+
+    def __init__(self, df, value_col="dealer_projection"):
+        self.value_col = value_col
+        dated = df[df["date"].notna()]
+        if len(dated):
+            self.start = dated["date"].min().normalize()
+            end = dated["date"].max().normalize()
+            self.days = (end - self.start).days + 1
+        else:
+            self.start = pd.Timestamp("today").normalize()
+            self.days = 0
+
+        shape = (self.days, len(RESTART_KEYS), len(GAME_TYPES), len(WINDOWS))
+        self._values = np.zeros(shape, dtype=float)
+        self._counts = np.zeros(shape, dtype=np.int64)
+        self._prefix = None
+        self._add(dated, sign=1)
+
+    # ---- building ----
+    def _coords(self, rows):
+        day = (rows["date"].dt.normalize() - self.start).dt.days.to_numpy()
+        restart = rows["is_restart"].astype(bool).to_numpy().astype(int)
+        game = pd.Categorical(rows["game_type"], categories=GAME_TYPES).codes
+        window = pd.Categorical(rows["shift_window"], categories=WINDOWS).codes
+        return day, restart, game, window
+
+    def _add(self, rows, sign):
+        if not len(rows):
+            return
+        coords = self._coords(rows)
+        values = pd.to_numeric(rows[self.value_col], errors="coerce").fillna(0).to_numpy(dtype=float)
+        np.add.at(self._values, coords, sign * values)
+        np.add.at(self._counts, coords, sign)
+        self._prefix = None
+
+    def update(self, before, after):
+        """Swap the contribution of edited rows: `before`/`after` hold the same rows pre/post edit."""
+        self._add(before[before["date"].notna()], sign=-1)
+        self._add(after[after["date"].notna()], sign=1)
+
+    # ---- lookups ----
+    def _select(self, restart=None, game_type=None, window=None):
+        def axis(keys, wanted):
+            if wanted is None:
+                return slice(None)
+            wanted = wanted if isinstance(wanted, (list, tuple)) else [wanted]
+            return [keys.index(w) for w in wanted]
+        return axis(RESTART_KEYS, restart), axis(GAME_TYPES, game_type), axis(WINDOWS, window)
+
+    def _reduce(self, cube, restart=None, game_type=None, window=None):
+        r, g, w = self._select(restart, game_type, window)
+        # Index one axis at a time so list selections don't broadcast together
+        return cube[:, r][:, :, g][:, :, :, w].sum(axis=(1, 2, 3))
+
+    def _positions(self, start, end):
+        first = max((pd.Timestamp(start).normalize() - self.start).days, 0)
+        last = min((pd.Timestamp(end).normalize() - self.start).days, self.days - 1)
+        return first, last
+
+    def _cumulative(self):
+        if self._prefix is None:
+            zeros = np.zeros((1,) + self._values.shape[1:])
+            self._prefix = (
+                np.concatenate([zeros, self._values.cumsum(axis=0)]),
+                np.concatenate([zeros, self._counts.cumsum(axis=0)]),
+            )
+        return self._prefix
+
+    def total(self, start, end, **filters):
+        """Dealer total for start..end inclusive."""
+        first, last = self._positions(start, end)
+        if first > last:
+            return 0.0
+        prefix, _ = self._cumulative()
+        return float(self._reduce(prefix[last + 1][None] - prefix[first][None], **filters)[0])
+
+    def event_count(self, start, end, **filters):
+        first, last = self._positions(start, end)
+        if first > last:
+            return 0
+        _, prefix = self._cumulative()
+        return int(self._reduce(prefix[last + 1][None] - prefix[first][None], **filters)[0])
+
+    def daily(self, start, end, **filters):
+        """DataFrame indexed by every date in start..end with dealers and events per day."""
+        dates = pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), freq="D")
+        dealers = np.zeros(len(dates))
+        events = np.zeros(len(dates), dtype=np.int64)
+        first, last = self._positions(start, end)
+        if first <= last:
+            offset = (self.start + pd.Timedelta(days=first) - dates[0]).days
+            dealers[offset:offset + last - first + 1] = self._reduce(self._values[first:last + 1], **filters)
+            events[offset:offset + last - first + 1] = self._reduce(self._counts[first:last + 1], **filters)
+        return pd.DataFrame({"dealers": dealers, "events": events}, index=dates)
+
+    def active_days(self, **filters):
+        """daily() over the whole schedule, limited to days that have matching events."""
+        if not self.days:
+            return self.daily(self.start, self.start - pd.Timedelta(days=1))
+        days = self.daily(self.start, self.start + pd.Timedelta(days=self.days - 1), **filters)
+        return days[days["events"] > 0]
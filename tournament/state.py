@@ -0,0 +1,149 @@
+# tournament/state.py
+import copy
+import threading
+
+import pandas as pd
+
+from diagnostics import register_cache, section
+from roster_db import get_roster_db
+from tournament.enrich import enrich_tournaments, forecast_dealers
+from tournament.rollup import ROLLUP_COLUMNS, DealerRollup
+from tournament.timeline import demand_timeline
+
+_SHARED = register_cache("tournament.state._SHARED", {})
+_ENRICHED = register_cache("tournament.state._ENRICHED", {})
+_ROLLUP = register_cache("tournament.state._ROLLUP", {})
+_TIMELINE = register_cache("tournament.state._TIMELINE", {})
+_LOCK = threading.Lock()
+
+
+def get_tournament_df():
+    """Process-wide tournament schedule (upload layout, indexed by row_id).
+
+    Shared by every session and reloaded from the roster database only when its
+    tournaments version changes. Callers must copy before modifying.
+    """
+    db = get_roster_db()
+    with _LOCK:
+        version = db.version("tournaments")
+        cached = _SHARED.get(db.path)
+        if cached is None or cached[0] != version:
+            with section("load"):
+                cached = (version, db.load_tournaments())
+            _SHARED[db.path] = cached
+    return cached[1]
+
+
+def get_enriched_tournaments():
+    """Derived forecasting frame (tournament.enrich) memoized on the data version.
+
+    The version only moves when a schedule is imported or projections are saved,
+    so tab switches and date pickers reuse the same frame. Treat it as read-only.
+    """
+    db = get_roster_db()
+    with _LOCK:
+        version = db.version("tournaments")
+        cached = _ENRICHED.get(db.path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    df = get_tournament_df()
+    with section("enrich"):
+        enriched = enrich_tournaments(df)
+    with _LOCK:
+        _ENRICHED[db.path] = (version, enriched)
+    return enriched
+
+
+def get_rollup():
+    """DealerRollup of dealer_projection, memoized with the enriched frame it was built from."""
+    db = get_roster_db()
+    df = get_enriched_tournaments()
+    with _LOCK:
+        cached = _ROLLUP.get(db.path)
+        if cached is not None and cached[0] is df:
+            return cached[1]
+    with section("aggregate"):
+        rollup = DealerRollup(df)
+    with _LOCK:
+        _ROLLUP[db.path] = (df, rollup)
+    return rollup
+
+
+def get_demand_timeline():
+    """15-minute dealer demand curve for the whole schedule, memoized on the data version."""
+    db = get_roster_db()
+    with _LOCK:
+        version = db.version("tournaments")
+        cached = _TIMELINE.get(db.path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    df = get_enriched_tournaments()
+    with section("aggregate"):
+        timeline = demand_timeline(df)
+    with _LOCK:
+        _TIMELINE[db.path] = (version, timeline)
+    return timeline
+
+
+def apply_projection_edits(changes):
+    """Persist edited projections and recompute only the edited rows.
+
+    `changes` is {row_id: projection}. The memoized raw and enriched frames are
+    replaced by copies with just those rows' projection and dealer_projection
+    rewritten, and the rollup by a copy adjusted by the rows' before/after
+    difference, so the next read sees the new numbers without a full rebuild.
+    The copies are shallow (pandas copy-on-write duplicates only the columns
+    written), and frames other sessions already hold are never modified.
+    Returns the updated rows of the enriched frame.
+    """
+    db = get_roster_db()
+    with _LOCK:
+        before = db.version("tournaments")
+        db.update_projections(changes)
+        after = db.version("tournaments")
+
+        enriched_cached = _ENRICHED.get(db.path)
+        if enriched_cached is None or enriched_cached[0] != before or after != before + 1:
+            # Someone else changed the schedule too; let the next read rebuild everything
+            _SHARED.pop(db.path, None)
+            _ENRICHED.pop(db.path, None)
+            _ROLLUP.pop(db.path, None)
+            patch = False
+        else:
+            patch = True
+
+    if not patch:
+        return get_enriched_tournaments().loc[list(changes)]
+
+    with _LOCK:
+        ids = pd.Index(list(changes))
+        values = pd.Series(changes, index=ids, dtype=float)
+
+        raw_cached = _SHARED.get(db.path)
+        if raw_cached is not None and raw_cached[0] == before:
+            raw = raw_cached[1].copy(deep=False)
+            raw.loc[ids, "Projection"] = values
+            _SHARED[db.path] = (after, raw)
+
+        enriched = enriched_cached[1].copy(deep=False)
+        columns = ROLLUP_COLUMNS + ["dealer_projection"]
+        old = enriched.loc[ids, columns].copy()
+        enriched.loc[ids, "projection"] = values
+        enriched.loc[ids, "dealer_projection"] = forecast_dealers(values, enriched.loc[ids, "handedness"])
+        _ENRICHED[db.path] = (after, enriched)
+
+        rollup_cached = _ROLLUP.get(db.path)
+        if rollup_cached is not None and rollup_cached[0] is enriched_cached[1]:
+            rollup = copy.deepcopy(rollup_cached[1])
+            rollup.update(old, enriched.loc[ids, columns])
+            _ROLLUP[db.path] = (enriched, rollup)
+
+        return enriched.loc[ids]
+
+
+def tournaments_version():
+    return get_roster_db().version("tournaments")
+
+
+def tournaments_loaded():
+    return get_roster_db().count("tournaments") > 0
@@ -0,0 +1,108 @@
+# tournament/timeline.py
+import re
+
+import numpy as np
+import pandas as pd
+
+from tournament.enrich import SHIFT_HOURS
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+# Tables stay open this long after the start unless a duration is passed in
+DEFAULT_EVENT_HOURS = 10
+
+BREAK_COLUMN = "longest_break_(dinner_break)"
+# "75-min dinner break level 16 (≈ 7:00 p.m.)"
+_BREAK_PATTERN = r"(?P<minutes>\d+)\s*-?\s*min.*?(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<ampm>[ap])\.?\s*m"
+
+
+def start_minutes(times):
+    """datetime.time values -> minutes after midnight (float, NaN when unknown/TBD)."""
+    parsed = pd.to_datetime(times.astype(str), format="%H:%M:%S", errors="coerce")
+    return (parsed.dt.hour * 60 + parsed.dt.minute).astype(float)
+
+
+def parse_dinner_breaks(text):
+    """Dinner break descriptions -> DataFrame of break length and clock start in minutes.
+
+    "Dinner Break TBD" and blanks give NaN, i.e. no break is taken out of the curve.
+    """
+    parts = text.astype(str).str.extract(_BREAK_PATTERN, flags=re.IGNORECASE)
+    hour = pd.to_numeric(parts["hour"], errors="coerce") % 12
+    hour = hour + np.where(parts["ampm"].str.lower() == "p", 12, 0)
+    return pd.DataFrame({
+        "break_minutes": pd.to_numeric(parts["minutes"], errors="coerce"),
+        "break_start": hour * 60 + pd.to_numeric(parts["minute"], errors="coerce"),
+    }, index=text.index)
+
+
+def demand_timeline(df, demand_col="dealer_projection", duration_hours=DEFAULT_EVENT_HOURS):
+    """Dealers needed on the floor per 15-minute slot across the whole schedule.
+
+    Each timed event adds its demand from its start for duration_hours (scalar or
+    per-row Series) and takes it back out for its dinner break. All events go
+    into one difference array (+demand at the open slot, -demand at the close
+    slot) and a single cumulative sum gives the curve. Untimed (TBD) events are
+    left out; see untimed_events(). Returns a Series on a 15-minute DatetimeIndex.
+    """
+    dated = df[df["date"].notna()]
+    if dated.empty:
+        return pd.Series(dtype=float, index=pd.DatetimeIndex([], freq=f"{SLOT_MINUTES}min"))
+    origin = dated["date"].min().normalize()
+
+    minutes = start_minutes(dated["time"])
+    demand = pd.to_numeric(dated[demand_col], errors="coerce")
+    timed = minutes.notna() & demand.notna() & (demand > 0)
+    events = dated[timed]
+    minutes = minutes[timed].to_numpy()
+    demand = demand[timed].to_numpy(dtype=float)
+
+    day_offset = (events["date"].dt.normalize() - origin).dt.days.to_numpy() * 24 * 60
+    start = day_offset + minutes
+    hours = duration_hours[timed].to_numpy(dtype=float) if isinstance(duration_hours, pd.Series) else duration_hours
+    end = start + np.asarray(hours, dtype=float) * 60
+
+    breaks = parse_dinner_breaks(events[BREAK_COLUMN]) if BREAK_COLUMN in events.columns else None
+    if breaks is not None:
+        break_start = day_offset + breaks["break_start"].to_numpy()
+        break_end = break_start + breaks["break_minutes"].to_numpy()
+        has_break = ~np.isnan(break_start) & ~np.isnan(break_end) & (break_start >= start) & (break_end <= end)
+    else:
+        has_break = np.zeros(len(events), dtype=bool)
+
+    def slot(values):
+        return np.floor(values / SLOT_MINUTES).astype(np.int64)
+
+    # Long or late events run past the last scheduled date
+    days = (dated["date"].max().normalize() - origin).days + 1
+    if len(events):
+        days = max(days, int(np.ceil(end.max() / (24 * 60))))
+    diff = np.zeros(days * SLOTS_PER_DAY + 1)
+    np.add.at(diff, slot(start), demand)
+    np.add.at(diff, slot(end), -demand)
+    np.add.at(diff, slot(break_start[has_break]), -demand[has_break])
+    np.add.at(diff, slot(break_end[has_break]), demand[has_break])
+
+    index = pd.date_range(origin, periods=days * SLOTS_PER_DAY, freq=f"{SLOT_MINUTES}min")
+    return pd.Series(diff.cumsum()[:-1].round(6), index=index)
+
+
+def untimed_events(df):
+    """Rows the timeline skips because their start time is TBD/unparseable."""
+    return df[df["date"].notna() & start_minutes(df["time"]).isna()]
+
+
+def shift_peaks(timeline):
+    """Peak concurrent dealers per date within each SHIFT_HOURS window, plus the whole day (ALL)."""
+    if timeline.empty:
+        return pd.DataFrame(columns=list(SHIFT_HOURS) + ["ALL"])
+    grid = timeline.to_numpy().reshape(-1, SLOTS_PER_DAY)
+    per_hour = 60 // SLOT_MINUTES
+    peaks = {
+        shift: grid[:, low * per_hour:high * per_hour].max(axis=1)
+        for shift, (low, high) in SHIFT_HOURS.items()
+    }
+    peaks["ALL"] = grid.max(axis=1)
+    dates = pd.date_range(timeline.index[0], periods=len(grid), freq="D")
+    return pd.DataFrame(peaks, index=dates)